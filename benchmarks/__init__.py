@@ -0,0 +1,2 @@
+"""Benchmarks for the helpers in :mod:`eda`. Run them from the repository root, e.g.
+``python -m benchmarks.bench_snapshots``."""
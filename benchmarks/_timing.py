@@ -0,0 +1,25 @@
+"""Wall-clock timing and memory readings shared by the benchmark scripts."""
+
+import time
+
+
+def best_of(func, repeat=1):
+    """Call ``func`` ``repeat`` times; return the fastest wall time and the last result."""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def status_kb(field):
+    """A ``/proc/self/status`` field such as ``VmRSS`` in KB; None off Linux."""
+    try:
+        with open("/proc/self/status") as fh:
+            for line in fh:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
@@ -0,0 +1,163 @@
+"""The wine cells run one by one versus answered from one :func:`eda.profile.profile` report.
+
+    python -m benchmarks.bench_profile [--scales 1 100 1000] [--repeat 3] [--cells]
+
+Next to the wall time it counts the column reads of both versions: each
+column of a copy of the frame lives in its own memory-mapped file, its pages
+are unmapped before every step, and after the step the resident share of
+each file is added up (Linux only). A column read in full counts 1, once per
+step however often the step goes over it; the kernel maps pages in blocks,
+so a step that touches a few rows of a column can count more than it read.
+``--cells`` prints the reads of every step.
+"""
+
+import argparse
+import io
+import mmap
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from eda.profile import profile
+
+from ._timing import best_of
+from .synthetic import WINE_ROWS, wine_frame
+
+
+def script_cells(df):
+    """The wine cells as the script runs them; each one reads the whole frame again."""
+    return [
+        ("describe()", lambda: df.describe()),
+        ('describe(include="int")', lambda: df.describe(include="int")),
+        ("isnull().sum()", lambda: df.isnull().sum()),
+        ("isna().mean()", lambda: df.isna().mean()),
+        ("info()", lambda: df.info(buf=io.StringIO())),
+        ("duplicated().sum()", lambda: df.duplicated().sum()),
+        ("df[df.duplicated()]", lambda: df[df.duplicated()]),
+        ("corr()", lambda: df.corr()),
+        ("heatmap corr()", lambda: df.corr()),
+        ('["quality"].value_counts()', lambda: df["quality"].value_counts()),
+        ('value_counts("quality")', lambda: df.value_counts("quality")),
+    ]
+
+
+def report_cells(df):
+    """The same cells answered from one report; only ``profile`` reads the frame."""
+    built = {}
+
+    def report():
+        return built["report"]
+
+    return [
+        ("profile(df)", lambda: built.update(report=profile(df))),
+        ("describe()", lambda: report().describe()),
+        ('describe(include="int")', lambda: report().describe(include="int")),
+        ("isnull_sum()", lambda: report().isnull_sum()),
+        ("isna_mean()", lambda: report().isna_mean()),
+        ("info()", lambda: report().info(buf=io.StringIO())),
+        ("duplicate_count", lambda: report().duplicate_count),
+        ("duplicate_rows()", lambda: report().duplicate_rows()),
+        ("corr()", lambda: report().corr()),
+        ("heatmap corr()", lambda: report().corr()),
+        ('value_counts("quality")', lambda: report().value_counts("quality")),
+        ('value_counts("quality") again', lambda: report().value_counts("quality")),
+    ]
+
+
+def run_cells(cells):
+    for _, cell in cells:
+        cell()
+
+
+# -- counting column reads --------------------------------------------------
+
+
+def mapped_frame(df, workdir):
+    """A copy of ``df`` whose columns are read-only maps of one file each."""
+    maps = {}
+    for i, name in enumerate(df.columns):
+        path = Path(workdir) / f"column-{i}.bin"
+        values = df[name].to_numpy()
+        values.tofile(path)
+        maps[name] = np.memmap(path, dtype=values.dtype, mode="r", shape=values.shape)
+    return pd.DataFrame(maps, index=df.index, copy=False), list(maps.values())
+
+
+def _resident_bytes():
+    """Resident bytes of every mapping of this process, by start address."""
+    resident, start = {}, None
+    with open("/proc/self/smaps") as fh:
+        for line in fh:
+            fields = line.split()
+            if fields[0] == "Rss:":
+                resident[start] = int(fields[1]) * 1024
+            elif not fields[0].endswith(":"):
+                start = int(fields[0].split("-")[0], 16)
+    return resident
+
+
+def column_reads(cell, maps):
+    """How many columns ``cell()`` reads, from the pages of ``maps`` it makes resident."""
+    for column in maps:
+        column._mmap.madvise(mmap.MADV_DONTNEED)
+    cell()
+    resident = _resident_bytes()
+    reads = 0.0
+    for column in maps:
+        mapped = -(-column.nbytes // mmap.PAGESIZE) * mmap.PAGESIZE
+        reads += min(resident.get(column.ctypes.data, 0) / mapped, 1.0)
+    return reads
+
+
+def count_reads(df, workdir):
+    """Column reads per step, ``{"before": {...}, "after": {...}}``, or None off Linux."""
+    if not hasattr(mmap, "MADV_DONTNEED") or not Path("/proc/self/smaps").exists():
+        return None
+    mapped, maps = mapped_frame(df, workdir)
+    counts = {}
+    for side, cells in (("before", script_cells(mapped)), ("after", report_cells(mapped))):
+        counts[side] = {name: column_reads(cell, maps) for name, cell in cells}
+    return counts
+
+
+def run(scales, repeat, workdir):
+    rows, steps = [], {}
+    for scale in scales:
+        df = wine_frame(WINE_ROWS * scale, raw_names=False)
+        before_s, _ = best_of(lambda: run_cells(script_cells(df)), repeat)
+        after_s, _ = best_of(lambda: run_cells(report_cells(df)), repeat)
+        reads = count_reads(df, workdir)
+        rows.append({
+            "scale": f"{scale}x",
+            "rows": len(df),
+            "reads_before": sum(reads["before"].values()) if reads else None,
+            "reads_after": sum(reads["after"].values()) if reads else None,
+            "before_s": before_s,
+            "after_s": after_s,
+            "speedup": before_s / after_s,
+        })
+        steps[f"{scale}x"] = reads
+    return pd.DataFrame(rows), steps
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--cells", action="store_true", help="print the column reads of every step")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        report, steps = run(args.scales, args.repeat, tmp)
+    print(report.to_string(index=False, float_format=lambda v: f"{v:.4f}"))
+    if args.cells:
+        for scale, reads in steps.items():
+            for side in ("before", "after") if reads else ():
+                print(f"\n{scale} {side}:")
+                print(pd.Series(reads[side], name="reads").to_string(float_format=lambda v: f"{v:.1f}"))
+
+
+if __name__ == "__main__":
+    main()
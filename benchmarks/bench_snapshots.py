@@ -0,0 +1,93 @@
+"""CSV parse + rename versus memory-mapped snapshot load for the wine table.
+
+    python -m benchmarks.bench_snapshots [--scales 1 100 1000] [--repeat 3]
+
+Besides the load time, each reader runs once more in a fresh process (so
+memory freed by earlier runs cannot be reused), its frame is summed so every
+column has been read, and two memory figures are taken (Linux only):
+
+* ``*_anon_mb``: growth of the process's anonymous memory (``RssAnon``),
+  i.e. what the frame itself holds in RAM;
+* ``*_rss_mb``: growth of the whole resident set (``VmRSS``). This also
+  counts the mapped snapshot pages that were read. Those stay in the page
+  cache and the kernel can drop them under memory pressure.
+
+``feather_copy`` is ``read_snapshot(path, copy=True)``, the writable frame.
+``feather_s`` only covers mapping the file; its pages are read on first use.
+"""
+
+import argparse
+import multiprocessing
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+from eda.loaders import WINE_RENAMES
+from eda.snapshots import read_snapshot, write_snapshot
+
+from ._timing import best_of, status_kb
+from .synthetic import WINE_ROWS, wine_frame
+
+
+def load(reader, path):
+    if reader == "csv":
+        return pd.read_csv(path, sep=";").rename(columns=WINE_RENAMES)
+    return read_snapshot(path, copy=reader == "feather_copy")
+
+
+def _memory_growth_mb(reader, path):
+    import pyarrow.feather, pyarrow.parquet  # noqa: F401  (imported before the baseline)
+
+    anon, rss = status_kb("RssAnon"), status_kb("VmRSS")
+    if anon is None or rss is None:
+        return None, None
+    df = load(reader, path)
+    df.sum(numeric_only=True)
+    return (status_kb("RssAnon") - anon) / 1024, (status_kb("VmRSS") - rss) / 1024
+
+
+def memory_growth_mb(reader, path):
+    """RssAnon and VmRSS growth of a new process while it holds and reads the frame."""
+    with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        return pool.submit(_memory_growth_mb, reader, path).result()
+
+
+def run(scales, repeat, workdir):
+    rows = []
+    for scale in scales:
+        n_rows = WINE_ROWS * scale
+        csv_path = workdir / f"wine-{scale}x.csv"
+        wine_frame(n_rows).to_csv(csv_path, sep=";", index=False)
+        cleaned = pd.read_csv(csv_path, sep=";").rename(columns=WINE_RENAMES)
+
+        paths = {"csv": csv_path}
+        for fmt in ("feather", "parquet"):
+            paths[fmt] = write_snapshot(cleaned, workdir / f"wine-{scale}x.{fmt}", fmt=fmt)
+        paths["feather_copy"] = paths["feather"]
+        del cleaned
+
+        result = {"scale": f"{scale}x", "rows": n_rows}
+        for reader, path in paths.items():
+            result[f"{reader}_s"], _ = best_of(lambda: load(reader, path), repeat)
+        result["speedup"] = result["csv_s"] / result["feather_s"]
+        for reader, path in paths.items():
+            result[f"{reader}_anon_mb"], result[f"{reader}_rss_mb"] = memory_growth_mb(reader, path)
+        rows.append(result)
+    return pd.DataFrame(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        report = run(args.scales, args.repeat, Path(tmp))
+    print(report.to_string(index=False, float_format=lambda v: f"{v:.4f}"))
+
+
+if __name__ == "__main__":
+    main()
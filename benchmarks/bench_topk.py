@@ -0,0 +1,66 @@
+"""``sort_values("Fare", ascending=False).head()`` versus :func:`eda.topk.top_k_rows`.
+
+    python -m benchmarks.bench_topk [--sizes 1000000 10000000 100000000] [--k 5]
+
+The frame holds only the columns Question 6 needs, so 10^8 rows fit in a few GB.
+"""
+
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from eda.topk import TopK, grouped_top_k, top_k_rows
+
+from ._timing import best_of
+
+
+def fare_frame(n_rows, seed=0):
+    rng = np.random.default_rng(seed)
+    pclass = rng.choice(np.array([1, 2, 3], dtype=np.int8), n_rows, p=[0.24, 0.21, 0.55])
+    fare = np.round(rng.lognormal(np.select([pclass == 1, pclass == 2], [4.2, 3.0], 2.4), 0.6), 4)
+    return pd.DataFrame({"PassengerId": np.arange(1, n_rows + 1), "Pclass": pclass, "Fare": fare})
+
+
+def run(sizes, k, chunk_rows):
+    rows = []
+    for n_rows in sizes:
+        df = fare_frame(n_rows)
+        sort_s, expected = best_of(lambda: df.sort_values(by="Fare", ascending=False).head(k)["Fare"].tolist())
+        topk_s, got = best_of(lambda: top_k_rows(df, "Fare", k)["Fare"].tolist())
+        assert got == expected, (got, expected)
+
+        def streamed():
+            tracker = TopK("Fare", k)
+            for start in range(0, n_rows, chunk_rows):
+                tracker.update(df.iloc[start:start + chunk_rows])
+            return tracker.values().tolist()
+
+        stream_s, streamed_values = best_of(streamed)
+        assert streamed_values == expected
+        grouped_sort_s, _ = best_of(lambda: df.sort_values("Fare", ascending=False).groupby("Pclass").head(k))
+        grouped_s, _ = best_of(lambda: grouped_top_k(df, "Fare", "Pclass", k))
+        rows.append({
+            "rows": n_rows,
+            "sort_head_s": sort_s,
+            "top_k_s": topk_s,
+            "streaming_s": stream_s,
+            "speedup": sort_s / topk_s,
+            "grouped_sort_s": grouped_sort_s,
+            "grouped_top_k_s": grouped_s,
+        })
+        del df
+    return pd.DataFrame(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10**6, 10**7, 10**8])
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--chunk-rows", type=int, default=10**6)
+    args = parser.parse_args()
+    print(run(args.sizes, args.k, args.chunk_rows).to_string(index=False, float_format=lambda v: f"{v:.4f}"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,304 @@
+"""Time and measure every operation of the script on synthetic data of growing size.
+
+    python -m benchmarks.suite [--scales 1 10 100] [--repeat 3] [--only corr value_counts]
+                               [--no-plots] [--history benchmarks/history.json] [--compare]
+
+Each operation runs on frames with the wine schema (11 float features plus
+``quality``) and the Titanic schema, ``scale`` times the size of the
+original files. For each one the suite records the best and median wall
+time over ``--repeat`` runs, the peak resident set size during one more run
+(and how far it rose above the RSS before the call) and, from a
+``tracemalloc`` run, the peak and net bytes allocated. Every invocation is
+appended to a JSON history with the commit and library versions, and
+``--compare`` prints the change against the previous run of each operation.
+"""
+
+import argparse
+import datetime
+import gc
+import io
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ._timing import status_kb
+from .synthetic import TITANIC_ROWS, WINE_ROWS, titanic_frame, wine_frame
+
+DEFAULT_HISTORY = Path(__file__).with_name("history.json")
+MB = 1024 * 1024
+
+
+@dataclass
+class Operation:
+    """One script cell: ``run(data)`` is timed, ``setup(frames)`` (untimed) builds ``data``."""
+
+    name: str
+    dataset: str
+    run: object
+    setup: object = None
+    plot: bool = False
+
+
+def _frame(name):
+    return lambda frames: frames[name]
+
+
+def _copy(name):
+    return lambda frames: frames[name].copy()
+
+
+def _csv(name):
+    return lambda frames: frames[f"{name}_csv"]
+
+
+def _draw(kind, **options):
+    def run(df):
+        import matplotlib.pyplot as plt
+
+        from eda.render import draw_figure, spec
+
+        figure = draw_figure(df, spec(kind, kind, **options))
+        figure.savefig(io.BytesIO(), format="png")
+        plt.close(figure)
+
+    return run
+
+
+def _sns_pairplot(df):
+    # The script's own cell, not eda.render's binned pair plot
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    grid = sns.pairplot(df)
+    grid.figure.savefig(io.BytesIO(), format="png")
+    plt.close(grid.figure)
+
+
+def _wine_renamed(frames):
+    from eda.loaders import WINE_RENAMES
+
+    return frames["wine"].rename(columns=WINE_RENAMES)
+
+
+def operations():
+    """The script's operations, in script order."""
+    from eda.loaders import WINE_RENAMES
+
+    wine_ops = [
+        Operation("read_csv", "wine", lambda path: pd.read_csv(path, sep=";"), _csv("wine")),
+        Operation("rename", "wine", lambda df: df.rename(columns=WINE_RENAMES, inplace=True), _copy("wine")),
+        Operation("describe", "wine", lambda df: df.describe(), _frame("wine")),
+        Operation("isnull().sum()", "wine", lambda df: df.isnull().sum(), _frame("wine")),
+        Operation("duplicated().sum()", "wine", lambda df: df.duplicated().sum(), _frame("wine")),
+        Operation("corr", "wine", lambda df: df.corr(), _frame("wine")),
+        Operation("value_counts", "wine", lambda df: df["quality"].value_counts(), _frame("wine")),
+        Operation("mask filter", "wine", lambda df: df[df["quality"] >= 7].shape[0], _frame("wine")),
+        Operation("plot hist", "wine", _draw("hist", bins=10, figsize=(15, 10)), _wine_renamed, plot=True),
+        Operation("plot heatmap", "wine", _draw("heatmap", cmap="bwr", annot=True, figsize=(16, 12)), _wine_renamed, plot=True),
+        Operation("plot countplot", "wine", _draw("countplot", x="quality"), _wine_renamed, plot=True),
+        Operation("plot pairplot", "wine", _sns_pairplot, _wine_renamed, plot=True),
+        Operation("plot boxplot", "wine", _draw("boxplot", x="quality", y="alcohol", palette="GnBu_d"), _wine_renamed, plot=True),
+    ]
+    titanic_ops = [
+        Operation("read_csv", "titanic", lambda path: pd.read_csv(path), _csv("titanic")),
+        Operation("describe", "titanic", lambda df: df.describe(), _frame("titanic")),
+        Operation("isnull().sum()", "titanic", lambda df: df.isnull().sum(), _frame("titanic")),
+        Operation("value_counts", "titanic", lambda df: df["Sex"].value_counts(), _frame("titanic")),
+        Operation("mask filter", "titanic", lambda df: df[df["Sex"] == "female"]["Survived"].sum(), _frame("titanic")),
+        Operation("sort_values().head()", "titanic", lambda df: df.sort_values(by="Fare", ascending=False).head(), _frame("titanic")),
+        Operation("median", "titanic", lambda df: df["Fare"].median(), _frame("titanic")),
+        Operation("nunique", "titanic", lambda df: df["Name"].nunique(), _frame("titanic")),
+        Operation("fillna", "titanic", lambda df: df.fillna({"Embarked": "S"}, inplace=True), _copy("titanic")),
+    ]
+    return wine_ops + titanic_ops
+
+
+# -- measuring ------------------------------------------------------------
+
+
+def _reset_peak_rss():
+    """Reset the kernel's peak-RSS mark (Linux); False where that is not possible."""
+    try:
+        with open("/proc/self/clear_refs", "w") as fh:
+            fh.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def _peak_rss_kb():
+    peak = status_kb("VmHWM")
+    if peak is not None:
+        return peak
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss // 1024 if sys.platform == "darwin" else maxrss
+
+
+def measure(operation, frames, repeat):
+    times = []
+    for _ in range(repeat):
+        data = operation.setup(frames)
+        start = time.perf_counter()
+        operation.run(data)
+        times.append(time.perf_counter() - start)
+
+    data = operation.setup(frames)
+    gc.collect()
+    resettable = _reset_peak_rss()
+    before = status_kb("VmRSS") or _peak_rss_kb()
+    operation.run(data)
+    peak = _peak_rss_kb()
+
+    data = operation.setup(frames)
+    gc.collect()
+    tracemalloc.start()
+    operation.run(data)
+    net, alloc_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "wall_s": min(times),
+        "wall_median_s": statistics.median(times),
+        "peak_rss_mb": peak / 1024,
+        # Without a resettable mark the peak is the process's so far, not this call's
+        "rss_growth_mb": max(peak - before, 0) / 1024 if resettable else None,
+        "alloc_peak_mb": alloc_peak / MB,
+        "alloc_net_mb": net / MB,
+    }
+
+
+def build_frames(scale, tmp_dir):
+    wine = wine_frame(WINE_ROWS * scale)
+    titanic = titanic_frame(TITANIC_ROWS * scale)
+    wine_csv = Path(tmp_dir) / f"wine_{scale}.csv"
+    titanic_csv = Path(tmp_dir) / f"titanic_{scale}.csv"
+    wine.to_csv(wine_csv, sep=";", index=False)
+    titanic.to_csv(titanic_csv, index=False)
+    return {"wine": wine, "titanic": titanic, "wine_csv": wine_csv, "titanic_csv": titanic_csv}
+
+
+def run(scales, repeat, only=None, plots=True):
+    selected = [
+        op for op in operations()
+        if (plots or not op.plot) and (not only or any(word in op.name for word in only))
+    ]
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for scale in scales:
+            frames = build_frames(scale, tmp_dir)
+            for op in selected:
+                row = {"dataset": op.dataset, "operation": op.name, "scale": scale, "rows": len(frames[op.dataset])}
+                row.update(measure(op, frames, repeat))
+                results.append(row)
+    return results
+
+
+# -- history --------------------------------------------------------------
+
+
+def _git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=10)
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def environment():
+    import matplotlib
+
+    return {
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "matplotlib": matplotlib.__version__,
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def load_history(path):
+    path = Path(path)
+    return json.loads(path.read_text()) if path.exists() else []
+
+
+def append_history(path, entry):
+    history = load_history(path)
+    history.append(entry)
+    path = Path(path)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(history, indent=1))
+    os.replace(tmp, path)
+    return history
+
+
+def compare(history):
+    """Latest run against the previous run that measured the same operation and scale."""
+    if not history:
+        return pd.DataFrame()
+    key = ["dataset", "operation", "scale"]
+    latest = pd.DataFrame(history[-1]["results"]).set_index(key)
+    previous = {}
+    for entry in history[:-1]:
+        for row in entry["results"]:
+            previous[tuple(row[k] for k in key)] = row
+    rows = []
+    for index, row in latest.iterrows():
+        before = previous.get(index)
+        if before is None:
+            continue
+        rows.append({
+            **dict(zip(key, index)),
+            "wall_before_s": before["wall_s"],
+            "wall_s": row["wall_s"],
+            "speedup": before["wall_s"] / row["wall_s"] if row["wall_s"] else np.nan,
+            "alloc_peak_change_mb": row["alloc_peak_mb"] - before["alloc_peak_mb"],
+        })
+    return pd.DataFrame(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", nargs="+", help="run only operations whose name contains one of these")
+    parser.add_argument("--no-plots", action="store_true")
+    parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY)
+    parser.add_argument("--compare", action="store_true", help="show the change from the previous run")
+    args = parser.parse_args()
+
+    import matplotlib
+
+    matplotlib.use("Agg")
+    results = run(args.scales, args.repeat, args.only, plots=not args.no_plots)
+    entry = {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "environment": environment(),
+        "repeat": args.repeat,
+        "results": results,
+    }
+    history = append_history(args.history, entry)
+    table = pd.DataFrame(results).set_index(["dataset", "operation", "scale"])
+    print(table.to_string(float_format=lambda v: f"{v:.4f}"))
+    if args.compare:
+        changes = compare(history)
+        print()
+        print(changes.to_string(index=False, float_format=lambda v: f"{v:.4f}") if len(changes) else "No earlier run to compare with.")
+    print(f"\nAppended to {args.history}")
+
+
+if __name__ == "__main__":
+    main()
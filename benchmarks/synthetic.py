@@ -0,0 +1,67 @@
+"""Synthetic frames shaped like the datasets used in the script."""
+
+import numpy as np
+import pandas as pd
+
+WINE_ROWS = 1599  # rows in winequality-red.csv
+
+
+def wine_frame(n_rows=WINE_ROWS, seed=0, raw_names=True):
+    """Frame with the wine schema: 11 float features plus integer ``quality``.
+
+    With ``raw_names`` the columns keep the spaces of the original CSV, so the
+    rename step can be benchmarked too.
+    """
+    rng = np.random.default_rng(seed)
+    data = {
+        "fixed acidity": rng.normal(8.3, 1.7, n_rows).round(1),
+        "volatile acidity": rng.gamma(6.0, 0.09, n_rows).round(3),
+        "citric acid": rng.beta(1.2, 3.5, n_rows).round(2),
+        "residual sugar": rng.lognormal(0.85, 0.35, n_rows).round(1),
+        "chlorides": rng.lognormal(-2.5, 0.3, n_rows).round(3),
+        "free sulfur dioxide": rng.lognormal(2.6, 0.6, n_rows).round(0),
+        "total sulfur dioxide": rng.lognormal(3.6, 0.6, n_rows).round(0),
+        "density": rng.normal(0.9967, 0.0019, n_rows).round(5),
+        "pH": rng.normal(3.31, 0.15, n_rows).round(2),
+        "sulphates": rng.lognormal(-0.43, 0.22, n_rows).round(2),
+        "alcohol": rng.gamma(40.0, 0.26, n_rows).round(1),
+        "quality": rng.choice([3, 4, 5, 6, 7, 8], n_rows, p=[0.006, 0.033, 0.426, 0.399, 0.125, 0.011]),
+    }
+    df = pd.DataFrame(data)
+    if not raw_names:
+        from eda.loaders import WINE_RENAMES
+
+        df = df.rename(columns=WINE_RENAMES)
+    return df
+
+
+TITANIC_ROWS = 891  # rows in titanic.csv
+
+
+def titanic_frame(n_rows=TITANIC_ROWS, seed=0):
+    """Frame with the Titanic schema and roughly its distributions and missing values."""
+    rng = np.random.default_rng(seed)
+    pclass = rng.choice([1, 2, 3], n_rows, p=[0.24, 0.21, 0.55])
+    sex = rng.choice(["male", "female"], n_rows, p=[0.65, 0.35])
+    base = np.select([pclass == 1, pclass == 2], [0.63, 0.47], 0.24)
+    survived = (rng.random(n_rows) < np.where(sex == "female", base + 0.35, base - 0.1)).astype(np.int64)
+    age = rng.gamma(4.5, 6.5, n_rows).clip(0.42, 80).round()
+    age[rng.random(n_rows) < 0.2] = np.nan
+    fare = np.round(rng.lognormal(np.select([pclass == 1, pclass == 2], [4.2, 3.0], 2.4), 0.6), 4)
+    embarked = rng.choice(np.array(["S", "C", "Q"], dtype=object), n_rows, p=[0.72, 0.19, 0.09])
+    embarked[rng.random(n_rows) < 0.002] = None
+    cabin = np.where(rng.random(n_rows) < 0.23, [f"C{i}" for i in rng.integers(1, 150, n_rows)], None)
+    return pd.DataFrame({
+        "PassengerId": np.arange(1, n_rows + 1),
+        "Survived": survived,
+        "Pclass": pclass,
+        "Name": [f"Passenger, Mr. No{i}" for i in range(n_rows)],
+        "Sex": sex,
+        "Age": age,
+        "SibSp": rng.choice([0, 1, 2, 3, 4, 5, 8], n_rows, p=[0.68, 0.23, 0.03, 0.02, 0.02, 0.005, 0.015]),
+        "Parch": rng.choice([0, 1, 2, 3, 4, 5, 6], n_rows, p=[0.76, 0.13, 0.09, 0.005, 0.005, 0.005, 0.005]),
+        "Ticket": [f"{t}" for t in rng.integers(100000, 100000 + max(1, n_rows * 3 // 4), n_rows)],
+        "Fare": fare,
+        "Cabin": cabin,
+        "Embarked": embarked,
+    })
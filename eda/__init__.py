@@ -0,0 +1,15 @@
+"""Helpers behind ``intro_exploratory_data_analysis.py``."""
+
+from .loaders import DatasetCache, fetch, load_csv, load_red_wine, load_titanic, load_white_wine
+from .profile import ProfileReport, profile
+
+__all__ = [
+    "DatasetCache",
+    "fetch",
+    "load_csv",
+    "load_red_wine",
+    "load_titanic",
+    "load_white_wine",
+    "profile",
+    "ProfileReport",
+]
@@ -0,0 +1,381 @@
+"""Start every remote download at once and parse while the bytes arrive.
+
+``pd.read_csv(url)`` blocks until the wine file is downloaded and parsed,
+and the Titanic file is only requested much later. :class:`Prefetcher` runs
+an asyncio event loop in a background thread which, at start-up, issues all
+requests over a small pool of keep-alive HTTP/1.1 connections
+(:class:`ConnectionPool`, standard library only). Each response body is fed
+chunk by chunk to ``pd.read_csv`` running in a worker thread, so parsing
+overlaps the download, and the raw bytes are teed into the dataset cache
+(:mod:`eda.loaders`). Fresh cached copies are read from disk with no request;
+stale ones are revalidated with ``If-None-Match``/``If-Modified-Since``.
+
+The script can then work on the first table while the next is still in
+flight:
+
+>>> loader = Prefetcher({"wine": (RED_WINE_URL, {"sep": ";"}), "titanic": (TITANIC_URL, {})})
+>>> red_wine_data = loader.get("wine")        # waits only for the wine file
+>>> ...                                        # Titanic keeps downloading meanwhile
+>>> rms_titanic_data = loader.get("titanic")
+"""
+
+from __future__ import annotations
+
+import asyncio
+import queue
+import ssl
+import tempfile
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from email.message import Message
+from urllib.parse import urljoin, urlsplit
+
+import pandas as pd
+
+from .loaders import HTTP_TIMEOUT, RED_WINE_URL, TITANIC_URL, DatasetCache, default_cache, is_offline
+
+READ_SIZE = 1 << 16
+MAX_REDIRECTS = 5
+MAX_BUFFERED_BLOCKS = 64  # body blocks waiting for the parser, about 4 MB
+
+
+class HTTPError(OSError):
+    def __init__(self, url: str, status: int, reason: str):
+        super().__init__(f"{url}: HTTP {status} {reason}")
+        self.status = status
+
+
+# -- HTTP/1.1 client with connection reuse -------------------------------------
+
+
+@dataclass
+class Response:
+    status: int
+    reason: str
+    headers: Message
+    _reader: asyncio.StreamReader = field(repr=False)
+    _release: object = field(repr=False)  # callback(reusable: bool)
+    _timeout: float = HTTP_TIMEOUT  # for each read, so a stalled server cannot hang the body
+    _done: bool = False
+
+    async def _read(self, call, *args):
+        return await asyncio.wait_for(call(*args), self._timeout)
+
+    async def iter_bytes(self):
+        """Yield the body as it arrives, then hand the connection back to the pool."""
+        reusable = self.headers.get("Connection", "").lower() != "close"
+        try:
+            if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+                async for block in self._iter_chunked():
+                    yield block
+            elif self.headers.get("Content-Length") is not None:
+                remaining = int(self.headers["Content-Length"])
+                while remaining:
+                    block = await self._read(self._reader.read, min(READ_SIZE, remaining))
+                    if not block:
+                        raise ConnectionError("Connection closed before the body was complete")
+                    remaining -= len(block)
+                    yield block
+            else:
+                reusable = False
+                while block := await self._read(self._reader.read, READ_SIZE):
+                    yield block
+        except BaseException:
+            reusable = False
+            raise
+        finally:
+            if not self._done:
+                self._done = True
+                self._release(reusable)
+
+    async def _iter_chunked(self):
+        while True:
+            size_line = await self._read(self._reader.readline)
+            size = int(size_line.split(b";", 1)[0].strip() or b"0", 16)
+            if size == 0:
+                # Trailers, if any, end with an empty line
+                while (await self._read(self._reader.readline)) not in (b"\r\n", b"\n", b""):
+                    pass
+                return
+            remaining = size
+            while remaining:
+                block = await self._read(self._reader.read, min(READ_SIZE, remaining))
+                if not block:
+                    raise ConnectionError("Connection closed inside a chunk")
+                remaining -= len(block)
+                yield block
+            await self._read(self._reader.readexactly, 2)
+
+    async def drain(self) -> None:
+        async for _ in self.iter_bytes():
+            pass
+
+
+class ConnectionPool:
+    """Keep-alive connections per (scheme, host, port), at most ``per_host`` at a time."""
+
+    def __init__(self, per_host: int = 4, timeout: float = HTTP_TIMEOUT):
+        self.per_host = per_host
+        self.timeout = timeout
+        self._idle: dict = {}
+        self._limits: dict = {}
+        self._ssl = ssl.create_default_context()
+        self.opened = 0  # connections created, for checking reuse
+
+    async def _connect(self, key):
+        idle = self._idle.setdefault(key, [])
+        while idle:
+            reader, writer = idle.pop()
+            if not reader.at_eof() and not writer.is_closing():
+                return reader, writer
+            writer.close()
+        scheme, host, port = key
+        self.opened += 1
+        return await asyncio.wait_for(
+            asyncio.open_connection(host, port, ssl=self._ssl if scheme == "https" else None),
+            self.timeout,
+        )
+
+    async def request(self, url: str, headers: dict | None = None) -> Response:
+        """GET ``url``, following redirects; read the body with :meth:`Response.iter_bytes`."""
+        for _ in range(MAX_REDIRECTS + 1):
+            parts = urlsplit(url)
+            key = (parts.scheme, parts.hostname, parts.port or (443 if parts.scheme == "https" else 80))
+            limit = self._limits.setdefault(key, asyncio.Semaphore(self.per_host))
+            await limit.acquire()
+            writer = None
+            try:
+                reader, writer = await self._connect(key)
+                response = await self._send(reader, writer, parts, headers or {}, key, limit)
+            except BaseException:
+                if writer is not None:
+                    writer.close()
+                limit.release()
+                raise
+            if response.status in (301, 302, 303, 307, 308) and "Location" in response.headers:
+                await response.drain()
+                url = urljoin(url, response.headers["Location"])
+                continue
+            return response
+        raise HTTPError(url, 310, "Too many redirects")
+
+    async def _send(self, reader, writer, parts, headers, key, limit) -> Response:
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        lines = [f"GET {path} HTTP/1.1", f"Host: {parts.netloc}", "Connection: keep-alive", "Accept-Encoding: identity"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        await asyncio.wait_for(writer.drain(), self.timeout)
+
+        status_line = await asyncio.wait_for(reader.readline(), self.timeout)
+        if not status_line:
+            raise ConnectionError("Server closed the connection")
+        _, status, reason = (status_line.decode("latin-1").rstrip("\r\n").split(" ", 2) + [""])[:3]
+        message = Message()
+        while (line := await asyncio.wait_for(reader.readline(), self.timeout)) not in (b"\r\n", b"\n", b""):
+            name, _, value = line.decode("latin-1").partition(":")
+            message[name.strip()] = value.strip()
+
+        def release(reusable: bool) -> None:
+            if reusable:
+                self._idle.setdefault(key, []).append((reader, writer))
+            else:
+                writer.close()
+            limit.release()
+
+        response = Response(int(status), reason, message, reader, release, self.timeout)
+        if int(status) in (204, 304) or message.get("Content-Length") == "0":
+            response._done = True
+            release(message.get("Connection", "").lower() != "close")
+        return response
+
+    async def close(self) -> None:
+        for connections in self._idle.values():
+            for _, writer in connections:
+                writer.close()
+        self._idle.clear()
+
+
+# -- streaming the body into the CSV parser --------------------------------------
+
+
+class _FeedStream:
+    """File-like object ``pd.read_csv`` reads from while the event loop feeds it.
+
+    At most ``max_blocks`` blocks wait in the queue; :meth:`feed` then
+    suspends the download until the parser has taken one, so a slow parser
+    holds back the network reader instead of buffering the whole body.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, max_blocks: int = MAX_BUFFERED_BLOCKS):
+        self._blocks: queue.Queue = queue.Queue(maxsize=max_blocks)
+        self._loop = loop
+        self._space = asyncio.Event()
+        self._buffer = b""
+        self._finished = False
+        self._error: BaseException | None = None
+        self._abandoned = False
+
+    async def feed(self, block: bytes) -> None:
+        while not self._abandoned:
+            try:
+                self._blocks.put_nowait(block)
+                return
+            except queue.Full:
+                self._space.clear()
+                await self._space.wait()
+
+    async def close_feed(self) -> None:
+        await self.feed(None)
+
+    def fail(self, error: BaseException) -> None:
+        """End the body with ``error``; never blocks, the queue may be full."""
+        self._error = error
+        try:
+            self._blocks.put_nowait(None)
+        except queue.Full:
+            pass  # the parser is not waiting and sees the error before its next get()
+
+    def abandon(self) -> None:
+        """The parser has stopped; drop whatever is fed from now on."""
+        self._abandoned = True
+        self._space.set()
+
+    def read(self, size: int = -1) -> bytes:
+        while not self._finished and (size < 0 or len(self._buffer) < size):
+            if self._error is not None:
+                raise self._error
+            block = self._blocks.get()
+            self._loop.call_soon_threadsafe(self._space.set)
+            if self._error is not None:
+                raise self._error
+            if block is None:
+                self._finished = True
+            else:
+                self._buffer += block
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def readable(self) -> bool:
+        return True
+
+
+async def fetch_frame(pool: ConnectionPool, url: str, read_csv_kwargs: dict, cache: DatasetCache | None = None, offline: bool = False) -> pd.DataFrame:
+    """Download ``url`` and parse it as it streams in; use/refresh ``cache`` if given.
+
+    Like :meth:`DatasetCache.fetch`, a download that fails (connection
+    error, timeout, HTTP error) falls back to the cached copy whatever its
+    age, then to the fixture directory. With ``offline`` nothing is
+    requested: the copy in ``cache`` (the default cache if None) or a
+    fixture is read, otherwise ``FileNotFoundError`` is raised.
+    """
+    url = url.strip()
+    loop = asyncio.get_running_loop()
+    entry = cache.entry(url) if cache is not None else None
+    if entry is not None and (offline or cache.is_fresh(entry)):
+        return await loop.run_in_executor(None, lambda: pd.read_csv(entry["path"], **read_csv_kwargs))
+    if offline:
+        path = (cache or default_cache()).fetch(url, offline=True)
+        return await loop.run_in_executor(None, lambda: pd.read_csv(path, **read_csv_kwargs))
+    try:
+        return await _download_frame(pool, url, read_csv_kwargs, cache, entry)
+    except OSError:  # includes HTTPError and (since Python 3.11) asyncio's TimeoutError
+        if cache is None:
+            raise
+        path = cache.fetch(url, offline=True)
+        return await loop.run_in_executor(None, lambda: pd.read_csv(path, **read_csv_kwargs))
+
+
+async def _download_frame(pool: ConnectionPool, url: str, read_csv_kwargs: dict, cache: DatasetCache | None, entry: dict | None) -> pd.DataFrame:
+    loop = asyncio.get_running_loop()
+    headers = {}
+    if entry is not None:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+    response = await pool.request(url, headers)
+    if response.status == 304 and entry is not None:
+        cache.touch(url)
+        return await loop.run_in_executor(None, lambda: pd.read_csv(entry["path"], **read_csv_kwargs))
+    if response.status != 200:
+        await response.drain()
+        raise HTTPError(url, response.status, response.reason)
+
+    stream = _FeedStream(loop)
+    parsed = loop.run_in_executor(None, lambda: pd.read_csv(stream, **read_csv_kwargs))
+    parsed.add_done_callback(lambda _: stream.abandon())
+    with tempfile.TemporaryFile() as spool:
+        try:
+            async for block in response.iter_bytes():
+                spool.write(block)
+                await stream.feed(block)
+        except BaseException as err:
+            stream.fail(err)
+            # The parser fails with `err` too; mark that as seen
+            parsed.add_done_callback(lambda future: future.cancelled() or future.exception())
+            raise
+        await stream.close_feed()
+        df = await parsed
+        if cache is not None:
+            spool.seek(0)
+            await loop.run_in_executor(None, cache.store, url, spool, response.headers)
+    return df
+
+
+# -- background prefetcher ----------------------------------------------------
+
+
+class Prefetcher:
+    """Fetch and parse several remote CSVs concurrently in a background event loop.
+
+    ``sources`` maps a name to ``(url, read_csv_kwargs)``. Every download
+    starts immediately; :meth:`get` blocks only until that one table is ready.
+    """
+
+    def __init__(self, sources: dict, cache: DatasetCache | None = None, per_host: int = 4, offline: bool | None = None):
+        self.cache = cache if cache is not None else default_cache()
+        self.offline = is_offline() if offline is None else offline
+        self.futures: dict[str, Future] = {name: Future() for name in sources}
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, args=(sources, per_host), name="eda-prefetch", daemon=True)
+        self._thread.start()
+
+    def _run(self, sources: dict, per_host: int) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_until_complete(self._fetch_all(sources, per_host))
+        self._loop.close()
+
+    async def _fetch_all(self, sources: dict, per_host: int) -> None:
+        self.pool = ConnectionPool(per_host=per_host)
+
+        async def one(name, url, kwargs):
+            try:
+                self.futures[name].set_result(await fetch_frame(self.pool, url, kwargs, self.cache, self.offline))
+            except BaseException as err:
+                self.futures[name].set_exception(err)
+
+        try:
+            await asyncio.gather(*(one(name, url, dict(kwargs)) for name, (url, kwargs) in sources.items()))
+        finally:
+            await self.pool.close()
+
+    def get(self, name: str, timeout: float | None = None) -> pd.DataFrame:
+        """The parsed frame for ``name``, waiting for it if necessary."""
+        return self.futures[name].result(timeout)
+
+    def ready(self, name: str) -> bool:
+        return self.futures[name].done()
+
+    def join(self, timeout: float | None = None) -> dict:
+        """Wait for every table; returns ``{name: DataFrame}``."""
+        return {name: future.result(timeout) for name, future in self.futures.items()}
+
+
+def prefetch_defaults(cache: DatasetCache | None = None) -> Prefetcher:
+    """Start fetching the script's red wine and Titanic tables."""
+    return Prefetcher({"red_wine": (RED_WINE_URL, {"sep": ";"}), "titanic": (TITANIC_URL, {})}, cache=cache)
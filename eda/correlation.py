@@ -0,0 +1,87 @@
+"""Correlation matrix that is updated batch by batch.
+
+``red_wine_data.corr()`` is computed in the correlation cell and again
+inside ``sns.heatmap(...)``, each time from every row. The wine data arrives
+in daily batches, so :class:`IncrementalCorrelation` keeps the pairwise
+co-moments (:class:`~eda.streaming.CoMoments`) and folds each new batch in
+with Welford/Chan updates in ``O(batch x features^2)``. With ``window`` set
+it also keeps each batch's own co-moments (``features^2`` numbers, not its
+rows) and subtracts the oldest batch once the window is full, so history is
+never rescanned.
+
+>>> tracker = IncrementalCorrelation(window=30)
+>>> tracker.add(todays_batch)
+>>> sns.heatmap(tracker.corr(), cmap="bwr", annot=True)
+>>> tracker.corr_with("quality")
+"""
+
+from __future__ import annotations
+
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from .streaming import CoMoments
+
+
+class IncrementalCorrelation:
+    """Running correlation/covariance of the numeric columns of appended batches."""
+
+    def __init__(self, columns=None, window: int | None = None):
+        self.columns = list(columns) if columns is not None else None
+        self.window = window
+        self.state: CoMoments | None = None
+        self.batches: deque = deque()
+
+    def _values(self, batch: pd.DataFrame) -> np.ndarray:
+        if self.columns is None:
+            self.columns = list(batch.select_dtypes(include="number").columns)
+        return batch[self.columns].to_numpy(dtype=float, na_value=np.nan)
+
+    @property
+    def rows(self) -> int:
+        return 0 if self.state is None else int(self.state.n.diagonal().max(initial=0))
+
+    def add(self, batch: pd.DataFrame) -> "IncrementalCorrelation":
+        """Absorb a batch of new rows; drops the oldest batch beyond ``window``."""
+        update = CoMoments.from_values(self._values(batch))
+        if self.state is None:
+            self.state = CoMoments(len(self.columns))
+        self.state.merge(update)
+        if self.window is not None:
+            self.batches.append(update)
+            while len(self.batches) > self.window:
+                self.state.remove(self.batches.popleft())
+        return self
+
+    def remove(self, batch: pd.DataFrame) -> "IncrementalCorrelation":
+        """Take out rows that were added earlier (e.g. a retracted batch)."""
+        if self.state is None:
+            raise ValueError("Nothing has been added yet")
+        self.state.remove(CoMoments.from_values(self._values(batch)))
+        return self
+
+    def merge(self, other: "IncrementalCorrelation") -> "IncrementalCorrelation":
+        if other.state is None:
+            return self
+        if self.state is None:
+            self.columns, self.state = list(other.columns), CoMoments(len(other.columns))
+        elif other.columns != self.columns:
+            raise ValueError("Cannot merge correlations over different columns")
+        self.state.merge(other.state)
+        return self
+
+    def corr(self) -> pd.DataFrame:
+        """Same matrix as ``df.corr()`` over the rows currently held."""
+        matrix = self.state.corr() if self.state is not None else np.full((0, 0), np.nan)
+        return pd.DataFrame(matrix, index=self.columns, columns=self.columns)
+
+    def cov(self) -> pd.DataFrame:
+        matrix = self.state.cov() if self.state is not None else np.full((0, 0), np.nan)
+        return pd.DataFrame(matrix, index=self.columns, columns=self.columns)
+
+    def corr_with(self, target: str = "quality") -> pd.Series:
+        """Correlations of every other column with ``target``, strongest first."""
+        column = self.corr()[target].drop(target)
+        return column.reindex(column.abs().sort_values(ascending=False).index)
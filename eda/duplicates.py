@@ -0,0 +1,204 @@
+"""Duplicate rows from one hash per row.
+
+The "Checking for Duplicates" cells call ``duplicated()`` twice: once for the
+count and again to pull out ``red_wine_data[red_wine_data.duplicated()]``.
+:func:`find_duplicates` hashes every row once into a 64-bit fingerprint,
+sorts the fingerprint array and reads the count, the duplicate rows and the
+groups of identical rows off that single pass.
+
+For inputs that do not fit in memory, :func:`estimate_duplicates` streams
+chunks through a :class:`~eda.sketches.HyperLogLog` (distinct rows, then
+duplicates = rows - distinct) or a :class:`~eda.sketches.BloomFilter`
+(rows already seen), so the state stays a fixed-size array instead of a
+hash table holding every row.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from .sketches import BloomFilter, HyperLogLog
+
+
+def row_fingerprints(df: pd.DataFrame, subset=None) -> np.ndarray:
+    """One uint64 hash per row of ``df`` (or of the ``subset`` columns).
+
+    Equal rows always share a fingerprint; two different rows collide with
+    probability about ``n**2 / 2**65``, i.e. never in practice.
+    """
+    if subset is not None:
+        df = df[list(subset)]
+    return pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+
+class RowHasher:
+    """Row fingerprints built one column at a time.
+
+    Feed every column's values in order with :meth:`add`; the result mixes
+    the column hashes like :func:`row_fingerprints`, so a caller that already
+    holds each column's array (e.g. :func:`eda.profile.profile`) need not
+    read the frame again. Equal rows get equal fingerprints either way.
+    """
+
+    def __init__(self, n_rows: int, n_columns: int):
+        self.n_columns = n_columns
+        self._added = 0
+        self._mult = np.uint64(1000003)
+        self._out = np.full(n_rows, 0x345678, dtype=np.uint64)
+
+    def add(self, values) -> None:
+        inverse = self.n_columns - self._added
+        self._out ^= pd.util.hash_array(values)
+        self._out *= self._mult
+        self._mult += np.uint64(82520 + inverse + inverse)
+        self._added += 1
+
+    def fingerprints(self) -> np.ndarray:
+        if self._added != self.n_columns:
+            raise ValueError(f"Expected {self.n_columns} columns, got {self._added}")
+        return self._out + np.uint64(97531)
+
+
+def frame_fingerprint(df: pd.DataFrame) -> str:
+    """Hex digest identifying the content of ``df`` (columns, dtypes and rows)."""
+    digest = hashlib.sha256()
+    digest.update(repr([(str(name), str(dtype)) for name, dtype in df.dtypes.items()]).encode())
+    digest.update(row_fingerprints(df).tobytes())
+    return digest.hexdigest()
+
+
+@dataclass
+class DuplicateReport:
+    """Duplicates of a frame, found from its row fingerprints."""
+
+    index: pd.Index = field(repr=False)
+    fingerprints: np.ndarray = field(repr=False)
+    mask: np.ndarray = field(repr=False)  # same as df.duplicated(keep="first")
+    group_ids: np.ndarray = field(repr=False)  # rows with equal ids are identical
+    _order: np.ndarray = field(repr=False)
+    _starts: np.ndarray = field(repr=False)
+
+    @property
+    def count(self) -> int:
+        """Same as ``df.duplicated().sum()``."""
+        return int(self.mask.sum())
+
+    @property
+    def rate(self) -> float:
+        return self.count / len(self.mask) if len(self.mask) else 0.0
+
+    @property
+    def indices(self) -> pd.Index:
+        """Labels of the rows ``df.duplicated()`` flags."""
+        return self.index[self.mask]
+
+    def duplicated(self, keep="first") -> pd.Series:
+        """Same as ``df.duplicated(keep=...)`` for ``"first"``, ``"last"`` and ``False``."""
+        if keep == "first":
+            mask = self.mask
+        else:
+            sizes = np.bincount(self.group_ids)
+            if keep is False:
+                mask = sizes[self.group_ids] > 1
+            elif keep == "last":
+                last = np.zeros(len(sizes), dtype=np.int64)
+                np.maximum.at(last, self.group_ids, np.arange(len(self.group_ids)))
+                mask = np.arange(len(self.group_ids)) != last[self.group_ids]
+            else:
+                raise ValueError("keep must be 'first', 'last' or False")
+        return pd.Series(mask, index=self.index)
+
+    def groups(self) -> list[pd.Index]:
+        """Labels of every group of two or more identical rows."""
+        sizes = np.diff(np.r_[self._starts, len(self._order)])
+        members = np.split(self._order, self._starts[1:])
+        return [self.index[rows] for rows, size in zip(members, sizes) if size > 1]
+
+    def rows(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Same as ``df[df.duplicated()]``."""
+        return df[self.mask]
+
+
+def duplicates_from_fingerprints(fingerprints: np.ndarray, index=None) -> DuplicateReport:
+    fingerprints = np.asarray(fingerprints, dtype=np.uint64)
+    n = len(fingerprints)
+    index = pd.RangeIndex(n) if index is None else index
+    order = np.argsort(fingerprints, kind="stable")
+    ordered = fingerprints[order]
+    first = np.r_[True, ordered[1:] != ordered[:-1]] if n else np.zeros(0, dtype=bool)
+
+    group_ids = np.empty(n, dtype=np.int64)
+    group_ids[order] = np.cumsum(first) - 1
+    # The stable sort keeps each group's earliest row first, as keep="first" expects
+    mask = np.empty(n, dtype=bool)
+    mask[order] = ~first
+    return DuplicateReport(index, fingerprints, mask, group_ids, order, np.flatnonzero(first))
+
+
+def find_duplicates(df: pd.DataFrame, subset=None) -> DuplicateReport:
+    """Hash each row of ``df`` once and report its duplicates.
+
+    >>> report = find_duplicates(red_wine_data)
+    >>> report.count, report.rows(red_wine_data).shape
+    (240, (240, 12))
+    """
+    return duplicates_from_fingerprints(row_fingerprints(df, subset), df.index)
+
+
+@dataclass
+class DuplicateEstimate:
+    rows: int
+    distinct: float
+    method: str
+    relative_error: float  # of `distinct`, one standard error for "hll"
+
+    @property
+    def duplicates(self) -> float:
+        return max(0.0, self.rows - self.distinct)
+
+    @property
+    def rate(self) -> float:
+        return self.duplicates / self.rows if self.rows else 0.0
+
+
+def estimate_duplicates(
+    chunks,
+    method: str = "hll",
+    subset=None,
+    precision: int = 14,
+    capacity: int = 10_000_000,
+    error_rate: float = 0.01,
+) -> DuplicateEstimate:
+    """Approximate duplicate count of the rows across an iterable of frames.
+
+    ``method="hll"`` keeps a HyperLogLog of ``2 ** precision`` one-byte
+    registers; ``method="bloom"`` keeps a Bloom filter sized for ``capacity``
+    distinct rows at ``error_rate``, and corrects its count for the expected
+    false positives; duplicates within one chunk are then counted exactly.
+    """
+    rows = 0
+    if method == "hll":
+        sketch = HyperLogLog(precision)
+        for chunk in chunks:
+            rows += len(chunk)
+            sketch.update(row_fingerprints(chunk, subset))
+        return DuplicateEstimate(rows, sketch.count(), method, sketch.relative_error)
+
+    if method == "bloom":
+        seen = BloomFilter(capacity, error_rate)
+        duplicates = 0.0
+        for chunk in chunks:
+            rows += len(chunk)
+            fingerprints = np.unique(row_fingerprints(chunk, subset))
+            duplicates += len(chunk) - len(fingerprints)
+            false_positive = seen.false_positive_rate()
+            hits = int(seen.contains(fingerprints).sum())
+            duplicates += max(0.0, (hits - false_positive * len(fingerprints)) / (1 - false_positive))
+            seen.add(fingerprints)
+        return DuplicateEstimate(rows, rows - duplicates, method, seen.false_positive_rate())
+
+    raise ValueError(f"Unknown method {method!r}; expected 'hll' or 'bloom'")
@@ -0,0 +1,139 @@
+"""Survival counts for every Sex/Pclass/Embarked/age-group combination.
+
+Questions 2, 4 and 5 rebuild a boolean mask over the whole Titanic frame for
+every group they look at (each sex, each class, each age bucket, survivors
+who embarked at ``S``). :class:`SurvivalIndex` encodes each grouping column
+as small integer codes once, combines them into one cell number per row and
+counts passengers and survivors per cell with two ``bincount`` calls. Any
+count or survival rate for any combination is then a sum over that tiny cube
+(``2 x 4 x 4 x 4`` cells with the "missing" slots), whatever the number of
+passengers.
+
+>>> index = SurvivalIndex(rms_titanic_data)
+>>> index.rate()                                  # Q2: 0.38
+>>> index.rate(Sex="female"), index.rate(Sex="male")
+>>> index.rate(Pclass=1)
+>>> index.rate(AgeGroup="child")
+>>> index.count(survived=True, Embarked="S")      # Q5: 217
+>>> index.table("Pclass", "Sex")
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from .binning import AGE_EDGES, AGE_LABELS, bin_codes
+
+DIMENSIONS = ("Sex", "Pclass", "Embarked", "AgeGroup")
+
+
+def _encode(values: pd.Series) -> tuple[np.ndarray, list]:
+    """Integer codes plus their labels; missing values get the last code, labelled None."""
+    codes, uniques = pd.factorize(values, sort=True)
+    labels = list(uniques) + [None]
+    codes = np.where(codes < 0, len(uniques), codes)
+    return codes.astype(np.int64), labels
+
+
+def age_group_codes(age: pd.Series, edges=AGE_EDGES) -> np.ndarray:
+    """0 for Age <= edges[0], 1 for edges[0] < Age <= edges[1], ...; NaN gets len(edges) + 1."""
+    return bin_codes(age.to_numpy(dtype=float, na_value=np.nan), edges)
+
+
+class SurvivalIndex:
+    """Passenger and survivor counts per combination of the grouping columns."""
+
+    def __init__(self, df: pd.DataFrame, target: str = "Survived", age_edges=AGE_EDGES, age_labels=AGE_LABELS):
+        if len(age_labels) != len(age_edges) + 1:
+            raise ValueError("Need one age label per bucket (len(age_edges) + 1)")
+        codes, self.labels = [], {}
+        for name in ("Sex", "Pclass", "Embarked"):
+            column_codes, self.labels[name] = _encode(df[name])
+            codes.append(column_codes)
+        codes.append(age_group_codes(df["Age"], age_edges))
+        self.labels["AgeGroup"] = list(age_labels) + [None]
+
+        self.shape = tuple(len(self.labels[name]) for name in DIMENSIONS)
+        cells = np.ravel_multi_index(codes, self.shape)
+        size = int(np.prod(self.shape))
+        self.totals = np.bincount(cells, minlength=size).reshape(self.shape)
+        survived = df[target].to_numpy(dtype=float, na_value=0.0)
+        self.survived = np.bincount(cells, weights=survived, minlength=size).round().astype(np.int64).reshape(self.shape)
+
+    def merge(self, other: "SurvivalIndex") -> "SurvivalIndex":
+        """Index of both frames' passengers together (e.g. two partitions of one manifest).
+
+        Values seen in only one of them are added to that dimension's labels;
+        the age buckets must be the same.
+        """
+        if self.labels["AgeGroup"] != other.labels["AgeGroup"]:
+            raise ValueError("Cannot merge indexes built with different age buckets")
+        labels, maps = {}, ([], [])
+        for name in DIMENSIONS:
+            ours, theirs = self.labels[name], other.labels[name]
+            if ours == theirs:
+                merged = ours
+            else:
+                merged = sorted({value for value in ours + theirs if value is not None}) + [None]
+            labels[name] = merged
+            position = {value: i for i, value in enumerate(merged)}
+            maps[0].append([position[value] for value in ours])
+            maps[1].append([position[value] for value in theirs])
+
+        result = SurvivalIndex.__new__(SurvivalIndex)
+        result.labels = labels
+        result.shape = tuple(len(labels[name]) for name in DIMENSIONS)
+        result.totals = np.zeros(result.shape, dtype=np.int64)
+        result.survived = np.zeros(result.shape, dtype=np.int64)
+        for index, mapping in zip((self, other), maps):
+            cells = np.ix_(*mapping)
+            result.totals[cells] += index.totals
+            result.survived[cells] += index.survived
+        return result
+
+    def _selector(self, filters: dict) -> tuple:
+        selector = []
+        for name in DIMENSIONS:
+            if name not in filters:
+                selector.append(slice(None))
+                continue
+            wanted = filters.pop(name)
+            wanted = wanted if isinstance(wanted, (list, tuple, set)) else [wanted]
+            try:
+                selector.append([self.labels[name].index(value) for value in wanted])
+            except ValueError:
+                raise KeyError(f"{name} has no value among {wanted!r}; known: {self.labels[name]}") from None
+        if filters:
+            raise TypeError(f"Unknown dimension(s) {sorted(filters)}; expected {DIMENSIONS}")
+        return np.ix_(*[np.arange(n)[s] for n, s in zip(self.shape, selector)])
+
+    def count(self, survived: bool | None = None, **filters) -> int:
+        """Passengers matching ``filters`` (e.g. ``Sex="female"``, ``Pclass=[1, 2]``),
+        optionally only survivors (``survived=True``) or casualties (``False``)."""
+        cells = self._selector(dict(filters))
+        if survived is None:
+            return int(self.totals[cells].sum())
+        survivors = int(self.survived[cells].sum())
+        return survivors if survived else int(self.totals[cells].sum()) - survivors
+
+    def rate(self, **filters) -> float:
+        """Survival rate of the passengers matching ``filters``; NaN if there are none."""
+        cells = self._selector(dict(filters))
+        total = self.totals[cells].sum()
+        return float(self.survived[cells].sum() / total) if total else np.nan
+
+    def table(self, *by: str) -> pd.DataFrame:
+        """Count, survivors and survival rate for every combination of ``by``."""
+        unknown = set(by) - set(DIMENSIONS)
+        if unknown:
+            raise TypeError(f"Unknown dimension(s) {sorted(unknown)}; expected {DIMENSIONS}")
+        other = tuple(i for i, name in enumerate(DIMENSIONS) if name not in by)
+        order = [DIMENSIONS.index(name) for name in by]
+        totals = np.moveaxis(self.totals.sum(axis=other), range(len(by)), np.argsort(order)) if by else self.totals.sum()
+        survived = np.moveaxis(self.survived.sum(axis=other), range(len(by)), np.argsort(order)) if by else self.survived.sum()
+        index = pd.MultiIndex.from_product([self.labels[name] for name in by], names=list(by))
+        result = pd.DataFrame({"count": np.ravel(totals), "survived": np.ravel(survived)}, index=index)
+        result = result[result["count"] > 0]
+        result["rate"] = result["survived"] / result["count"]
+        return result
@@ -0,0 +1,214 @@
+"""Learn fill values for several columns in one pass and apply them in place.
+
+The Titanic tail computes the ``Age`` mean, builds a filled copy with
+``fillna(age_mean_before)``, recomputes the mean, and then hard-codes ``'S'``
+as the most frequent ``Embarked`` port. :class:`Imputer` takes one rule per
+column (mean, median, mode or a constant, optionally per group such as
+``Pclass``/``Sex``), learns every statistic from a single pass over the
+data, keeps them in :attr:`Imputer.statistics` so the same fills can be
+applied to later batches, and fills all columns with one in-place
+``fillna`` call (grouped rules write only the missing cells).
+
+Fitting works chunk by chunk (:meth:`Imputer.partial_fit`): means use the
+mergeable moments of :mod:`eda.streaming`, medians a quantile sketch from
+:mod:`eda.quantiles` (exact when fitting a single DataFrame, or with
+``exact_quantiles=True``) and modes running value counts, so
+:func:`impute_csv` can clean a passenger manifest that does not fit in
+memory.
+
+>>> imputer = Imputer({"Age": Rule("mean", round=2), "Embarked": "mode"})
+>>> imputer.fit(rms_titanic_data).statistics
+{'Age': 29.7, 'Embarked': 'S'}
+>>> imputer.transform(rms_titanic_data)           # in place
+>>> Imputer({"Age": Rule("median", by=("Pclass", "Sex"))}).fit_transform(rms_titanic_data)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from .quantiles import quantile_estimator
+from .streaming import Moments, iter_chunks
+
+STRATEGIES = ("mean", "median", "mode", "constant")
+
+
+@dataclass(frozen=True)
+class Rule:
+    """How to fill one column. ``by`` names grouping columns; ``round`` rounds the learnt value."""
+
+    strategy: str = "mean"
+    by: tuple = ()
+    value: object = None  # for strategy="constant"
+    round: int | None = None
+
+    def __post_init__(self):
+        if self.strategy not in STRATEGIES:
+            raise ValueError(f"Unknown strategy {self.strategy!r}; expected one of {STRATEGIES}")
+        object.__setattr__(self, "by", tuple([self.by] if isinstance(self.by, str) else self.by))
+
+
+def _as_rule(rule) -> Rule:
+    if isinstance(rule, Rule):
+        return rule
+    if isinstance(rule, str):
+        return Rule(rule)
+    if isinstance(rule, dict):
+        return Rule(**rule)
+    raise TypeError(f"Expected a Rule, a strategy name or a dict, got {rule!r}")
+
+
+class _Accumulator:
+    """Running statistic for one column (or one group of a column)."""
+
+    def __init__(self, strategy: str, epsilon: float | None, exact: bool):
+        self.strategy = strategy
+        if strategy == "median":
+            self.sketch = quantile_estimator(epsilon, exact)
+        elif strategy == "mean":
+            self.moments = Moments(1)
+        elif strategy == "mode":
+            self.counts = pd.Series(dtype="int64")
+
+    def update(self, values: pd.Series) -> None:
+        if self.strategy == "median":
+            self.sketch.update(values.to_numpy(dtype=float, na_value=np.nan))
+        elif self.strategy == "mean":
+            self.moments.update(values.to_numpy(dtype=float, na_value=np.nan).reshape(-1, 1))
+        elif self.strategy == "mode":
+            self.counts = self.counts.add(values.value_counts(), fill_value=0).astype("int64")
+
+    def result(self):
+        if self.strategy == "median":
+            return self.sketch.median()
+        if self.strategy == "mean":
+            return float(self.moments.mean[0]) if self.moments.count[0] else np.nan
+        if self.strategy == "mode":
+            if not len(self.counts):
+                return np.nan
+            # Highest count; ties go to the smallest value, like Series.mode()
+            top = self.counts[self.counts == self.counts.max()]
+            return top.sort_index().index[0]
+        return np.nan
+
+
+class Imputer:
+    """Fill rules for several columns, fitted once and reusable on new batches.
+
+    ``rules`` maps a column to a :class:`Rule`, a strategy name or a dict of
+    :class:`Rule` fields. Grouped rules fall back to the column's overall
+    statistic for groups never seen while fitting.
+    """
+
+    def __init__(self, rules: dict, epsilon: float | None = None, exact_quantiles: bool | None = None):
+        self.rules = {column: _as_rule(rule) for column, rule in rules.items()}
+        self.epsilon = epsilon
+        self.exact_quantiles = exact_quantiles
+        self._exact = bool(exact_quantiles)
+        self.rows = 0
+        self._overall: dict = {}
+        self._groups: dict = {}
+
+    def _new(self, rule: Rule) -> _Accumulator:
+        return _Accumulator(rule.strategy, self.epsilon, self._exact)
+
+    # -- fitting ---------------------------------------------------------
+
+    def partial_fit(self, chunk: pd.DataFrame) -> "Imputer":
+        """Fold one chunk into every rule's statistics."""
+        self.rows += len(chunk)
+        for column, rule in self.rules.items():
+            if rule.strategy == "constant":
+                continue
+            self._overall.setdefault(column, self._new(rule)).update(chunk[column])
+            if rule.by:
+                groups = self._groups.setdefault(column, {})
+                for key, values in chunk.groupby(list(rule.by), sort=False, dropna=False)[column]:
+                    groups.setdefault(key, self._new(rule)).update(values)
+        return self
+
+    def fit(self, data) -> "Imputer":
+        """Learn the statistics from a DataFrame or an iterable of chunks.
+
+        Medians are exact for a DataFrame unless ``exact_quantiles=False``
+        was given, and sketched for chunks unless it is True.
+        """
+        self.rows, self._overall, self._groups = 0, {}, {}
+        single = isinstance(data, pd.DataFrame)
+        self._exact = single if self.exact_quantiles is None else self.exact_quantiles
+        for chunk in [data] if single else data:
+            self.partial_fit(chunk)
+        return self
+
+    def _rounded(self, rule: Rule, value):
+        if rule.round is not None and isinstance(value, (float, np.floating)):
+            return round(float(value), rule.round)
+        return value
+
+    @property
+    def statistics(self) -> dict:
+        """The fill value of each column; a Series indexed by group for grouped rules."""
+        result = {}
+        for column, rule in self.rules.items():
+            if rule.strategy == "constant":
+                result[column] = rule.value
+            elif column not in self._overall:
+                result[column] = np.nan
+            elif rule.by:
+                groups = self._groups[column]
+                index = pd.MultiIndex.from_tuples(list(groups), names=list(rule.by)) if len(rule.by) > 1 else pd.Index([k[0] for k in groups], name=rule.by[0])
+                result[column] = pd.Series([self._rounded(rule, acc.result()) for acc in groups.values()], index=index, name=column).sort_index()
+            else:
+                result[column] = self._rounded(rule, self._overall[column].result())
+        return result
+
+    # -- filling ---------------------------------------------------------
+
+    def transform(self, df: pd.DataFrame, inplace: bool = True) -> pd.DataFrame:
+        """Fill the missing values of every rule's column (in ``df`` itself by default)."""
+        if not inplace:
+            df = df.copy()
+        statistics = self.statistics
+        scalar_fills = {}
+        for column, rule in self.rules.items():
+            if not rule.by:
+                scalar_fills[column] = statistics[column]
+                continue
+            missing = df[column].isna().to_numpy()
+            if not missing.any():
+                continue
+            keys = df.loc[missing, list(rule.by)]
+            keys = pd.MultiIndex.from_frame(keys) if len(rule.by) > 1 else pd.Index(keys[rule.by[0]])
+            fills = statistics[column].reindex(keys).to_numpy()
+            overall = self._rounded(rule, self._overall[column].result())
+            fills = np.where(pd.isna(fills), overall, fills)
+            df.loc[missing, column] = fills
+        if scalar_fills:
+            df.fillna(scalar_fills, inplace=True)
+        return df
+
+    def fit_transform(self, df: pd.DataFrame, inplace: bool = True) -> pd.DataFrame:
+        return self.fit(df).transform(df, inplace=inplace)
+
+
+def impute_chunks(chunks, imputer: Imputer):
+    """Yield each chunk filled by an already fitted ``imputer``."""
+    for chunk in chunks:
+        yield imputer.transform(chunk)
+
+
+def impute_csv(path, out_path, rules: dict, chunksize: int = 100_000, renames: dict | None = None, epsilon: float | None = None, exact_quantiles: bool | None = None, **read_csv_kwargs) -> Imputer:
+    """Fit ``rules`` on a CSV and write the filled rows to ``out_path``, ``chunksize`` rows at a time.
+
+    Reads the file twice (fit, then fill) and never holds more than one chunk.
+    """
+    imputer = Imputer(rules, epsilon=epsilon, exact_quantiles=exact_quantiles)
+    imputer.fit(iter_chunks(path, chunksize, renames, **read_csv_kwargs))
+    sep = read_csv_kwargs.get("sep", ",")
+    chunks = iter_chunks(path, chunksize, renames, **read_csv_kwargs)
+    for i, chunk in enumerate(impute_chunks(chunks, imputer)):
+        chunk.to_csv(out_path, mode="w" if i == 0 else "a", header=i == 0, index=False, sep=sep)
+    return imputer
@@ -0,0 +1,292 @@
+"""Record pandas operations as an expression graph and evaluate each distinct one once.
+
+The Titanic cells rebuild the same intermediates over and over:
+``rms_titanic_data['Sex'].value_counts()`` three times in Question 1,
+``rms_titanic_data['Survived'].value_counts()`` twice in Question 2 and the
+``Sex == 'female'`` mask (and the filtered frame behind it) four times in
+Question 4. :func:`lazy` wraps the frame so that the same pandas code builds
+:class:`Expr` nodes instead of running. Nodes are hash-consed on
+``(operation, inputs)``, so writing an expression twice gives the same node,
+and a :class:`Plan` computes a node at most once, only when its value is
+needed: printing it, formatting it in an f-string, using it in an ``if`` or
+``assert``, or calling :meth:`Expr.compute`. Everything in between (indexing,
+attribute access, method calls, arithmetic and comparisons) stays lazy and
+is forwarded to pandas unchanged, so the results are exactly pandas' results.
+
+>>> titanic = lazy(rms_titanic_data)
+>>> if titanic['Sex'].value_counts()["male"] > titanic['Sex'].value_counts()["female"]:
+...     print("The no. of male passengers are more than female passengers")
+>>> women = titanic[titanic['Sex'] == 'female']
+>>> print(f"{women['Survived'].sum() / women.shape[0] * 100:.2f}%")
+>>> titanic.plan.stats                       # value_counts ran once, the mask once
+{'nodes': ..., 'evaluated': ..., 'reused': ...}
+
+Computed values are shared between everything that refers to them, so do not
+modify them in place. The plan assumes the wrapped frame does not change;
+after an in-place edit call :meth:`Plan.invalidate` (or wrap the frame again).
+"""
+
+from __future__ import annotations
+
+import operator
+
+import pandas as pd
+
+# Name -> function for the operators Expr records
+OPERATORS = {
+    name: getattr(operator, name)
+    for name in (
+        "eq", "ne", "lt", "le", "gt", "ge",
+        "and_", "or_", "xor", "invert", "neg", "pos", "abs",
+        "add", "sub", "mul", "truediv", "floordiv", "mod", "pow",
+    )
+}
+
+
+def _swap(function):
+    return lambda a, b: function(b, a)
+
+
+class Plan:
+    """The expression graph shared by every :class:`Expr` built from one frame."""
+
+    def __init__(self):
+        self.nodes: dict = {}     # key -> (operation, inputs)
+        self.results: dict = {}   # key -> computed value
+        self._constants: dict = {}  # id -> object, for constants that cannot be hashed
+        self.evaluated = 0
+        self.reused = 0
+
+    # -- building --------------------------------------------------------
+
+    def constant_key(self, value) -> tuple:
+        if isinstance(value, Expr):
+            if value.plan is not self:
+                raise ValueError("Cannot combine expressions from different plans")
+            return value.key
+        if isinstance(value, (list, tuple)):
+            return (type(value).__name__, tuple(self.constant_key(item) for item in value))
+        if isinstance(value, dict):
+            return ("dict", tuple((k, self.constant_key(v)) for k, v in value.items()))
+        if isinstance(value, slice):
+            return ("slice", self.constant_key((value.start, value.stop, value.step)))
+        try:
+            hash(value)
+        except TypeError:
+            self._constants[id(value)] = value
+            return ("object", id(value))
+        return ("const", type(value).__name__, value)
+
+    def node(self, operation: str, *inputs) -> Expr:
+        """The node for ``operation`` applied to ``inputs``, reusing an identical one."""
+        input_keys = tuple(self.constant_key(item) for item in inputs)
+        key = (operation, input_keys)
+        if key not in self.nodes:
+            self.nodes[key] = (operation, inputs)
+        return Expr(self, key)
+
+    # -- evaluating ------------------------------------------------------
+
+    def _value(self, item):
+        if isinstance(item, Expr):
+            return self.compute(item.key)
+        if isinstance(item, (list, tuple)):
+            return type(item)(self._value(i) for i in item)
+        if isinstance(item, dict):
+            return {k: self._value(v) for k, v in item.items()}
+        return item
+
+    def compute(self, key: tuple):
+        """Value of the node ``key``, computing it and its inputs if not done yet."""
+        if key in self.results:
+            self.reused += 1
+            return self.results[key]
+        operation, inputs = self.nodes[key]
+        args = [self._value(item) for item in inputs]
+        if operation == "source":
+            value = args[0]
+        elif operation == "attr":
+            value = getattr(args[0], args[1])
+        elif operation == "item":
+            value = args[0][args[1]]
+        elif operation == "call":
+            function, call_args, call_kwargs = args
+            value = function(*call_args, **call_kwargs)
+        elif operation in OPERATORS:
+            value = OPERATORS[operation](*args)
+        elif operation.startswith("r") and operation[1:] in OPERATORS:
+            value = _swap(OPERATORS[operation[1:]])(*args)
+        else:
+            raise ValueError(f"Unknown operation {operation!r}")
+        self.evaluated += 1
+        self.results[key] = value
+        return value
+
+    def invalidate(self) -> None:
+        """Forget every computed value (after the source frame changed in place)."""
+        self.results.clear()
+
+    @property
+    def stats(self) -> dict:
+        return {"nodes": len(self.nodes), "evaluated": self.evaluated, "reused": self.reused}
+
+    def explain(self, expr: Expr) -> str:
+        """The subtree under ``expr``, one node per line; shared nodes are listed once."""
+        lines, seen = [], set()
+
+        def walk(key, depth):
+            operation, inputs = self.nodes[key]
+            label = _describe(operation, inputs)
+            status = "computed" if key in self.results else "pending"
+            if key in seen:
+                lines.append(f"{'  ' * depth}{label}  (shared)")
+                return
+            seen.add(key)
+            lines.append(f"{'  ' * depth}{label}  [{status}]")
+            for item in _sub_expressions(inputs):
+                walk(item.key, depth + 1)
+
+        walk(expr.key, 0)
+        return "\n".join(lines)
+
+
+def _sub_expressions(inputs):
+    for item in inputs:
+        if isinstance(item, Expr):
+            yield item
+        elif isinstance(item, (list, tuple)):
+            yield from _sub_expressions(item)
+        elif isinstance(item, dict):
+            yield from _sub_expressions(item.values())
+
+
+def _describe(operation: str, inputs: tuple) -> str:
+    if operation == "source":
+        return f"source({type(inputs[0]).__name__})"
+    if operation == "attr":
+        return f".{inputs[1]}"
+    if operation == "item":
+        key = inputs[1]
+        return "[<expr>]" if isinstance(key, Expr) else f"[{key!r}]"
+    if operation == "call":
+        return "call()"
+    return operation.rstrip("_")
+
+
+class Expr:
+    """A pandas value that has not been computed yet.
+
+    Behaves like the value it stands for: indexing, attributes, calls and
+    operators give new expressions; ``print``/``format``/``bool``/``float``/
+    ``int``/``len``/iteration compute it.
+    """
+
+    __slots__ = ("plan", "key")
+
+    def __init__(self, plan: Plan, key: tuple):
+        self.plan = plan
+        self.key = key
+
+    def compute(self):
+        return self.plan.compute(self.key)
+
+    def explain(self) -> str:
+        return self.plan.explain(self)
+
+    # -- lazy ------------------------------------------------------------
+
+    def __getattr__(self, name: str) -> Expr:
+        if name.startswith("_"):  # keep IPython/pickle probes from building nodes
+            raise AttributeError(name)
+        return self.plan.node("attr", self, name)
+
+    def __getitem__(self, item) -> Expr:
+        return self.plan.node("item", self, item)
+
+    def __call__(self, *args, **kwargs) -> Expr:
+        return self.plan.node("call", self, args, kwargs)
+
+    def _binary(name):
+        def method(self, other):
+            return self.plan.node(name, self, other)
+
+        method.__name__ = f"__{name.rstrip('_')}__"
+        return method
+
+    def _reflected(name):
+        def method(self, other):
+            return self.plan.node("r" + name, self, other)
+
+        method.__name__ = f"__r{name.rstrip('_')}__"
+        return method
+
+    def _unary(name):
+        def method(self):
+            return self.plan.node(name, self)
+
+        method.__name__ = f"__{name.rstrip('_')}__"
+        return method
+
+    __eq__, __ne__ = _binary("eq"), _binary("ne")
+    __lt__, __le__, __gt__, __ge__ = _binary("lt"), _binary("le"), _binary("gt"), _binary("ge")
+    __and__, __or__, __xor__ = _binary("and_"), _binary("or_"), _binary("xor")
+    __add__, __sub__, __mul__ = _binary("add"), _binary("sub"), _binary("mul")
+    __truediv__, __floordiv__ = _binary("truediv"), _binary("floordiv")
+    __mod__, __pow__ = _binary("mod"), _binary("pow")
+    __rand__, __ror__, __rxor__ = _reflected("and_"), _reflected("or_"), _reflected("xor")
+    __radd__, __rsub__, __rmul__ = _reflected("add"), _reflected("sub"), _reflected("mul")
+    __rtruediv__, __rfloordiv__ = _reflected("truediv"), _reflected("floordiv")
+    __rmod__, __rpow__ = _reflected("mod"), _reflected("pow")
+    __invert__, __neg__, __pos__, __abs__ = _unary("invert"), _unary("neg"), _unary("pos"), _unary("abs")
+    del _binary, _reflected, _unary
+
+    __hash__ = None  # == builds an expression, so Exprs cannot be dict keys
+
+    # -- materialising ---------------------------------------------------
+
+    def __bool__(self) -> bool:
+        return bool(self.compute())
+
+    def __float__(self) -> float:
+        return float(self.compute())
+
+    def __int__(self) -> int:
+        return int(self.compute())
+
+    def __index__(self) -> int:
+        return operator.index(self.compute())
+
+    def __round__(self, ndigits=None):
+        return round(self.compute(), ndigits)
+
+    def __len__(self) -> int:
+        return len(self.compute())
+
+    def __iter__(self):
+        return iter(self.compute())
+
+    def __contains__(self, item) -> bool:
+        return item in self.compute()
+
+    def __format__(self, spec: str) -> str:
+        return format(self.compute(), spec)
+
+    def __str__(self) -> str:
+        return str(self.compute())
+
+    def __repr__(self) -> str:
+        return repr(self.compute())
+
+    def _repr_html_(self):
+        value = self.compute()
+        return value._repr_html_() if hasattr(value, "_repr_html_") else None
+
+
+def lazy(df: pd.DataFrame) -> Expr:
+    """Wrap ``df`` in a new :class:`Plan`; the root of every expression on it."""
+    return Plan().node("source", df)
+
+
+def compute(*exprs):
+    """Compute several expressions (of one or more plans) and return their values."""
+    return tuple(expr.compute() if isinstance(expr, Expr) else expr for expr in exprs)
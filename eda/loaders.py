@@ -0,0 +1,260 @@
+"""Dataset loading with a local, content-addressed cache.
+
+Every remote CSV is downloaded once and stored under ``<cache_dir>/objects``
+named by the SHA-256 of its bytes. A small JSON index maps each URL to the
+hash of its current content together with the ``ETag`` and ``Last-Modified``
+headers the server sent, so later runs can revalidate cheaply.
+
+Loading order for a URL:
+
+1. A fresh cache entry (younger than ``max_age`` seconds) is read straight
+   from disk, with no HTTP round trip.
+2. A stale entry is revalidated with a conditional GET. A ``304`` answer
+   just refreshes the entry's timestamp.
+3. Without a network (or with ``EDA_OFFLINE=1``) a cached entry is used
+   whatever its age, and failing that a file with the same name in the
+   fixture directory (``data/`` next to the script by default).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+import pandas as pd
+
+try:
+    import fcntl
+except ImportError:  # Windows: threads are still serialised, other processes are not
+    fcntl = None
+
+RED_WINE_URL = "https://raw.githubusercontent.com/dphi-official/Datasets/master/Wine_Dataset/winequality-red.csv"
+WHITE_WINE_URL = "https://raw.githubusercontent.com/dphi-official/Datasets/master/Wine_Dataset/winequality-white.csv"
+TITANIC_URL = "https://raw.githubusercontent.com/dphi-official/First_ML_Model/master/titanic.csv"
+
+# Six wine columns have spaces in their names; they are replaced with underscores
+WINE_RENAMES = {
+    "fixed acidity": "fixed_acidity",
+    "volatile acidity": "volatile_acidity",
+    "citric acid": "citric_acid",
+    "residual sugar": "residual_sugar",
+    "free sulfur dioxide": "free_sulfur_dioxide",
+    "total sulfur dioxide": "total_sulfur_dioxide",
+}
+
+DEFAULT_CACHE_DIR = Path(os.environ.get("EDA_CACHE_DIR", Path.home() / ".cache" / "eda-practice"))
+DEFAULT_FIXTURE_DIR = Path(os.environ.get("EDA_FIXTURE_DIR", Path(__file__).resolve().parent.parent / "data"))
+DEFAULT_MAX_AGE = 24 * 60 * 60  # one day
+HTTP_TIMEOUT = 30
+
+# One lock per index file, shared by every DatasetCache instance pointing at it
+_index_locks: dict = {}
+_index_locks_guard = threading.Lock()
+
+
+def is_offline() -> bool:
+    """True when the ``EDA_OFFLINE`` environment variable asks for offline mode."""
+    return os.environ.get("EDA_OFFLINE", "").lower() in ("1", "true", "yes")
+
+
+class DatasetCache:
+    """On-disk cache of remote files keyed by URL and content hash."""
+
+    def __init__(self, cache_dir=None, fixture_dir=None, max_age=DEFAULT_MAX_AGE):
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else DEFAULT_CACHE_DIR
+        self.fixture_dir = Path(fixture_dir) if fixture_dir is not None else DEFAULT_FIXTURE_DIR
+        self.max_age = max_age
+        self.objects_dir = self.cache_dir / "objects"
+        self.index_path = self.cache_dir / "index.json"
+
+    # -- index -----------------------------------------------------------
+
+    def _read_index(self) -> dict:
+        try:
+            with open(self.index_path, encoding="utf-8") as fh:
+                return json.load(fh)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _write_index(self, index: dict) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".json")
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(index, fh, indent=2, sort_keys=True)
+        os.replace(tmp, self.index_path)
+
+    @contextmanager
+    def _index_lock(self):
+        """Hold the index for a read-modify-write, against other threads and processes."""
+        with _index_locks_guard:
+            lock = _index_locks.setdefault(str(self.index_path.resolve()), threading.Lock())
+        with lock:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_dir / "index.lock", "a") as fh:
+                if fcntl is not None:
+                    fcntl.flock(fh, fcntl.LOCK_EX)
+                yield
+
+    def _update_index(self, url: str, change) -> dict:
+        """Apply ``change(index)`` to the index under the lock and return ``url``'s entry."""
+        with self._index_lock():
+            index = self._read_index()
+            change(index)
+            self._write_index(index)
+            return index[url]
+
+    def _blob_path(self, digest: str, url: str) -> Path:
+        suffix = Path(urlparse(url).path).suffix or ".bin"
+        return self.objects_dir / f"{digest}{suffix}"
+
+    def entry(self, url: str) -> dict | None:
+        """The index entry for ``url``, or None if it is not cached."""
+        entry = self._read_index().get(url.strip())
+        if entry and Path(entry["path"]).exists():
+            return entry
+        return None
+
+    def is_fresh(self, entry: dict) -> bool:
+        """True if ``entry`` was checked less than ``max_age`` seconds ago."""
+        return self.max_age is None or time.time() - entry["checked_at"] < self.max_age
+
+    # -- storing ---------------------------------------------------------
+
+    def store(self, url: str, source, headers=None) -> dict:
+        """Copy ``source`` (a binary file object) into the cache and index it.
+
+        If ``url`` pointed at another blob that no other entry uses, that blob
+        is deleted. A failed read of ``source`` leaves nothing behind.
+        """
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.sha256()
+        fd, tmp = tempfile.mkstemp(dir=self.objects_dir, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as out:
+                for block in iter(lambda: source.read(1 << 20), b""):
+                    digest.update(block)
+                    out.write(block)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        path = self._blob_path(digest.hexdigest(), url)
+
+        headers = headers or {}
+        entry = {
+            "sha256": digest.hexdigest(),
+            "path": str(path),
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+        }
+        # The blob is moved into place under the index lock, so a concurrent
+        # store cannot delete it as stale before it is indexed
+        with self._index_lock():
+            os.replace(tmp, path)
+            entry["size"] = path.stat().st_size
+            entry["checked_at"] = time.time()
+            index = self._read_index()
+            old = index.get(url)
+            index[url] = entry
+            self._write_index(index)
+            if old and old["path"] != entry["path"] and all(e["path"] != old["path"] for e in index.values()):
+                Path(old["path"]).unlink(missing_ok=True)
+        return entry
+
+    def touch(self, url: str) -> dict:
+        """Mark the entry for ``url`` as just revalidated."""
+        return self._update_index(url, lambda index: index[url].__setitem__("checked_at", time.time()))
+
+    def _from_fixture(self, url: str) -> Path | None:
+        candidate = self.fixture_dir / Path(urlparse(url).path).name
+        return candidate if candidate.exists() else None
+
+    # -- public ----------------------------------------------------------
+
+    def fetch(self, url: str, offline: bool | None = None) -> Path:
+        """Return a local path holding the content of ``url``."""
+        url = url.strip()
+        offline = is_offline() if offline is None else offline
+        entry = self.entry(url)
+
+        if entry is not None and (offline or self.is_fresh(entry)):
+            return Path(entry["path"])
+
+        if not offline:
+            try:
+                return Path(self._download(url, entry)["path"])
+            except (urllib.error.URLError, OSError):
+                if entry is not None:
+                    return Path(entry["path"])
+
+        fixture = self._from_fixture(url)
+        if fixture is not None:
+            with open(fixture, "rb") as fh:
+                return Path(self.store(url, fh)["path"])
+        raise FileNotFoundError(
+            f"{url} is not cached and no fixture named {Path(urlparse(url).path).name!r} "
+            f"exists in {self.fixture_dir}"
+        )
+
+    def _download(self, url: str, entry: dict | None) -> dict:
+        request = urllib.request.Request(url)
+        if entry is not None:
+            if entry.get("etag"):
+                request.add_header("If-None-Match", entry["etag"])
+            if entry.get("last_modified"):
+                request.add_header("If-Modified-Since", entry["last_modified"])
+        try:
+            with urllib.request.urlopen(request, timeout=HTTP_TIMEOUT) as response:
+                return self.store(url, response, response.headers)
+        except urllib.error.HTTPError as err:
+            if err.code == 304 and entry is not None:
+                return self.touch(url)
+            raise
+
+    def clear(self) -> None:
+        """Delete every cached file and the index."""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+
+_default_cache = None
+_default_cache_guard = threading.Lock()
+
+
+def default_cache() -> DatasetCache:
+    global _default_cache
+    with _default_cache_guard:
+        if _default_cache is None:
+            _default_cache = DatasetCache()
+    return _default_cache
+
+
+def fetch(url: str, cache: DatasetCache | None = None, offline: bool | None = None) -> Path:
+    """Local path for ``url`` via ``cache`` (the default cache if omitted)."""
+    return (cache or default_cache()).fetch(url, offline=offline)
+
+
+def load_csv(url: str, cache: DatasetCache | None = None, offline: bool | None = None, **read_csv_kwargs) -> pd.DataFrame:
+    """``pd.read_csv`` on a cached copy of ``url``."""
+    return pd.read_csv(fetch(url, cache=cache, offline=offline), **read_csv_kwargs)
+
+
+def load_red_wine(**kwargs) -> pd.DataFrame:
+    # The wine file is separated by ";" instead of the default ","
+    return load_csv(RED_WINE_URL, sep=";", **kwargs)
+
+
+def load_white_wine(**kwargs) -> pd.DataFrame:
+    return load_csv(WHITE_WINE_URL, sep=";", **kwargs)
+
+
+def load_titanic(**kwargs) -> pd.DataFrame:
+    return load_csv(TITANIC_URL, **kwargs)
@@ -0,0 +1,209 @@
+"""Profile a dataset stored as many partition files, one worker per partition.
+
+Each *map* task reads one or more partitions (CSV, or Parquet with
+``pyarrow``) chunk by chunk and builds a :class:`PartitionProfile`: the
+mergeable :class:`~eda.streaming.StreamingProfile` (describe-style moments,
+quantile sketches, null counts, target value counts and correlation
+co-moments) and, for passenger data, a :class:`~eda.groups.SurvivalIndex`
+of survival tallies. The *reduce* step merges the partial states, which is
+associative, so the result gives the same ``describe()``, ``isnull().sum()``,
+``value_counts()``, ``corr()`` and survival rates as the in-memory script.
+
+Tasks only exchange these small states, never rows, so the work scales with
+the number of worker processes. The executor is pluggable: anything with a
+``concurrent.futures``-style ``map(function, iterable)`` works (the default is
+a process pool; :class:`SerialExecutor` runs in-process).
+
+>>> result = map_reduce_profile("wine_parts/*.csv", target="quality", sep=";", renames=WINE_RENAMES)
+>>> result.describe(); result.corr(); result.value_counts()
+>>> titanic = map_reduce_profile("manifests/", target="Survived", survival=True)
+>>> titanic.survival.rate(Sex="female")
+"""
+
+from __future__ import annotations
+
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial, reduce
+from pathlib import Path
+
+import pandas as pd
+
+from .groups import SurvivalIndex
+from .streaming import StreamingProfile, iter_chunks
+
+PARQUET_SUFFIXES = (".parquet", ".pq")
+CSV_SUFFIXES = (".csv", ".txt", ".gz", ".bz2", ".zip", ".xz")
+
+
+@dataclass
+class PartitionProfile:
+    """Mergeable profile of one or more partitions."""
+
+    profile: StreamingProfile
+    survival: SurvivalIndex | None = None
+    partitions: int = 0
+    map_seconds: float = 0.0  # summed over map tasks
+    wall_seconds: float = 0.0  # whole run, set by map_reduce_profile
+    files: list = field(default_factory=list)
+
+    def merge(self, other: "PartitionProfile") -> "PartitionProfile":
+        self.profile.merge(other.profile)
+        if other.survival is not None:
+            self.survival = other.survival if self.survival is None else self.survival.merge(other.survival)
+        self.partitions += other.partitions
+        self.map_seconds += other.map_seconds
+        self.files.extend(other.files)
+        return self
+
+    # -- the script's outputs -------------------------------------------
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.profile.shape
+
+    def describe(self) -> pd.DataFrame:
+        return self.profile.describe()
+
+    def isnull_sum(self) -> pd.Series:
+        return self.profile.isnull_sum()
+
+    def value_counts(self) -> pd.Series:
+        return self.profile.value_counts()
+
+    def corr(self) -> pd.DataFrame:
+        return self.profile.corr()
+
+
+def partition_paths(source) -> list[str]:
+    """Sorted partition files from a directory, a glob pattern or a list of paths."""
+    if isinstance(source, (list, tuple)):
+        return [str(path) for path in source]
+    source = str(source)
+    if os.path.isdir(source):
+        return sorted(
+            str(path) for path in Path(source).iterdir()
+            if path.is_file() and path.name.lower().endswith(PARQUET_SUFFIXES + CSV_SUFFIXES)
+        )
+    paths = sorted(glob.glob(source))
+    if not paths:
+        raise FileNotFoundError(f"No partition files match {source!r}")
+    return paths
+
+
+def read_partition(path, chunksize: int = 100_000, renames: dict | None = None, **read_csv_kwargs):
+    """Yield the rows of one partition file in chunks."""
+    if str(path).lower().endswith(PARQUET_SUFFIXES):
+        df = pd.read_parquet(path)
+        yield df.rename(columns=renames) if renames else df
+    else:
+        yield from iter_chunks(path, chunksize, renames, **read_csv_kwargs)
+
+
+def numeric_schema(paths, sample_rows: int = 1000, renames: dict | None = None, **read_csv_kwargs) -> list:
+    """Columns that are numeric in the first ``sample_rows`` of every partition.
+
+    A column with no values in a partition's sample does not count against
+    it there, so a text column that happens to be empty at the top of some
+    files is decided by the files where it has values.
+    """
+    columns, text = None, set()
+    for path in paths:
+        if str(path).lower().endswith(PARQUET_SUFFIXES):
+            import pyarrow.parquet as pq
+
+            sample = pq.read_schema(path).empty_table().to_pandas()
+        else:
+            sample = pd.read_csv(path, nrows=sample_rows, **read_csv_kwargs)
+        sample = sample.rename(columns=renames) if renames else sample
+        if columns is None:
+            columns = list(sample.columns)
+        for name in sample.columns:
+            values = sample[name]
+            if not pd.api.types.is_numeric_dtype(values) and (len(values) == 0 or values.notna().any()):
+                text.add(name)
+    return [name for name in columns or [] if name not in text]
+
+
+def profile_partitions(paths, target: str | None = "quality", survival: bool = False, epsilon: float | None = None, chunksize: int = 100_000, renames: dict | None = None, numeric=None, **read_csv_kwargs) -> PartitionProfile:
+    """Map step: profile the partitions in ``paths`` (runs in a worker)."""
+    start = time.perf_counter()
+    result = PartitionProfile(StreamingProfile(target=target, epsilon=epsilon, numeric=numeric), files=list(paths))
+    for path in paths:
+        for chunk in read_partition(path, chunksize, renames, **read_csv_kwargs):
+            result.profile.update(chunk)
+            if survival:
+                index = SurvivalIndex(chunk, target=target or "Survived")
+                result.survival = index if result.survival is None else result.survival.merge(index)
+        result.partitions += 1
+    result.map_seconds = time.perf_counter() - start
+    return result
+
+
+class SerialExecutor:
+    """Runs map tasks one after another in this process."""
+
+    def map(self, function, iterable):
+        return map(function, iterable)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def _batches(paths: list, size: int) -> list[list]:
+    return [paths[i:i + size] for i in range(0, len(paths), size)]
+
+
+def map_reduce_profile(
+    source,
+    target: str | None = "quality",
+    survival: bool = False,
+    executor=None,
+    workers: int | None = None,
+    partitions_per_task: int | None = None,
+    epsilon: float | None = None,
+    chunksize: int = 100_000,
+    renames: dict | None = None,
+    **read_csv_kwargs,
+) -> PartitionProfile:
+    """Profile every partition of ``source`` in parallel and merge the results.
+
+    ``executor`` is any object with ``map(function, iterable)``; by default a
+    ``ProcessPoolExecutor`` with ``workers`` processes is created for the run.
+    Partitions are grouped ``partitions_per_task`` to a task (default: about
+    four tasks per worker) so that hundreds of small files do not each pay
+    for a round trip to a worker.
+
+    The numeric columns are worked out once from a sample of every
+    partition (:func:`numeric_schema`) and given to all tasks, so partitions
+    that start with an empty text column agree with the rest.
+    """
+    paths = partition_paths(source)
+    workers = workers or os.cpu_count() or 1
+    per_task = partitions_per_task or max(1, len(paths) // (workers * 4))
+    task = partial(
+        profile_partitions, target=target, survival=survival, epsilon=epsilon,
+        chunksize=chunksize, renames=renames, numeric=numeric_schema(paths, renames=renames, **read_csv_kwargs),
+        **read_csv_kwargs,
+    )
+
+    start = time.perf_counter()
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else SerialExecutor()
+    try:
+        partials = list(executor.map(task, _batches(paths, per_task)))
+    finally:
+        if own_executor and hasattr(executor, "shutdown"):
+            executor.shutdown()
+    if not partials:
+        raise ValueError("No partitions to profile")
+    result = reduce(PartitionProfile.merge, partials[1:], partials[0])
+    result.wall_seconds = time.perf_counter() - start
+    return result
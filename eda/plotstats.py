@@ -0,0 +1,240 @@
+"""Boxplots and histograms drawn from small pre-computed summaries.
+
+``sns.boxplot(x=red_wine_data.quality, y=red_wine_data.alcohol)`` and
+``red_wine_data.hist(bins=10)`` hand every row to the plotting library,
+which sorts each group for its quartiles and bins each column itself. Here
+the numbers behind the figures are computed once:
+
+* :class:`BoxSummary`: per group of ``x``, the quartiles (from
+  :class:`~eda.outliers.OutlierDetector`, so chunked input uses its quantile
+  sketches), the whiskers (the most extreme values within ``whis`` IQRs) and
+  the fliers as distinct values with counts, at most ``max_fliers`` of them;
+* :class:`HistogramSummary`: per column, the bin edges and counts of
+  ``df.hist()`` (bins span each column's min..max), mergeable across chunks.
+
+:func:`plot_boxplot` and :func:`plot_histograms` draw from those summaries
+with ``Axes.bxp`` and ``Axes.stairs``, so drawing costs the same for 1,599
+rows or 10^8. Summaries are plain dataclasses of small arrays and pickle, so
+they can be cached and redrawn.
+
+>>> box = box_summary(red_wine_data, x="quality", y="alcohol")
+>>> plot_boxplot(box, palette="GnBu_d", title="BoxPlot of Quality vs Alcohol")
+>>> plot_histograms(histogram_summary(red_wine_data, bins=10))
+>>> box = box_summary_csv("winequality-red.csv", sep=";", renames=WINE_RENAMES)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from .outliers import OutlierDetector
+from .streaming import Moments, iter_chunks
+
+
+@dataclass
+class BoxSummary:
+    x: str
+    y: str
+    stats: pd.DataFrame  # one row per group: count, q1, median, q3, whislo, whishi
+    fliers: dict = field(default_factory=dict)  # group -> Series of counts indexed by value
+    whis: float = 1.5
+
+    def bxp_stats(self) -> list[dict]:
+        """The per-group dicts ``matplotlib.axes.Axes.bxp`` draws."""
+        result = []
+        for label, row in self.stats.iterrows():
+            fliers = self.fliers.get(label, pd.Series(dtype="int64"))
+            result.append({
+                "label": label, "med": row["median"], "q1": row["q1"], "q3": row["q3"],
+                "whislo": row["whislo"], "whishi": row["whishi"],
+                "fliers": fliers.index.to_numpy(dtype=float),
+            })
+        return result
+
+
+def _require_reiterable(data, function: str, alternative: str) -> None:
+    if not isinstance(data, pd.DataFrame) and iter(data) is data:
+        raise TypeError(
+            f"{function} reads the chunks twice, but got a one-shot iterator; "
+            f"pass a list of chunks, or use {alternative} to read a CSV twice"
+        )
+
+
+def _fence_table(detector: OutlierDetector) -> pd.DataFrame:
+    fences = detector.fences().xs(detector.columns[0], level="feature")
+    return fences.drop(index="all")
+
+
+def _fold_whiskers(chunk: pd.DataFrame, x: str, y: str, fences: pd.DataFrame, whiskers: dict, fliers: dict) -> None:
+    rows = fences.index.get_indexer(chunk[x])
+    values = chunk[y].to_numpy(dtype=float, na_value=np.nan)
+    known = (rows >= 0) & ~np.isnan(values)
+    rows, values = rows[known], values[known]
+    low = fences["iqr_low"].to_numpy()[rows]
+    high = fences["iqr_high"].to_numpy()[rows]
+    inside = (values >= low) & (values <= high)
+
+    ends = pd.Series(values[inside]).groupby(rows[inside]).agg(["min", "max"])
+    for row, (lo, hi) in ends.iterrows():
+        label = fences.index[row]
+        old_lo, old_hi = whiskers.get(label, (np.inf, -np.inf))
+        whiskers[label] = (min(old_lo, lo), max(old_hi, hi))
+
+    outside = pd.DataFrame({"row": rows[~inside], "value": values[~inside]})
+    for row, counts in outside.groupby("row")["value"]:
+        label = fences.index[row]
+        fliers[label] = fliers.get(label, pd.Series(dtype="int64")).add(counts.value_counts(), fill_value=0).astype("int64")
+
+
+def _keep_extreme(counts: pd.Series, centre: float, limit: int) -> pd.Series:
+    if len(counts) > limit:
+        distance = np.abs(counts.index.to_numpy(dtype=float) - centre)
+        counts = counts.iloc[np.sort(np.argsort(-distance, kind="stable")[:limit])]
+    return counts.sort_index()
+
+
+def box_summary(data, x: str = "quality", y: str = "alcohol", whis: float = 1.5, max_fliers: int = 1000, epsilon: float | None = None, exact_quantiles: bool | None = None) -> BoxSummary:
+    """Five-number summaries and fliers of ``y`` for each value of ``x``.
+
+    ``data`` is a DataFrame or a list (or other re-iterable) of chunks,
+    read twice: once for the quartiles, once for the whiskers and fliers.
+    One-shot iterators raise ``TypeError``; :func:`box_summary_csv` reads a
+    CSV twice instead. Quartiles are exact for a DataFrame, sketched for
+    chunks (see :class:`~eda.outliers.OutlierDetector`).
+    """
+    _require_reiterable(data, "box_summary", "box_summary_csv")
+    detector = OutlierDetector([y], by=x, iqr_factor=whis, epsilon=epsilon, exact_quantiles=exact_quantiles)
+    detector.fit(data)
+    return _finish_box(detector, [data] if isinstance(data, pd.DataFrame) else data, x, y, whis, max_fliers)
+
+
+def _finish_box(detector: OutlierDetector, chunks, x: str, y: str, whis: float, max_fliers: int) -> BoxSummary:
+    fences = _fence_table(detector)
+    whiskers, fliers, counts = {}, {}, pd.Series(0, index=fences.index, dtype="int64")
+    for chunk in chunks:
+        _fold_whiskers(chunk, x, y, fences, whiskers, fliers)
+        counts = counts.add(chunk.groupby(x)[y].count(), fill_value=0).astype("int64")
+    stats = fences[["q1", "median", "q3"]].copy()
+    stats.insert(0, "count", counts.reindex(stats.index, fill_value=0))
+    stats["whislo"] = [whiskers.get(label, (np.nan, np.nan))[0] for label in stats.index]
+    stats["whishi"] = [whiskers.get(label, (np.nan, np.nan))[1] for label in stats.index]
+    fliers = {label: _keep_extreme(values, stats.at[label, "median"], max_fliers) for label, values in fliers.items()}
+    return BoxSummary(x, y, stats, fliers, whis)
+
+
+def box_summary_csv(path, x: str = "quality", y: str = "alcohol", whis: float = 1.5, max_fliers: int = 1000, chunksize: int = 100_000, renames: dict | None = None, epsilon: float | None = None, **read_csv_kwargs) -> BoxSummary:
+    """:func:`box_summary` of a CSV read ``chunksize`` rows at a time (twice)."""
+    detector = OutlierDetector([y], by=x, iqr_factor=whis, epsilon=epsilon)
+    detector.fit(iter_chunks(path, chunksize, renames, **read_csv_kwargs))
+    return _finish_box(detector, iter_chunks(path, chunksize, renames, **read_csv_kwargs), x, y, whis, max_fliers)
+
+
+@dataclass
+class HistogramSummary:
+    edges: dict  # column -> bin edges (bins + 1)
+    counts: dict  # column -> counts per bin
+
+    @classmethod
+    def from_ranges(cls, ranges: dict, bins: int = 10) -> "HistogramSummary":
+        """Empty histograms over ``{column: (min, max)}``, like ``np.histogram(range=...)``."""
+        edges = {}
+        for name, (low, high) in ranges.items():
+            if not np.isfinite(low) or not np.isfinite(high):
+                low, high = 0.0, 1.0
+            elif low == high:
+                low, high = low - 0.5, high + 0.5
+            edges[name] = np.linspace(low, high, bins + 1)
+        return cls(edges, {name: np.zeros(bins, dtype=np.int64) for name in edges})
+
+    def update(self, chunk: pd.DataFrame) -> "HistogramSummary":
+        for name, edges in self.edges.items():
+            values = chunk[name].to_numpy(dtype=float, na_value=np.nan)
+            self.counts[name] += np.histogram(values[~np.isnan(values)], bins=edges)[0]
+        return self
+
+    def merge(self, other: "HistogramSummary") -> "HistogramSummary":
+        for name, counts in other.counts.items():
+            if not np.array_equal(self.edges[name], other.edges[name]):
+                raise ValueError(f"Cannot merge histograms of {name!r} with different bin edges")
+            self.counts[name] += counts
+        return self
+
+
+def _ranges(chunks, columns) -> dict:
+    moments = Moments(len(columns))
+    for chunk in chunks:
+        moments.update(chunk[columns].to_numpy(dtype=float, na_value=np.nan))
+    return {name: (moments.min[i], moments.max[i]) for i, name in enumerate(columns)}
+
+
+def histogram_summary(data, columns=None, bins: int = 10, ranges: dict | None = None) -> HistogramSummary:
+    """Bin counts of ``df.hist(bins=...)`` for every numeric column.
+
+    ``data`` is a DataFrame or a list (or other re-iterable) of chunks, read
+    twice: min/max, then counts. A one-shot iterator such as
+    ``pd.read_csv(..., chunksize=...)`` is accepted only together with
+    ``columns`` and ``ranges`` (``{column: (min, max)}``), which need one pass.
+    """
+    if columns is None or ranges is None:
+        _require_reiterable(data, "histogram_summary without columns and ranges", "histogram_summary_csv")
+    chunks = [data] if isinstance(data, pd.DataFrame) else data
+    if columns is None:
+        first = next(iter(chunks), None)
+        columns = list(first.select_dtypes(include="number").columns) if first is not None else []
+    summary = HistogramSummary.from_ranges(ranges or _ranges(chunks, list(columns)), bins)
+    for chunk in chunks:
+        summary.update(chunk)
+    return summary
+
+
+def histogram_summary_csv(path, columns=None, bins: int = 10, chunksize: int = 100_000, renames: dict | None = None, **read_csv_kwargs) -> HistogramSummary:
+    """:func:`histogram_summary` of a CSV read ``chunksize`` rows at a time (twice)."""
+    if columns is None:
+        first = next(iter_chunks(path, 1000, renames, **read_csv_kwargs))
+        columns = list(first.select_dtypes(include="number").columns)
+    ranges = _ranges(iter_chunks(path, chunksize, renames, **read_csv_kwargs), list(columns))
+    return histogram_summary(iter_chunks(path, chunksize, renames, **read_csv_kwargs), columns, bins, ranges)
+
+
+# -- drawing ---------------------------------------------------------------
+
+
+def plot_boxplot(summary: BoxSummary, palette=None, title: str | None = None, figsize=(6.4, 4.8), ax=None):
+    """The boxplot of ``summary``; returns the figure."""
+    from matplotlib.figure import Figure
+
+    if ax is None:
+        ax = Figure(figsize=figsize).add_subplot()
+    stats = summary.bxp_stats()
+    boxes = ax.bxp(stats, patch_artist=True, showfliers=True)
+    if palette is not None:
+        import seaborn as sns
+
+        colors = sns.color_palette(palette, len(stats))
+        for box, color in zip(boxes["boxes"], colors):
+            box.set_facecolor(color)
+    ax.set_xlabel(summary.x)
+    ax.set_ylabel(summary.y)
+    if title:
+        ax.set_title(title)
+    return ax.figure
+
+
+def plot_histograms(summary: HistogramSummary, figsize=(15, 10), columns=None):
+    """The ``df.hist()`` grid of ``summary``; returns the figure."""
+    from matplotlib.figure import Figure
+
+    columns = list(columns) if columns is not None else list(summary.edges)
+    n_cols = int(np.ceil(np.sqrt(len(columns))))
+    n_rows = int(np.ceil(len(columns) / n_cols))
+    figure = Figure(figsize=figsize)
+    for i, name in enumerate(columns):
+        ax = figure.add_subplot(n_rows, n_cols, i + 1)
+        ax.stairs(summary.counts[name], summary.edges[name], fill=True)
+        ax.set_title(name)
+        ax.grid(True)
+    figure.subplots_adjust(hspace=0.4, wspace=0.3)
+    return figure
@@ -0,0 +1,275 @@
+"""Profile of a frame, computed in one pass over its column arrays.
+
+The wine section scans the whole frame once per cell: ``describe()`` twice,
+``isnull().sum()``, ``isna().mean()``, ``info()``, ``duplicated()`` twice,
+``corr()`` twice and ``value_counts()`` twice. :func:`profile` takes each
+column's array out of the frame once and derives everything from it before
+moving on: the null mask, the moments, min/max and the percentiles
+(``np.partition`` at just those ranks, no full sort), the frequencies (one
+hash-table pass), the column's share of every row's duplicate fingerprint,
+and its column of the matrix the correlations are computed from. The
+returned :class:`ProfileReport` then answers each of those cells without
+touching the frame again.
+
+Each statistic is still its own NumPy call over the array taken out for the
+column; what is fused is the read of the frame. ``python -m
+benchmarks.bench_profile`` measures the column reads of both versions.
+"""
+
+from __future__ import annotations
+
+import io
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from .duplicates import RowHasher
+from .streaming import CoMoments
+
+PERCENTILES = (0.25, 0.5, 0.75)
+
+
+def _percentile_label(q: float) -> str:
+    return f"{q * 100:g}%"
+
+
+def _select(values: np.ndarray, qs) -> tuple[float, float, list[float]]:
+    """Min, max and linearly interpolated quantiles (pandas' default) of ``values``.
+
+    Only the ranks the quantiles need are put in place, by partitioning one
+    copy at each rank in turn, each time only the part above the previous
+    rank. Single-rank ``partition`` calls take NumPy's fast selection path,
+    which a multi-rank call does not.
+    """
+    n = len(values)
+    if n == 0:
+        return np.nan, np.nan, [np.nan] * len(qs)
+    positions = [q * (n - 1) for q in qs]
+    selected = values.copy()
+    placed = {}
+    start = 0
+    for rank in sorted({int(np.floor(pos)) for pos in positions}):
+        selected[start:].partition(rank - start)
+        placed[rank] = selected[rank]
+        # The next value up is the smallest of the rest
+        placed[rank + 1] = selected[rank + 1:].min() if rank + 1 < n else selected[rank]
+        start = rank + 1
+    quantiles = []
+    for pos in positions:
+        lo = int(np.floor(pos))
+        hi = min(lo + 1, n - 1)
+        quantiles.append(float(placed[lo] + (placed[hi] - placed[lo]) * (pos - lo)))
+    return float(values.min()), float(values.max()), quantiles
+
+
+@dataclass
+class ColumnStats:
+    name: str
+    dtype: np.dtype
+    count: int
+    nulls: int
+    numeric: bool
+    mean: float = np.nan
+    std: float = np.nan
+    min: float = np.nan
+    max: float = np.nan
+    percentiles: dict = field(default_factory=dict)
+    unique: int = 0
+    top: object = None
+    freq: int = 0
+    value_counts: pd.Series | None = None
+
+
+def _is_numeric(dtype) -> bool:
+    return pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+
+
+def _column_stats(name, values: np.ndarray, dtype, percentiles, hasher: RowHasher, matrix_column: np.ndarray | None) -> ColumnStats:
+    """Every statistic of one column from its array, which is not read again afterwards.
+
+    Also adds the column to the row fingerprints and, for a numeric column,
+    fills ``matrix_column`` (NaN where missing) for the correlations.
+    """
+    if values.dtype.kind == "f":
+        nulls_mask = np.isnan(values)
+    elif values.dtype.kind in "iub":
+        nulls_mask = None
+    else:
+        nulls_mask = pd.isna(values)
+    nulls = int(nulls_mask.sum()) if nulls_mask is not None else 0
+    present = values[~nulls_mask] if nulls else values
+    stats = ColumnStats(name, dtype, len(values) - nulls, nulls, _is_numeric(dtype))
+    hasher.add(values)
+
+    codes, uniques = pd.factorize(present)
+    counts = np.bincount(codes, minlength=len(uniques))
+    stats.unique = len(uniques)
+    if stats.numeric:
+        floats = present.astype(float, copy=False)
+        if len(floats):
+            stats.mean = float(floats.mean())
+            stats.std = float(floats.std(ddof=1)) if len(floats) > 1 else np.nan
+        stats.min, stats.max, quantiles = _select(floats, percentiles)
+        stats.percentiles = dict(zip(percentiles, quantiles))
+        if nulls:
+            matrix_column[nulls_mask] = np.nan
+            matrix_column[~nulls_mask] = floats
+        else:
+            matrix_column[:] = floats
+        stats.value_counts = _counts_series(np.asarray(uniques), counts, name, dtype)
+    else:
+        stats.value_counts = _counts_series(np.asarray(uniques, dtype=object), counts, name)
+        if len(uniques):
+            stats.top = stats.value_counts.index[0]
+            stats.freq = int(stats.value_counts.iloc[0])
+    return stats
+
+
+def _counts_series(uniques, counts, name, dtype=None) -> pd.Series:
+    order = np.argsort(-counts, kind="stable")
+    result = pd.Series(counts[order].astype("int64"), index=pd.Index(uniques[order], name=name, dtype=dtype), name="count")
+    return result
+
+
+@dataclass
+class ProfileReport:
+    """Everything the wine "Initial Review"/"Missing Values"/"Duplicates"/
+    "Correlation" cells print, computed once by :func:`profile`."""
+
+    frame: pd.DataFrame = field(repr=False)
+    columns: dict
+    duplicate_mask: np.ndarray = field(repr=False)
+    correlation: pd.DataFrame = field(repr=False)
+    percentiles: tuple = PERCENTILES
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.frame.shape
+
+    @property
+    def dtypes(self) -> pd.Series:
+        return pd.Series({name: stats.dtype for name, stats in self.columns.items()})
+
+    def describe(self, include=None) -> pd.DataFrame:
+        """Same table as ``df.describe(include=...)`` for ``None``, ``"int"``,
+        ``"float"``, ``"number"``, ``"object"`` and ``"all"``."""
+        if include in (None, "number"):
+            stats = [s for s in self.columns.values() if s.numeric]
+        elif include == "all":
+            stats = list(self.columns.values())
+        elif include == "object":
+            stats = [s for s in self.columns.values() if not s.numeric]
+        elif include in ("int", "float"):
+            kinds = "iu" if include == "int" else "f"
+            stats = [s for s in self.columns.values() if s.numeric and np.dtype(s.dtype).kind in kinds]
+        else:
+            raise ValueError(f"Unsupported include={include!r}")
+
+        labels = [_percentile_label(q) for q in self.percentiles]
+        numeric_rows = ["count", "mean", "std", "min", *labels, "max"]
+        object_rows = ["count", "unique", "top", "freq"]
+        if all(s.numeric for s in stats):
+            rows = numeric_rows
+        elif not any(s.numeric for s in stats):
+            rows = object_rows
+        else:
+            rows = ["count", "unique", "top", "freq", "mean", "std", "min", *labels, "max"]
+
+        table = {}
+        for s in stats:
+            values = {"count": float(s.count) if rows is numeric_rows else s.count}
+            if s.numeric:
+                values.update(mean=s.mean, std=s.std, min=s.min, max=s.max)
+                values.update({label: s.percentiles[q] for label, q in zip(labels, self.percentiles)})
+            else:
+                values.update(unique=s.unique, top=s.top, freq=s.freq)
+            table[s.name] = [values.get(row, np.nan) for row in rows]
+        return pd.DataFrame(table, index=rows)
+
+    def isnull_sum(self) -> pd.Series:
+        return pd.Series({name: s.nulls for name, s in self.columns.items()}, dtype="int64")
+
+    def isna_mean(self) -> pd.Series:
+        n = len(self.frame)
+        return self.isnull_sum() / n if n else self.isnull_sum().astype(float)
+
+    def info(self, buf=None) -> None:
+        """Print the same summary as ``df.info()``."""
+        lines = [str(type(self.frame))]
+        index = self.frame.index
+        if isinstance(index, pd.RangeIndex) and len(index):
+            lines.append(f"RangeIndex: {len(index)} entries, {index[0]} to {index[-1]}")
+        else:
+            lines.append(f"{type(index).__name__}: {len(index)} entries")
+        lines.append(f"Data columns (total {len(self.columns)} columns):")
+        width = max([len("Column")] + [len(str(name)) for name in self.columns])
+        lines.append(f" #   {'Column':<{width}}  Non-Null Count  Dtype")
+        lines.append(f"---  {'-' * width}  --------------  -----")
+        for i, (name, s) in enumerate(self.columns.items()):
+            lines.append(f" {i:<3} {str(name):<{width}}  {f'{s.count} non-null':<14}  {s.dtype}")
+        kinds = self.dtypes.astype(str).value_counts().sort_index()
+        lines.append("dtypes: " + ", ".join(f"{dtype}({count})" for dtype, count in kinds.items()))
+        memory = self.frame.memory_usage(index=True, deep=False).sum()
+        # Object columns are not measured deeply, hence the "+" like pandas
+        deep = any(np.dtype(s.dtype) == object for s in self.columns.values() if isinstance(s.dtype, np.dtype))
+        lines.append(f"memory usage: {memory / 1024:.1f}{'+' if deep else ''} KB")
+        print("\n".join(lines), file=buf)
+
+    def duplicated(self) -> pd.Series:
+        return pd.Series(self.duplicate_mask, index=self.frame.index)
+
+    @property
+    def duplicate_count(self) -> int:
+        return int(self.duplicate_mask.sum())
+
+    def duplicate_rows(self) -> pd.DataFrame:
+        """Same as ``df[df.duplicated()]``."""
+        return self.frame[self.duplicate_mask]
+
+    def corr(self) -> pd.DataFrame:
+        return self.correlation
+
+    def value_counts(self, column: str) -> pd.Series:
+        """Same as ``df[column].value_counts()``."""
+        return self.columns[column].value_counts
+
+    def unique(self, column: str) -> np.ndarray:
+        return self.columns[column].value_counts.index.to_numpy()
+
+    def summary(self) -> str:
+        buf = io.StringIO()
+        self.info(buf=buf)
+        return buf.getvalue()
+
+
+def profile(df: pd.DataFrame, percentiles=PERCENTILES) -> ProfileReport:
+    """Profile ``df`` once for every cell :class:`ProfileReport` answers.
+
+    >>> report = profile(red_wine_data)
+    >>> report.describe(); report.isnull_sum(); report.duplicate_count; report.corr()
+    """
+    percentiles = tuple(percentiles)
+    numeric = [name for name, dtype in df.dtypes.items() if _is_numeric(dtype)]
+    matrix = np.empty((len(df), len(numeric)), order="F")
+    positions = {name: j for j, name in enumerate(numeric)}
+    hasher = RowHasher(len(df), len(df.columns))
+    columns = {}
+    for name, dtype in df.dtypes.items():
+        # The one read of the column; everything below works on this array
+        values = df[name].to_numpy()
+        column = matrix[:, positions[name]] if name in positions else None
+        columns[name] = _column_stats(name, values, dtype, percentiles, hasher, column)
+
+    fingerprints = hasher.fingerprints() if len(df.columns) else np.zeros(len(df), dtype=np.uint64)
+    # A hash-table pass over the fingerprints, like df.duplicated() (keep="first")
+    duplicate_mask = pd.Series(fingerprints).duplicated().to_numpy()
+
+    if np.isnan(matrix).any():
+        matrix = CoMoments.from_values(matrix).corr()
+    else:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            matrix = np.corrcoef(matrix, rowvar=False) if len(matrix) > 1 else np.full((len(numeric),) * 2, np.nan)
+    correlation = pd.DataFrame(np.atleast_2d(matrix), index=numeric, columns=numeric)
+
+    return ProfileReport(df, columns, duplicate_mask, correlation, percentiles)
@@ -0,0 +1,243 @@
+"""Quantiles (medians, ``describe()`` percentiles) over data seen in chunks.
+
+``Series.median()`` and the percentile rows of ``describe()`` sort or
+partition the whole column. :class:`KLLSketch` instead keeps a small,
+fixed-size summary (Karnin, Lang and Liberty's KLL sketch): values go into a
+stack of compactors, and a compactor that fills up is sorted and every other
+item is promoted to the next level with twice the weight. The sketch answers
+any quantile with a rank error of about ``epsilon`` (the fraction of the
+rows the answer may be off by), takes ``O(k log(n / k))`` memory with
+``k ≈ 2 / epsilon``, and two sketches merge into one, so partial sketches
+from chunks, files or worker processes combine freely.
+
+Until its first compaction a sketch holds every value and answers exactly,
+with the same linear interpolation as pandas. :class:`ExactQuantiles` keeps
+every value regardless and is there to validate the sketch.
+
+>>> sketch = KLLSketch.from_error(0.001)
+>>> for chunk in pd.read_csv(TITANIC_URL, chunksize=100_000):
+...     sketch.update(chunk["Fare"])
+>>> round(sketch.median(), 4)
+14.4542
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_K = 200
+MIN_CAPACITY = 8
+SHRINK = 2 / 3  # each level below the top holds 2/3 of the one above it
+
+
+def _as_values(values) -> np.ndarray:
+    values = np.asarray(values, dtype=float).ravel()
+    return values[~np.isnan(values)]
+
+
+def _weighted_quantile(items: np.ndarray, weights: np.ndarray, qs: np.ndarray) -> np.ndarray:
+    order = np.argsort(items, kind="stable")
+    items, weights = items[order], weights[order]
+    # Each item stands for `weight` consecutive ranks; use the middle one
+    centres = np.cumsum(weights) - weights / 2
+    return np.interp(qs * weights.sum(), centres, items)
+
+
+class KLLSketch:
+    """Mergeable quantile sketch of fixed size."""
+
+    def __init__(self, k: int = DEFAULT_K, seed: int | None = None):
+        if k < MIN_CAPACITY:
+            raise ValueError(f"k must be at least {MIN_CAPACITY}")
+        self.k = k
+        self.n = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    @classmethod
+    def from_error(cls, epsilon: float, seed: int | None = None) -> "KLLSketch":
+        """A sketch whose rank error is about ``epsilon`` (e.g. 0.01 for 1%)."""
+        if not 0 < epsilon < 1:
+            raise ValueError("epsilon must be between 0 and 1")
+        return cls(k=max(MIN_CAPACITY, math.ceil(2 / epsilon)), seed=seed)
+
+    @property
+    def exact(self) -> bool:
+        """True while no value has been compacted away."""
+        return len(self.levels) == 1
+
+    @property
+    def size(self) -> int:
+        """Number of values currently stored."""
+        return sum(len(level) for level in self.levels)
+
+    def _capacity(self, height: int) -> int:
+        depth = len(self.levels) - 1 - height
+        return max(MIN_CAPACITY, math.ceil(self.k * SHRINK**depth))
+
+    def update(self, values) -> "KLLSketch":
+        """Add an array/Series of values; NaN is ignored."""
+        values = _as_values(values)
+        if not values.size:
+            return self
+        self.n += values.size
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for height, level in enumerate(other.levels):
+            self.levels[height] = np.concatenate([self.levels[height], level])
+        self.n += other.n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+        return self
+
+    def _compress(self) -> None:
+        compacted = True
+        while compacted:
+            compacted = False
+            for height in range(len(self.levels)):
+                level = self.levels[height]
+                if len(level) <= self._capacity(height):
+                    continue
+                if height + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                level = np.sort(level)
+                # An odd item out stays behind; the rest halves with a random offset
+                leftover = level[len(level) - len(level) % 2:]
+                promoted = level[self._rng.integers(2):len(level) - len(leftover):2]
+                self.levels[height] = leftover
+                self.levels[height + 1] = np.concatenate([self.levels[height + 1], promoted])
+                compacted = True
+
+    def quantile(self, q):
+        """Quantile(s) ``q`` in [0, 1]; NaN for an empty sketch."""
+        qs = np.atleast_1d(np.asarray(q, dtype=float))
+        if self.n == 0:
+            result = np.full(qs.shape, np.nan)
+        elif self.exact:
+            result = np.quantile(self.levels[0], qs)
+        else:
+            result = _weighted_quantile(*self.weighted_items(), qs)
+            result = np.clip(result, self.min, self.max)
+            result[qs <= 0] = self.min
+            result[qs >= 1] = self.max
+        return float(result[0]) if np.ndim(q) == 0 else result
+
+    def median(self) -> float:
+        return self.quantile(0.5)
+
+    def weighted_items(self) -> tuple[np.ndarray, np.ndarray]:
+        """The stored values and the number of rows each one stands for."""
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(level), 2.0**h) for h, level in enumerate(self.levels)])
+        return items, weights
+
+    def rank(self, value: float) -> float:
+        """Approximate fraction of values ``<= value``."""
+        if self.n == 0:
+            return np.nan
+        total = sum(np.count_nonzero(level <= value) * 2.0**h for h, level in enumerate(self.levels))
+        return total / self.n
+
+
+class ExactQuantiles:
+    """Same interface as :class:`KLLSketch` but keeps every value."""
+
+    exact = True
+
+    def __init__(self):
+        self._chunks: list[np.ndarray] = []
+        self.n = 0
+
+    @property
+    def size(self) -> int:
+        return self.n
+
+    def update(self, values) -> "ExactQuantiles":
+        values = _as_values(values)
+        if values.size:
+            self._chunks.append(values)
+            self.n += values.size
+        return self
+
+    def merge(self, other: "ExactQuantiles") -> "ExactQuantiles":
+        self._chunks.extend(other._chunks)
+        self.n += other.n
+        return self
+
+    def quantile(self, q):
+        if self.n == 0:
+            return np.nan if np.ndim(q) == 0 else np.full(np.shape(q), np.nan)
+        values = np.concatenate(self._chunks)
+        self._chunks = [values]
+        return np.quantile(values, q)
+
+    def median(self) -> float:
+        return float(self.quantile(0.5))
+
+    def weighted_items(self) -> tuple[np.ndarray, np.ndarray]:
+        values = np.concatenate(self._chunks) if self._chunks else np.empty(0)
+        self._chunks = [values]
+        return values, np.ones(len(values))
+
+
+def quantile_estimator(epsilon: float | None = None, exact: bool = False, seed: int | None = None):
+    """A :class:`KLLSketch` for ``epsilon`` (default ``k``), or :class:`ExactQuantiles`."""
+    if exact:
+        return ExactQuantiles()
+    if epsilon is None:
+        return KLLSketch(seed=seed)
+    return KLLSketch.from_error(epsilon, seed=seed)
+
+
+def sketch_chunks(chunks, column: str, epsilon: float | None = None, exact: bool = False, seed: int | None = None):
+    """Fold ``column`` of every frame in ``chunks`` into one estimator."""
+    estimator = quantile_estimator(epsilon, exact, seed)
+    for chunk in chunks:
+        estimator.update(chunk[column])
+    return estimator
+
+
+def median(values, epsilon: float | None = None, exact: bool = False) -> float:
+    """Median of an array/Series, or of ``column`` across an iterable of chunks
+    passed as ``(chunks, column)``."""
+    if isinstance(values, tuple):
+        return sketch_chunks(*values, epsilon=epsilon, exact=exact).median()
+    return quantile_estimator(epsilon, exact).update(values).median()
+
+
+def median_absolute_deviation(estimator) -> float:
+    """Median of ``|x - median|`` from the same estimator (no second pass).
+
+    Exact for :class:`ExactQuantiles` and for a sketch that has not
+    compacted; otherwise within the sketch's rank error of the true value.
+    """
+    if estimator.n == 0:
+        return np.nan
+    centre = estimator.median()
+    items, weights = estimator.weighted_items()
+    deviations = np.abs(items - centre)
+    if estimator.exact:
+        return float(np.median(deviations))
+    return float(_weighted_quantile(deviations, weights, np.array([0.5]))[0])
+
+
+def describe_percentiles(sketches: dict, percentiles=(0.25, 0.5, 0.75)) -> pd.DataFrame:
+    """The percentile rows of ``describe()`` from a ``{column: sketch}`` mapping."""
+    labels = [f"{q * 100:g}%" for q in percentiles]
+    return pd.DataFrame(
+        {name: sketch.quantile(np.asarray(percentiles)) for name, sketch in sketches.items()},
+        index=labels,
+    )
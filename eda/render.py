@@ -0,0 +1,224 @@
+"""Render the EDA figures in parallel, headless.
+
+The script draws the histogram grid, the correlation heatmap, three
+countplots (two of them identical), the pair plot and the quality-vs-alcohol
+boxplot one after another on one core. Here each figure is a
+:class:`FigureSpec`; identical specs are rendered once (the duplicates get
+links to the same files), and the rest are spread over a process pool whose
+workers use the Agg backend and receive the frames once, at start-up. Every
+figure is written as PNG and/or SVG and its render time is recorded, so the
+wall time of the whole report approaches that of the slowest figure.
+``summary=True`` on a ``hist`` or ``boxplot`` spec draws it from
+:mod:`eda.plotstats` summaries instead of the raw rows.
+
+>>> report = render_figures(wine_report_specs(), {"wine": red_wine_data}, "figures/")
+>>> report.timings
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+import pandas as pd
+
+_frames: dict = {}
+
+# Heaviest kinds first, so the pool is not left waiting on a late pair plot
+RENDER_ORDER = {"pairplot": 0, "hist": 1, "heatmap": 2}
+
+
+@dataclass(frozen=True)
+class FigureSpec:
+    """What to draw: a plot kind, its options and the frame it reads."""
+
+    name: str
+    kind: str
+    dataset: str = "wine"
+    options: tuple = ()
+    figsize: tuple = (12, 8)
+
+    @property
+    def key(self) -> tuple:
+        """Specs with the same key produce the same image."""
+        return self.kind, self.dataset, self.options, self.figsize
+
+
+def spec(name: str, kind: str, dataset: str = "wine", figsize=(12, 8), **options) -> FigureSpec:
+    def freeze(value):
+        return tuple(value) if isinstance(value, list) else value
+
+    return FigureSpec(name, kind, dataset, tuple(sorted((k, freeze(v)) for k, v in options.items())), tuple(figsize))
+
+
+def wine_report_specs() -> list[FigureSpec]:
+    """The figures of the wine section, in script order (duplicate countplot included)."""
+    return [
+        spec("histograms", "hist", bins=10, figsize=(15, 10)),
+        spec("correlation_heatmap", "heatmap", cmap="bwr", annot=True, figsize=(16, 12)),
+        spec("quality_countplot", "countplot", x="quality"),
+        spec("quality_countplot_again", "countplot", x="quality"),
+        spec("quality_countplot_palette", "countplot", x="quality", palette=["red", "blue", "green", "black", "yellow", "purple"]),
+        spec("pairplot", "pairplot"),
+        spec("quality_vs_alcohol_boxplot", "boxplot", x="quality", y="alcohol", palette="GnBu_d", title="BoxPlot of Quality vs Alcohol", figsize=(6.4, 4.8)),
+    ]
+
+
+def dedupe(specs) -> tuple[list[FigureSpec], dict]:
+    """Unique specs, plus ``{kept name: [names it also stands for]}``."""
+    unique, aliases, by_key = [], {}, {}
+    for s in specs:
+        if s.key in by_key:
+            aliases[by_key[s.key]].append(s.name)
+        else:
+            by_key[s.key] = s.name
+            aliases[s.name] = []
+            unique.append(s)
+    return unique, aliases
+
+
+# -- renderers (run inside the workers) ---------------------------------------
+
+
+def draw_figure(df: pd.DataFrame, figure_spec: FigureSpec):
+    """Draw ``figure_spec`` from ``df`` and return the matplotlib figure."""
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    options = dict(figure_spec.options)
+    if options.get("summary") and figure_spec.kind in ("hist", "boxplot"):
+        from .plotstats import box_summary, histogram_summary, plot_boxplot, plot_histograms
+
+        if figure_spec.kind == "hist":
+            return plot_histograms(histogram_summary(df, bins=options.get("bins", 10)), figsize=figure_spec.figsize)
+        box = box_summary(df, x=options["x"], y=options["y"])
+        return plot_boxplot(box, palette=options.get("palette"), title=options.get("title"), figsize=figure_spec.figsize)
+    if figure_spec.kind == "hist":
+        axes = df.hist(bins=options.get("bins", 10), figsize=figure_spec.figsize)
+        return axes.ravel()[0].figure
+    if figure_spec.kind == "pairplot":
+        from .pairplot import render_pairplot
+
+        return render_pairplot(df, **options)
+
+    figure, ax = plt.subplots(figsize=figure_spec.figsize)
+    if figure_spec.kind == "heatmap":
+        sns.heatmap(df.corr(numeric_only=True), cmap=options.get("cmap"), annot=options.get("annot", False), ax=ax)
+    elif figure_spec.kind == "countplot":
+        palette = options.get("palette")
+        x = df[options["x"]]
+        sns.countplot(x=x, hue=x if palette else None, palette=list(palette) if isinstance(palette, tuple) else palette, legend=False, ax=ax)
+    elif figure_spec.kind == "boxplot":
+        x, y = df[options["x"]], df[options["y"]]
+        sns.boxplot(x=x, y=y, hue=x, palette=options.get("palette"), legend=False, ax=ax)
+    else:
+        raise ValueError(f"Unknown figure kind {figure_spec.kind!r}")
+    if "title" in options:
+        ax.set_title(options["title"])
+    return figure
+
+
+def _init_worker(frames: dict, headless: bool = True) -> None:
+    if headless:
+        import matplotlib
+
+        matplotlib.use("Agg")
+    _frames.update(frames)
+
+
+def _render_one(figure_spec: FigureSpec, out_dir: str, formats: tuple, frames: dict | None = None) -> dict:
+    """Render one figure; ``frames`` defaults to the ones the worker was started with."""
+    import matplotlib.pyplot as plt
+
+    start, cpu_start = time.perf_counter(), time.process_time()
+    figure = draw_figure((_frames if frames is None else frames)[figure_spec.dataset], figure_spec)
+    paths = []
+    for fmt in formats:
+        path = Path(out_dir) / f"{figure_spec.name}.{fmt}"
+        figure.savefig(path, format=fmt, bbox_inches="tight")
+        paths.append(str(path))
+    plt.close(figure)
+    return {
+        "name": figure_spec.name,
+        "kind": figure_spec.kind,
+        "seconds": time.perf_counter() - start,
+        "cpu_seconds": time.process_time() - cpu_start,
+        "pid": os.getpid(),
+        "paths": paths,
+    }
+
+
+def _link_aliases(figure: dict, aliases: list, out_dir: Path) -> None:
+    """Give each alias the rendered files under its own name (hard link, else a copy)."""
+    for path in map(Path, figure["paths"]):
+        for alias in aliases:
+            target = out_dir / f"{alias}{path.suffix}"
+            target.unlink(missing_ok=True)
+            try:
+                os.link(path, target)
+            except OSError:
+                shutil.copyfile(path, target)
+
+
+# -- pipeline -----------------------------------------------------------------
+
+
+@dataclass
+class RenderReport:
+    wall_seconds: float
+    workers: int
+    figures: list = field(default_factory=list)
+    aliases: dict = field(default_factory=dict)
+
+    @property
+    def timings(self) -> pd.DataFrame:
+        table = pd.DataFrame(self.figures, columns=["name", "kind", "seconds", "cpu_seconds", "pid", "paths"])
+        table["also_serves"] = table["name"].map(lambda name: self.aliases.get(name, []))
+        return table.sort_values("seconds", ascending=False, ignore_index=True)
+
+    @property
+    def slowest_seconds(self) -> float:
+        return max((f["seconds"] for f in self.figures), default=0.0)
+
+    def write(self, path) -> Path:
+        path = Path(path)
+        path.write_text(json.dumps(asdict(self), indent=2))
+        return path
+
+
+def render_figures(specs, frames: dict, out_dir, formats=("png",), workers: int | None = None) -> RenderReport:
+    """Render ``specs`` against ``frames`` (``{dataset name: DataFrame}``) into ``out_dir``.
+
+    ``workers=1`` renders in this process; otherwise a process pool of
+    ``workers`` (default: one per CPU, at most one per figure) is used. A
+    spec that duplicates another is not drawn again; its files are hard links
+    to (or copies of) the first one's, under its own name, and the report
+    lists it in ``also_serves``. A ``render-report.json`` with the timings is
+    written next to the images.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    unique, aliases = dedupe(specs)
+    formats = tuple(formats)
+    unique.sort(key=lambda s: RENDER_ORDER.get(s.kind, len(RENDER_ORDER)))
+    workers = workers or min(len(unique), os.cpu_count() or 1) or 1
+
+    start = time.perf_counter()
+    if workers == 1:
+        # Keep whatever backend this session uses (only the workers are forced
+        # to Agg), and pass the frames so none stay referenced afterwards
+        figures = [_render_one(s, str(out_dir), formats, frames) for s in unique]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(frames,)) as pool:
+            futures = [pool.submit(_render_one, s, str(out_dir), formats) for s in unique]
+            figures = [future.result() for future in futures]
+    for figure in figures:
+        _link_aliases(figure, aliases.get(figure["name"], []), out_dir)
+    report = RenderReport(time.perf_counter() - start, workers, figures, aliases)
+    report.write(out_dir / "render-report.json")
+    return report
@@ -0,0 +1,204 @@
+"""Run the EDA profile over many datasets at once.
+
+The script handles the red wine data and then the Titanic data, one after the
+other, although the wine source also has a white-wine table. :func:`run_all`
+takes a list of :class:`DatasetSpec` and overlaps the work: a thread pool
+downloads/reads the CSVs (I/O bound, through the shared dataset cache, whose
+index updates are locked), and as soon as a table is loaded it goes to a
+process pool that profiles it (:func:`eda.profile.profile`) and, if asked,
+draws its figures headless. The per-dataset results are collected into one
+:class:`CombinedReport`.
+
+>>> report = run_all(DEFAULT_DATASETS, out_dir="report/")
+>>> report.summary
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from urllib.parse import urlparse
+
+import pandas as pd
+
+from .loaders import RED_WINE_URL, TITANIC_URL, WHITE_WINE_URL, WINE_RENAMES, fetch
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    """Where a table lives and how to read and clean it."""
+
+    name: str
+    source: str  # URL or local path
+    sep: str = ","
+    renames: dict = field(default_factory=dict)
+    target: str | None = None
+
+
+DEFAULT_DATASETS = [
+    DatasetSpec("red_wine", RED_WINE_URL, sep=";", renames=WINE_RENAMES, target="quality"),
+    DatasetSpec("white_wine", WHITE_WINE_URL, sep=";", renames=WINE_RENAMES, target="quality"),
+    DatasetSpec("titanic", TITANIC_URL, target="Survived"),
+]
+
+
+@dataclass
+class DatasetResult:
+    name: str
+    shape: tuple = (0, 0)
+    describe: pd.DataFrame | None = None
+    nulls: pd.Series | None = None
+    duplicates: int = 0
+    corr: pd.DataFrame | None = None
+    target_counts: pd.Series | None = None
+    figures: list = field(default_factory=list)
+    load_seconds: float = 0.0
+    profile_seconds: float = 0.0
+    error: str | None = None
+
+
+def load_dataset(spec: DatasetSpec) -> pd.DataFrame:
+    """Read ``spec.source`` (through the dataset cache for URLs) and apply its renames."""
+    source = spec.source.strip()
+    path = fetch(source) if urlparse(source).scheme in ("http", "https") else Path(source)
+    df = pd.read_csv(path, sep=spec.sep)
+    return df.rename(columns=spec.renames) if spec.renames else df
+
+
+def _init_worker() -> None:
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+
+def profile_dataset(spec: DatasetSpec, df: pd.DataFrame, out_dir: str | None = None) -> DatasetResult:
+    """Profile one loaded table (runs in a worker process)."""
+    from .profile import profile
+
+    start = time.perf_counter()
+    report = profile(df)
+    result = DatasetResult(
+        spec.name,
+        shape=df.shape,
+        describe=report.describe(),
+        nulls=report.isnull_sum(),
+        duplicates=report.duplicate_count,
+        corr=report.corr(),
+        target_counts=report.value_counts(spec.target) if spec.target else None,
+    )
+    if out_dir is not None:
+        result.figures = _draw_figures(spec, df, Path(out_dir) / spec.name)
+    result.profile_seconds = time.perf_counter() - start
+    return result
+
+
+def _draw_figures(spec: DatasetSpec, df: pd.DataFrame, out_dir: Path) -> list[str]:
+    import matplotlib.pyplot as plt
+
+    from .render import draw_figure, spec as figure_spec
+
+    specs = [
+        figure_spec("histograms", "hist", spec.name, bins=10, figsize=(15, 10)),
+        figure_spec("correlation_heatmap", "heatmap", spec.name, cmap="bwr", annot=True, figsize=(16, 12)),
+    ]
+    if spec.target:
+        specs.append(figure_spec(f"{spec.target}_countplot", "countplot", spec.name, x=spec.target))
+    out_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for s in specs:
+        figure = draw_figure(df, s)
+        path = out_dir / f"{s.name}.png"
+        figure.savefig(path, bbox_inches="tight")
+        plt.close(figure)
+        paths.append(str(path))
+    return paths
+
+
+@dataclass
+class CombinedReport:
+    results: dict  # name -> DatasetResult
+    wall_seconds: float
+
+    @property
+    def summary(self) -> pd.DataFrame:
+        rows = []
+        for result in self.results.values():
+            rows.append({
+                "dataset": result.name,
+                "rows": result.shape[0],
+                "columns": result.shape[1],
+                "missing_values": int(result.nulls.sum()) if result.nulls is not None else None,
+                "duplicates": result.duplicates,
+                "load_s": result.load_seconds,
+                "profile_s": result.profile_seconds,
+                "error": result.error,
+            })
+        return pd.DataFrame(rows).set_index("dataset")
+
+    def __getitem__(self, name: str) -> DatasetResult:
+        return self.results[name]
+
+    def write(self, out_dir) -> Path:
+        """Write ``summary.csv`` plus each dataset's tables as CSV under ``out_dir``."""
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        self.summary.to_csv(out_dir / "summary.csv")
+        for result in self.results.values():
+            if result.error:
+                continue
+            folder = out_dir / result.name
+            folder.mkdir(exist_ok=True)
+            result.describe.to_csv(folder / "describe.csv")
+            result.nulls.rename("missing").to_csv(folder / "missing.csv")
+            result.corr.to_csv(folder / "corr.csv")
+            if result.target_counts is not None:
+                result.target_counts.to_csv(folder / "target_counts.csv")
+        (out_dir / "timings.json").write_text(json.dumps({"wall_seconds": self.wall_seconds}, indent=2))
+        return out_dir
+
+
+def run_all(specs=DEFAULT_DATASETS, io_workers: int = 8, cpu_workers: int | None = None, out_dir=None) -> CombinedReport:
+    """Load every dataset in a thread pool and profile each in a process pool.
+
+    A dataset that fails to load or profile gets its traceback in
+    ``DatasetResult.error``; the others still complete.
+    """
+    specs = list(specs)
+    cpu_workers = cpu_workers or min(len(specs), os.cpu_count() or 1) or 1
+    figure_dir = str(out_dir) if out_dir is not None else None
+    results: dict = {}
+    start = time.perf_counter()
+
+    def timed_load(spec):
+        load_start = time.perf_counter()
+        return load_dataset(spec), time.perf_counter() - load_start
+
+    with ThreadPoolExecutor(max_workers=io_workers) as loaders, ProcessPoolExecutor(max_workers=cpu_workers, initializer=_init_worker) as workers:
+        pending = {loaders.submit(timed_load, spec): ("load", spec) for spec in specs}
+        load_times = {}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage, spec = pending.pop(future)
+                try:
+                    outcome = future.result()
+                except Exception:
+                    results[spec.name] = DatasetResult(spec.name, error=traceback.format_exc())
+                    continue
+                if stage == "load":
+                    df, load_times[spec.name] = outcome
+                    pending[workers.submit(profile_dataset, spec, df, figure_dir)] = ("profile", spec)
+                else:
+                    outcome.load_seconds = load_times[spec.name]
+                    results[spec.name] = outcome
+
+    ordered = {spec.name: results[spec.name] for spec in specs}
+    report = CombinedReport(ordered, time.perf_counter() - start)
+    if out_dir is not None:
+        report.write(out_dir)
+    return report
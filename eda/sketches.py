@@ -0,0 +1,287 @@
+"""Small, mergeable probabilistic summaries over 64-bit fingerprints.
+
+Both structures take ``uint64`` hashes (see
+:func:`eda.duplicates.row_fingerprints`) rather than raw values, work on
+whole NumPy arrays at a time and merge across chunks or worker processes.
+
+* :class:`HyperLogLog` estimates the number of distinct items with a
+  relative standard error of ``1.04 / sqrt(2 ** precision)`` (0.81% at the
+  default precision of 14, using 16 KiB).
+* :class:`BloomFilter` answers "seen before?" with no false negatives and a
+  false-positive rate close to the one it was sized for.
+* :class:`DistinctCounter` counts distinct fingerprints exactly while there
+  are at most ``exact_limit`` of them and switches to a HyperLogLog beyond.
+* :class:`CountMinSketch` estimates how often each item occurred; estimates
+  never undercount and overcount by at most ``epsilon * total`` with
+  probability ``1 - delta``, in ``ceil(e / epsilon) * ceil(ln(1 / delta))``
+  counters.
+* :class:`MisraGries` keeps the ``k`` most frequent *values* (not
+  fingerprints, so it can report them) with counts that are never too high
+  and at most :attr:`MisraGries.max_error` (``<= total / (k + 1)``) too low;
+  it is exact while there are at most ``k`` distinct values.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pandas as pd
+
+_ONE = np.uint64(1)
+
+
+def _bit_length_u32(values: np.ndarray) -> np.ndarray:
+    """Bit length of each value in a uint64 array holding 32-bit numbers."""
+    result = np.zeros(values.shape, dtype=np.int64)
+    nonzero = values > 0
+    # float64 represents every 32-bit integer exactly, so log2 is safe here
+    result[nonzero] = np.floor(np.log2(values[nonzero].astype(np.float64))).astype(np.int64) + 1
+    return result
+
+
+def leading_zeros(values: np.ndarray) -> np.ndarray:
+    """Number of leading zero bits of each uint64."""
+    values = np.asarray(values, dtype=np.uint64)
+    high = values >> np.uint64(32)
+    low = values & np.uint64(0xFFFFFFFF)
+    return np.where(high > 0, 32 - _bit_length_u32(high), 64 - _bit_length_u32(low))
+
+
+class HyperLogLog:
+    """Distinct-count estimator over uint64 fingerprints."""
+
+    def __init__(self, precision: int = 14):
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18")
+        self.precision = precision
+        self.m = 1 << precision
+        self.registers = np.zeros(self.m, dtype=np.uint8)
+
+    @property
+    def relative_error(self) -> float:
+        """Relative standard error of :meth:`count`."""
+        return 1.04 / math.sqrt(self.m)
+
+    def update(self, fingerprints) -> "HyperLogLog":
+        fingerprints = np.asarray(fingerprints, dtype=np.uint64)
+        if not fingerprints.size:
+            return self
+        shift = np.uint64(64 - self.precision)
+        index = (fingerprints >> shift).astype(np.int64)
+        rest = fingerprints << np.uint64(self.precision)
+        rank = np.minimum(leading_zeros(rest) + 1, 64 - self.precision + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+        return self
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLogs of different precision")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def count(self) -> float:
+        m = self.m
+        alpha = {16: 0.673, 32: 0.697, 64: 0.709}.get(m, 0.7213 / (1 + 1.079 / m))
+        estimate = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            # Small-range correction: linear counting over the empty registers
+            estimate = m * math.log(m / zeros)
+        return float(estimate)
+
+
+class BloomFilter:
+    """Bit-packed Bloom filter over uint64 fingerprints."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        if capacity <= 0 or not 0 < error_rate < 1:
+            raise ValueError("capacity must be positive and error_rate between 0 and 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.n_bits = max(64, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.n_hashes = max(1, round(self.n_bits / capacity * math.log(2)))
+        self.bits = np.zeros((self.n_bits + 7) // 8, dtype=np.uint8)
+        self.added = 0
+
+    def _positions(self, fingerprints: np.ndarray) -> np.ndarray:
+        """``n_hashes`` bit positions per fingerprint (Kirsch-Mitzenmacher double hashing)."""
+        h1 = fingerprints & np.uint64(0xFFFFFFFF)
+        h2 = (fingerprints >> np.uint64(32)) | _ONE
+        steps = np.arange(self.n_hashes, dtype=np.uint64)
+        return ((h1[:, None] + steps[None, :] * h2[:, None]) % np.uint64(self.n_bits)).astype(np.int64)
+
+    def contains(self, fingerprints) -> np.ndarray:
+        fingerprints = np.asarray(fingerprints, dtype=np.uint64)
+        positions = self._positions(fingerprints)
+        hits = (self.bits[positions >> 3] >> (positions & 7).astype(np.uint8)) & 1
+        return hits.all(axis=1)
+
+    def add(self, fingerprints) -> "BloomFilter":
+        fingerprints = np.asarray(fingerprints, dtype=np.uint64)
+        positions = self._positions(fingerprints).ravel()
+        np.bitwise_or.at(self.bits, positions >> 3, (1 << (positions & 7)).astype(np.uint8))
+        self.added += len(fingerprints)
+        return self
+
+    def merge(self, other: "BloomFilter") -> "BloomFilter":
+        if (other.n_bits, other.n_hashes) != (self.n_bits, self.n_hashes):
+            raise ValueError("Cannot merge Bloom filters of different shapes")
+        np.bitwise_or(self.bits, other.bits, out=self.bits)
+        self.added += other.added
+        return self
+
+    def false_positive_rate(self) -> float:
+        """Current false-positive probability, from the fraction of bits set."""
+        filled = np.unpackbits(self.bits)[: self.n_bits].mean()
+        return float(filled**self.n_hashes)
+
+
+class DistinctCounter:
+    """Exact distinct count of fingerprints up to ``exact_limit``, HyperLogLog after that."""
+
+    def __init__(self, exact_limit: int = 1 << 16, precision: int = 14):
+        self.exact_limit = exact_limit
+        self.precision = precision
+        self.seen: np.ndarray | None = np.empty(0, dtype=np.uint64)  # None once switched to the sketch
+        self.sketch: HyperLogLog | None = None
+
+    @property
+    def exact(self) -> bool:
+        return self.sketch is None
+
+    @property
+    def relative_error(self) -> float:
+        return 0.0 if self.exact else self.sketch.relative_error
+
+    def _to_sketch(self) -> None:
+        self.sketch = HyperLogLog(self.precision).update(self.seen)
+        self.seen = None
+
+    def update(self, fingerprints) -> "DistinctCounter":
+        fingerprints = np.asarray(fingerprints, dtype=np.uint64)
+        if self.exact:
+            self.seen = np.union1d(self.seen, fingerprints)
+            if len(self.seen) > self.exact_limit:
+                self._to_sketch()
+        else:
+            self.sketch.update(fingerprints)
+        return self
+
+    def merge(self, other: "DistinctCounter") -> "DistinctCounter":
+        if other.exact:
+            return self.update(other.seen)
+        if self.exact:
+            self._to_sketch()
+        self.sketch.merge(other.sketch)
+        return self
+
+    def count(self) -> float:
+        return float(len(self.seen)) if self.exact else self.sketch.count()
+
+
+class CountMinSketch:
+    """Frequency estimates for uint64 fingerprints in a ``depth x width`` counter table."""
+
+    def __init__(self, width: int = 2719, depth: int = 5):
+        if width < 1 or depth < 1:
+            raise ValueError("width and depth must be positive")
+        self.width = width
+        self.depth = depth
+        self.table = np.zeros(depth * width, dtype=np.int64)
+        self.total = 0
+
+    @classmethod
+    def from_error(cls, epsilon: float = 0.001, delta: float = 0.01) -> "CountMinSketch":
+        """Sized so estimates exceed the true count by at most ``epsilon * total``
+        with probability ``1 - delta``."""
+        if not (0 < epsilon < 1 and 0 < delta < 1):
+            raise ValueError("epsilon and delta must be between 0 and 1")
+        return cls(math.ceil(math.e / epsilon), math.ceil(math.log(1 / delta)))
+
+    @property
+    def epsilon(self) -> float:
+        return math.e / self.width
+
+    @property
+    def delta(self) -> float:
+        return math.exp(-self.depth)
+
+    @property
+    def max_error(self) -> float:
+        """Overcount bound (holding with probability ``1 - delta``)."""
+        return self.epsilon * self.total
+
+    def _cells(self, fingerprints: np.ndarray) -> np.ndarray:
+        """One counter per row of the table for each fingerprint, as flat indexes."""
+        h1 = fingerprints & np.uint64(0xFFFFFFFF)
+        h2 = (fingerprints >> np.uint64(32)) | _ONE
+        rows = np.arange(self.depth, dtype=np.uint64)
+        columns = (h1[:, None] + rows[None, :] * h2[:, None]) % np.uint64(self.width)
+        return (rows[None, :] * np.uint64(self.width) + columns).astype(np.int64)
+
+    def update(self, fingerprints, counts=None) -> "CountMinSketch":
+        fingerprints = np.asarray(fingerprints, dtype=np.uint64)
+        counts = np.ones(len(fingerprints), dtype=np.int64) if counts is None else np.asarray(counts, dtype=np.int64)
+        cells = self._cells(fingerprints)
+        weights = np.repeat(counts, self.depth)
+        self.table += np.bincount(cells.ravel(), weights=weights, minlength=self.table.size).astype(np.int64)
+        self.total += int(counts.sum())
+        return self
+
+    def estimate(self, fingerprints) -> np.ndarray:
+        fingerprints = np.asarray(fingerprints, dtype=np.uint64)
+        return self.table[self._cells(fingerprints)].min(axis=1)
+
+    def merge(self, other: "CountMinSketch") -> "CountMinSketch":
+        if (other.width, other.depth) != (self.width, self.depth):
+            raise ValueError("Cannot merge Count-Min sketches of different shapes")
+        self.table += other.table
+        self.total += other.total
+        return self
+
+
+class MisraGries:
+    """Heavy hitters: at most ``k`` counters of values, mergeable across chunks.
+
+    Each chunk is counted exactly (``value_counts``) and folded in with the
+    mergeable-summaries rule: add the counters, and if more than ``k`` are
+    left subtract the ``(k+1)``-th largest count from all of them.
+    """
+
+    def __init__(self, k: int = 1000):
+        if k < 1:
+            raise ValueError("k must be positive")
+        self.k = k
+        self.counters = pd.Series(dtype="int64")
+        self.total = 0
+        self.max_error = 0  # no count is more than this below the true count
+
+    @property
+    def exact(self) -> bool:
+        return self.max_error == 0
+
+    def _add(self, counts: pd.Series) -> "MisraGries":
+        merged = self.counters.add(counts, fill_value=0).astype("int64")
+        if len(merged) > self.k:
+            cut = int(np.partition(merged.to_numpy(), len(merged) - self.k - 1)[len(merged) - self.k - 1])
+            merged = merged[merged > cut] - cut
+            self.max_error += cut
+        self.counters = merged
+        return self
+
+    def update(self, values) -> "MisraGries":
+        values = values if isinstance(values, pd.Series) else pd.Series(values)
+        counts = values.value_counts(dropna=True)
+        self.total += int(counts.sum())
+        return self._add(counts)
+
+    def merge(self, other: "MisraGries") -> "MisraGries":
+        self.total += other.total
+        self.max_error += other.max_error
+        return self._add(other.counters)
+
+    def top(self, n: int | None = None) -> pd.Series:
+        """Counters from most to least frequent (lower bounds of the true counts)."""
+        ordered = self.counters.sort_values(ascending=False, kind="stable")
+        return ordered if n is None else ordered.head(n)
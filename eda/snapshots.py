@@ -0,0 +1,130 @@
+"""Columnar binary snapshots of the cleaned wine and Titanic frames.
+
+Parsing CSV text and redoing the column fix-ups costs the same on every run.
+A snapshot stores the cleaned, typed frame once as uncompressed Arrow IPC
+(Feather v2) or Parquet, and later runs read it back memory-mapped instead.
+
+A Feather snapshot is read without copying where the types allow it. Each
+column is written as one contiguous buffer, and numeric columns without
+missing values become views of the mapped file. Their pages are loaded on
+first access and the kernel can drop them again, so they do not add to the
+process's anonymous memory. Strings stay Arrow-backed. Columns with missing
+values, and every Parquet column, are still decoded into memory.
+
+Snapshots are named after the SHA-256 of the source file in the dataset cache
+(see :mod:`eda.loaders`), so a changed upstream file never serves a stale
+snapshot. Feather/Parquet need ``pyarrow``.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pandas as pd
+
+from .loaders import DEFAULT_CACHE_DIR, RED_WINE_URL, TITANIC_URL, WINE_RENAMES, DatasetCache, default_cache
+
+DEFAULT_SNAPSHOT_DIR = DEFAULT_CACHE_DIR / "snapshots"
+FORMATS = {"feather": ".feather", "parquet": ".parquet"}
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError as err:
+        raise ImportError("Snapshots need pyarrow: pip install pyarrow") from err
+
+
+def write_snapshot(df: pd.DataFrame, path, fmt: str = "feather") -> Path:
+    """Write ``df`` to ``path`` atomically and return the path.
+
+    Feather files are written uncompressed so that they can be memory-mapped
+    without a decode step.
+    """
+    _require_pyarrow()
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".part")
+    df = df.reset_index(drop=True)
+    if fmt == "feather":
+        # One record batch, so every column is a single buffer that can be mapped as is
+        df.to_feather(tmp, compression="uncompressed", chunksize=max(len(df), 1))
+    elif fmt == "parquet":
+        df.to_parquet(tmp, index=False)
+    else:
+        raise ValueError(f"Unknown snapshot format {fmt!r}; expected one of {sorted(FORMATS)}")
+    os.replace(tmp, path)
+    return path
+
+
+def read_snapshot(path, memory_map: bool = True, copy: bool = False) -> pd.DataFrame:
+    """Read a snapshot written by :func:`write_snapshot`.
+
+    By default the null-free numeric columns share Arrow's buffers and are
+    read-only; for a Feather snapshot those buffers are the mapped file, for
+    Parquet the decoded data (which then is not copied a second time).
+    Assigning a column (``df["Age"] = ...``) or writing through a copy works
+    as usual, but an in-place write such as ``df.loc[0, "alcohol"] = 9.5`` on
+    the returned frame raises ``ValueError``. ``copy=True`` gives an ordinary
+    writable frame held in memory.
+    """
+    _require_pyarrow()
+    path = Path(path)
+    if path.suffix == ".parquet":
+        from pyarrow import parquet
+
+        table = parquet.read_table(path, memory_map=memory_map)
+    else:
+        from pyarrow import feather
+
+        table = feather.read_table(path, memory_map=memory_map)
+    if copy:
+        return table.to_pandas()
+    # Convert column by column, releasing each Arrow buffer once it is converted
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def clean_wine(df: pd.DataFrame) -> pd.DataFrame:
+    return df.rename(columns=WINE_RENAMES)
+
+
+def load_snapshotted(
+    url: str,
+    name: str,
+    clean=None,
+    read_csv_kwargs: dict | None = None,
+    cache: DatasetCache | None = None,
+    snapshot_dir=None,
+    fmt: str = "feather",
+    copy: bool = False,
+) -> pd.DataFrame:
+    """Load ``url`` from a snapshot, building the snapshot on the first run.
+
+    ``clean`` is applied to the parsed CSV before it is written, so later
+    runs skip both the parse and the clean-up. The frame always comes from
+    the snapshot, so the first run returns the same read-only views as later
+    ones (see :func:`read_snapshot`; ``copy`` is passed on).
+    """
+    cache = cache or default_cache()
+    source = cache.fetch(url)
+    entry = cache.entry(url)
+    digest = entry["sha256"] if entry else source.stem
+    snapshot_dir = Path(snapshot_dir) if snapshot_dir is not None else DEFAULT_SNAPSHOT_DIR
+    path = snapshot_dir / f"{name}-{digest[:16]}{FORMATS[fmt]}"
+
+    if not path.exists():
+        df = pd.read_csv(source, **(read_csv_kwargs or {}))
+        if clean is not None:
+            df = clean(df)
+        write_snapshot(df, path, fmt=fmt)
+        del df
+    return read_snapshot(path, copy=copy)
+
+
+def load_red_wine_snapshot(**kwargs) -> pd.DataFrame:
+    return load_snapshotted(RED_WINE_URL, "winequality-red", clean=clean_wine, read_csv_kwargs={"sep": ";"}, **kwargs)
+
+
+def load_titanic_snapshot(**kwargs) -> pd.DataFrame:
+    return load_snapshotted(TITANIC_URL, "titanic", **kwargs)
@@ -0,0 +1,218 @@
+"""Per-column memo of derived statistics that survives unrelated in-place edits.
+
+The Titanic tail asks for ``value_counts``, means and medians before and
+after editing one column in place (``Embarked.fillna('S')``) and the wine
+section renames columns in place. :class:`StatsCache` remembers each result
+together with the *version* of every column it was computed from. Editing a
+column through the cache (:meth:`StatsCache.fillna`, :meth:`StatsCache.assign`,
+:meth:`StatsCache.rename`) bumps only that column's version, so the
+``Fare`` median or the ``Age`` mean are still served from the cache after the
+``Embarked`` fill, while ``value_counts("Embarked")`` or a ``corr`` that
+includes a changed column is recomputed.
+
+A column's version also includes the identity of its values (the values
+object, or for NumPy columns the buffer), their length and their dtype, so
+replacing a column directly (``df["Age"] = ...``) or dropping rows is
+noticed too. Writes into the existing values that bypass the cache
+(``df.loc[...] = ...``) cannot be seen; report them with
+:meth:`StatsCache.mutated`.
+
+>>> stats = stats_for(rms_titanic_data)
+>>> stats.value_counts("Embarked"); stats.median("Fare")
+>>> stats.fillna("Embarked", "S")            # only Embarked's results are dropped
+>>> stats.value_counts("Embarked")           # recomputed
+>>> stats.median("Fare")                     # cache hit
+>>> stats.hits, stats.misses
+"""
+
+from __future__ import annotations
+
+import weakref
+
+import numpy as np
+import pandas as pd
+
+_ATTRIBUTE = "_eda_stats_cache"
+
+
+class _Identity:
+    """Equal only for the same values object (and, for NumPy, the same data address).
+
+    The object is held by weak reference, so a replaced column is not kept
+    alive, and its address cannot be mistaken for a new column's: once it is
+    freed, the reference is dead and nothing compares equal to it.
+    """
+
+    __slots__ = ("_ref", "address")
+
+    def __init__(self, values, address: int = 0):
+        try:
+            self._ref = weakref.ref(values)
+        except TypeError:
+            self._ref = lambda values=values: values
+        self.address = address
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, _Identity):
+            return NotImplemented
+        values = self._ref()
+        return values is not None and values is other._ref() and self.address == other.address
+
+
+def _column_token(series: pd.Series) -> tuple:
+    values = series.array
+    if isinstance(values, pd.arrays.NumpyExtensionArray):
+        # A new wrapper every call; the buffer underneath is what identifies the column
+        data = values.to_numpy()
+        root = data
+        while isinstance(root.base, np.ndarray):
+            root = root.base
+        identity = _Identity(root, data.__array_interface__["data"][0])
+    else:
+        # Extension arrays (str, category, nullable ints) are stored as-is
+        identity = _Identity(values)
+    return (identity, len(series), str(series.dtype))
+
+
+def _freeze(kwargs: dict) -> tuple:
+    return tuple(sorted((name, repr(value)) for name, value in kwargs.items()))
+
+
+class StatsCache:
+    """Memoised statistics of one DataFrame, invalidated column by column."""
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self._counters: dict = {}  # column -> number of edits made through the cache
+        self._entries: dict = {}   # (stat, columns, kwargs) -> (versions, value)
+        self.hits = 0
+        self.misses = 0
+
+    # -- versions --------------------------------------------------------
+
+    def version(self, column) -> tuple:
+        return (self._counters.get(column, 0), _column_token(self.df[column]))
+
+    def mutated(self, *columns) -> None:
+        """Record that ``columns`` were changed in place outside the cache."""
+        for column in columns:
+            self._counters[column] = self._counters.get(column, 0) + 1
+
+    def invalidate(self) -> None:
+        """Drop every cached result."""
+        self._entries.clear()
+
+    # -- memo ------------------------------------------------------------
+
+    def get(self, stat: str, columns, compute, **kwargs):
+        """``compute()``'s result, reused while none of ``columns`` has changed.
+
+        ``stat`` and ``kwargs`` identify the statistic; ``compute`` is only
+        called on a miss. pandas results are returned as copies so callers
+        cannot alter the cached value.
+        """
+        columns = tuple(columns)
+        key = (stat, columns, _freeze(kwargs))
+        versions = tuple(self.version(column) for column in columns)
+        cached = self._entries.get(key)
+        if cached is not None and cached[0] == versions:
+            self.hits += 1
+            value = cached[1]
+        else:
+            self.misses += 1
+            value = compute()
+            self._entries[key] = (versions, value)
+        return value.copy() if isinstance(value, (pd.Series, pd.DataFrame)) else value
+
+    def _column_stat(self, stat: str, column, **kwargs):
+        return self.get(stat, [column], lambda: getattr(self.df[column], stat)(**kwargs), **kwargs)
+
+    # -- statistics ------------------------------------------------------
+
+    def value_counts(self, column, **kwargs) -> pd.Series:
+        return self._column_stat("value_counts", column, **kwargs)
+
+    def mean(self, column, **kwargs) -> float:
+        return self._column_stat("mean", column, **kwargs)
+
+    def median(self, column, **kwargs) -> float:
+        return self._column_stat("median", column, **kwargs)
+
+    def std(self, column, **kwargs) -> float:
+        return self._column_stat("std", column, **kwargs)
+
+    def sum(self, column, **kwargs):
+        return self._column_stat("sum", column, **kwargs)
+
+    def min(self, column, **kwargs):
+        return self._column_stat("min", column, **kwargs)
+
+    def max(self, column, **kwargs):
+        return self._column_stat("max", column, **kwargs)
+
+    def nunique(self, column, dropna: bool = True) -> int:
+        return self._column_stat("nunique", column, dropna=dropna)
+
+    def mode(self, column, **kwargs) -> pd.Series:
+        return self._column_stat("mode", column, **kwargs)
+
+    def null_count(self, column) -> int:
+        return self.get("null_count", [column], lambda: int(self.df[column].isna().sum()))
+
+    def isnull_sum(self) -> pd.Series:
+        """Like ``df.isnull().sum()``, reusing the count of every unchanged column."""
+        return pd.Series({column: self.null_count(column) for column in self.df.columns}, dtype=np.int64)
+
+    def corr(self, columns=None, method: str = "pearson") -> pd.DataFrame:
+        """``df[columns].corr()`` (default: all numeric columns)."""
+        if columns is None:
+            columns = [name for name in self.df.columns if pd.api.types.is_numeric_dtype(self.df[name])]
+        columns = list(columns)
+        return self.get("corr", columns, lambda: self.df[columns].corr(method=method), method=method)
+
+    # -- edits -----------------------------------------------------------
+
+    def fillna(self, column, value) -> None:
+        """``df[column]`` with missing values replaced by ``value``, in place."""
+        self.df.fillna({column: value}, inplace=True)
+        self.mutated(column)
+
+    def assign(self, column, values) -> None:
+        """Set ``df[column] = values``."""
+        self.df[column] = values
+        self.mutated(column)
+
+    def rename(self, columns: dict) -> None:
+        """Rename columns in place, keeping what is still valid under the new names.
+
+        Scalar results move to the new name; labelled results (value counts,
+        correlation matrices) carry the old names, so they are dropped.
+        """
+        moved = {
+            key: value
+            for key, (versions, value) in self._entries.items()
+            if any(name in columns for name in key[1])
+            and np.ndim(value) == 0
+            and versions == tuple(self.version(name) for name in key[1])
+        }
+        self.df.rename(columns=columns, inplace=True)
+        self._counters = {columns.get(name, name): count for name, count in self._counters.items()}
+        self._entries = {
+            key: entry for key, entry in self._entries.items() if not any(name in columns for name in key[1])
+        }
+        for (stat, names, kwargs), value in moved.items():
+            renamed = tuple(columns.get(name, name) for name in names)
+            self._entries[(stat, renamed, kwargs)] = (tuple(self.version(name) for name in renamed), value)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def stats_for(df: pd.DataFrame) -> StatsCache:
+    """The :class:`StatsCache` attached to ``df`` (created on first use)."""
+    cache = df.__dict__.get(_ATTRIBUTE)
+    if cache is None:
+        cache = StatsCache(df)
+        # Stored on the object like pandas' cached accessors, bypassing DataFrame.__setattr__
+        object.__setattr__(df, _ATTRIBUTE, cache)
+    return cache
@@ -0,0 +1,303 @@
+"""Chunked EDA profile whose memory is bounded by the chunk size.
+
+The in-memory cells (``describe()``, ``isnull().sum()``,
+``value_counts("quality")``, ``corr()``) need the whole frame. Here the CSV
+is read ``chunksize`` rows at a time and each chunk is folded into small
+accumulators that can also be merged with each other, so partial profiles
+from several files or workers combine into one.
+
+Means, variances and co-moments use the pairwise update of Chan, Golub and
+LeVeque, which stays accurate where naive sums of squares would not.
+Percentiles come from one quantile sketch per column (:mod:`eda.quantiles`).
+Correlations are computed over pairwise-complete rows, like
+``DataFrame.corr()``.
+"""
+
+from __future__ import annotations
+
+import copy
+
+import numpy as np
+import pandas as pd
+
+from .quantiles import describe_percentiles, quantile_estimator
+
+
+class Moments:
+    """Per-column count, mean, sum of squared deviations, min and max."""
+
+    def __init__(self, n_columns: int):
+        self.count = np.zeros(n_columns)
+        self.mean = np.zeros(n_columns)
+        self.m2 = np.zeros(n_columns)
+        self.min = np.full(n_columns, np.inf)
+        self.max = np.full(n_columns, -np.inf)
+
+    def update(self, values: np.ndarray) -> None:
+        """Fold a 2-D float array (rows x columns, NaN for missing) in."""
+        other = Moments(values.shape[1])
+        valid = ~np.isnan(values)
+        other.count = valid.sum(axis=0).astype(float)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            other.mean = np.where(other.count > 0, np.nansum(values, axis=0) / other.count, 0.0)
+            centred = np.where(valid, values - other.mean, 0.0)
+        other.m2 = (centred * centred).sum(axis=0)
+        if values.shape[0]:
+            other.min = np.where(other.count > 0, np.nanmin(np.where(valid, values, np.inf), axis=0), np.inf)
+            other.max = np.where(other.count > 0, np.nanmax(np.where(valid, values, -np.inf), axis=0), -np.inf)
+        self.merge(other)
+
+    def merge(self, other: "Moments") -> "Moments":
+        total = self.count + other.count
+        with np.errstate(invalid="ignore", divide="ignore"):
+            delta = other.mean - self.mean
+            weight = np.where(total > 0, other.count / total, 0.0)
+            self.mean = self.mean + delta * weight
+            self.m2 = self.m2 + other.m2 + np.where(total > 0, delta * delta * self.count * weight, 0.0)
+        self.count = total
+        self.min = np.minimum(self.min, other.min)
+        self.max = np.maximum(self.max, other.max)
+        return self
+
+    @property
+    def variance(self) -> np.ndarray:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(self.count > 1, self.m2 / (self.count - 1), np.nan)
+
+    def take(self, positions) -> "Moments":
+        """The moments of the columns at ``positions`` only."""
+        result = Moments(len(positions))
+        for name in ("count", "mean", "m2", "min", "max"):
+            setattr(result, name, getattr(self, name)[positions])
+        return result
+
+
+class CoMoments:
+    """Pairwise co-moment matrix over rows where both columns are present.
+
+    For every pair ``(i, j)`` it keeps the number of complete rows, the mean
+    of column ``i`` over those rows, the co-moment and the sum of squared
+    deviations of column ``i``. The diagonal therefore holds the plain
+    per-column moments.
+    """
+
+    def __init__(self, n_columns: int):
+        shape = (n_columns, n_columns)
+        self.n = np.zeros(shape)
+        self.mean = np.zeros(shape)  # mean of column i over rows where i and j are present
+        self.comoment = np.zeros(shape)
+        self.m2 = np.zeros(shape)  # squared deviations of column i over the same rows
+
+    @classmethod
+    def from_values(cls, values: np.ndarray) -> "CoMoments":
+        k = values.shape[1]
+        state = cls(k)
+        if not values.shape[0]:
+            return state
+        # Shift by the column means first; co-moments do not depend on the shift
+        present = (~np.isnan(values)).astype(float)
+        counts = present.sum(axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            shift = np.where(counts > 0, np.nansum(values, axis=0) / counts, 0.0)
+        x = np.where(present > 0, values - shift, 0.0)
+
+        n = present.T @ present
+        sum_x = x.T @ present  # [i, j]: sum of column i where j is present
+        sum_xx = (x * x).T @ present
+        sum_xy = x.T @ x
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(n > 0, sum_x / n, 0.0)
+            state.comoment = np.where(n > 0, sum_xy - sum_x * sum_x.T / n, 0.0)
+            state.m2 = np.where(n > 0, sum_xx - sum_x * sum_x / n, 0.0)
+        state.n = n
+        state.mean = mean + shift[:, None]
+        return state
+
+    def update(self, values: np.ndarray) -> None:
+        self.merge(CoMoments.from_values(values))
+
+    def merge(self, other: "CoMoments") -> "CoMoments":
+        total = self.n + other.n
+        with np.errstate(invalid="ignore", divide="ignore"):
+            delta = other.mean - self.mean
+            factor = np.where(total > 0, self.n * other.n / total, 0.0)
+            self.comoment = self.comoment + other.comoment + delta * delta.T * factor
+            self.m2 = self.m2 + other.m2 + delta * delta * factor
+            self.mean = self.mean + np.where(total > 0, delta * other.n / total, 0.0)
+        self.n = total
+        return self
+
+    def remove(self, other: "CoMoments") -> "CoMoments":
+        """Undo an earlier :meth:`merge` of ``other`` (e.g. a batch leaving a window)."""
+        remaining = self.n - other.n
+        if (remaining < 0).any():
+            raise ValueError("Cannot remove more rows than were added")
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(remaining > 0, (self.n * self.mean - other.n * other.mean) / remaining, 0.0)
+            delta = other.mean - mean
+            factor = np.where(self.n > 0, remaining * other.n / self.n, 0.0)
+            comoment = self.comoment - other.comoment - delta * delta.T * factor
+            m2 = self.m2 - other.m2 - delta * delta * factor
+        empty = remaining == 0
+        self.comoment = np.where(empty, 0.0, comoment)
+        self.m2 = np.where(empty, 0.0, np.maximum(m2, 0.0))
+        self.mean = mean
+        self.n = remaining
+        return self
+
+    def take(self, positions) -> "CoMoments":
+        """The co-moments of the columns at ``positions`` only."""
+        result = CoMoments(len(positions))
+        cells = np.ix_(positions, positions)
+        for name in ("n", "mean", "comoment", "m2"):
+            setattr(result, name, getattr(self, name)[cells])
+        return result
+
+    def cov(self) -> np.ndarray:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(self.n > 1, self.comoment / (self.n - 1), np.nan)
+
+    def corr(self) -> np.ndarray:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            result = self.comoment / np.sqrt(self.m2 * self.m2.T)
+        result = np.where(self.n > 1, result, np.nan)
+        return np.clip(result, -1.0, 1.0)
+
+
+class StreamingProfile:
+    """Mergeable profile of a frame that is seen one chunk at a time.
+
+    ``numeric`` limits which columns may be numeric (default: the first
+    chunk's numeric columns). Any of them that later turns out to hold text
+    is dropped: a text column that is empty in the first chunk (``Cabin`` in the
+    first rows of the manifest) is parsed as float there, and is dropped
+    when a chunk with values says otherwise. Profiles that disagree keep
+    only the columns both call numeric when merged.
+    """
+
+    def __init__(self, target: str | None = "quality", epsilon: float | None = None, exact_quantiles: bool = False, numeric=None):
+        self.target = target
+        self.epsilon = epsilon
+        self.exact_quantiles = exact_quantiles
+        self.schema = list(numeric) if numeric is not None else None
+        self.columns: list[str] | None = None
+        self.numeric: list[str] | None = None
+        self.rows = 0
+        self.nulls: pd.Series | None = None
+        self.target_counts = pd.Series(dtype="int64")
+        self.moments: Moments | None = None
+        self.comoments: CoMoments | None = None
+        self.sketches: dict | None = None
+
+    def _start(self, chunk: pd.DataFrame) -> None:
+        self.columns = list(chunk.columns)
+        if self.schema is not None:
+            self.numeric = [name for name in self.columns if name in self.schema]
+        else:
+            self.numeric = list(chunk.select_dtypes(include="number").columns)
+        self.nulls = pd.Series(0, index=self.columns, dtype="int64")
+        self.moments = Moments(len(self.numeric))
+        self.comoments = CoMoments(len(self.numeric))
+        self.sketches = {name: quantile_estimator(self.epsilon, self.exact_quantiles) for name in self.numeric}
+
+    def update(self, chunk: pd.DataFrame) -> "StreamingProfile":
+        if self.columns is None:
+            self._start(chunk)
+        self.rows += len(chunk)
+        self.nulls = self.nulls.add(chunk.isnull().sum(), fill_value=0).astype("int64")
+        if self.target is not None and self.target in chunk:
+            counts = chunk[self.target].value_counts()
+            self.target_counts = self.target_counts.add(counts, fill_value=0).astype("int64")
+        text = [name for name in self.numeric if not pd.api.types.is_numeric_dtype(chunk[name])]
+        if text:
+            self._keep([name for name in self.numeric if name not in text])
+        values = chunk[self.numeric].to_numpy(dtype=float, na_value=np.nan)
+        self.moments.update(values)
+        self.comoments.update(values)
+        for i, name in enumerate(self.numeric):
+            self.sketches[name].update(values[:, i])
+        return self
+
+    def merge(self, other: "StreamingProfile") -> "StreamingProfile":
+        if other.columns is None:
+            return self
+        if self.columns is None:
+            self._start(pd.DataFrame(columns=other.columns).astype(dict.fromkeys(other.numeric, float)))
+        if other.numeric != self.numeric:
+            shared = [name for name in self.numeric if name in other.numeric]
+            self._keep(shared)
+            other = copy.copy(other)
+            other._keep(shared)
+            if other.numeric != self.numeric:
+                raise ValueError("Cannot merge profiles whose numeric columns are in a different order")
+        self.rows += other.rows
+        self.nulls = self.nulls.add(other.nulls, fill_value=0).astype("int64")
+        self.target_counts = self.target_counts.add(other.target_counts, fill_value=0).astype("int64")
+        self.moments.merge(other.moments)
+        self.comoments.merge(other.comoments)
+        for name, sketch in other.sketches.items():
+            self.sketches[name].merge(sketch)
+        return self
+
+    def _keep(self, names: list) -> None:
+        """Stop treating the other numeric columns as numeric."""
+        positions = [self.numeric.index(name) for name in names]
+        self.moments = self.moments.take(positions)
+        self.comoments = self.comoments.take(positions)
+        self.sketches = {name: self.sketches[name] for name in names}
+        self.numeric = list(names)
+
+    # -- the same tables as the in-memory cells ------------------------------
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.rows, len(self.columns or [])
+
+    def describe(self) -> pd.DataFrame:
+        """``describe()``; the percentile rows are approximate once a column's
+        sketch has compacted (exact with ``exact_quantiles=True``)."""
+        m = self.moments
+        head = pd.DataFrame([m.count, m.mean, np.sqrt(m.variance), m.min], index=["count", "mean", "std", "min"], columns=self.numeric)
+        tail = pd.DataFrame([m.max], index=["max"], columns=self.numeric)
+        table = pd.concat([head, describe_percentiles(self.sketches), tail])
+        return table.replace([np.inf, -np.inf], np.nan)
+
+    def isnull_sum(self) -> pd.Series:
+        return self.nulls.reindex(self.columns)
+
+    def isna_mean(self) -> pd.Series:
+        return self.isnull_sum() / self.rows if self.rows else self.isnull_sum().astype(float)
+
+    def value_counts(self) -> pd.Series:
+        counts = self.target_counts.sort_values(ascending=False, kind="stable").rename("count")
+        counts.index.name = self.target
+        return counts
+
+    def cov(self) -> pd.DataFrame:
+        return pd.DataFrame(self.comoments.cov(), index=self.numeric, columns=self.numeric)
+
+    def corr(self) -> pd.DataFrame:
+        return pd.DataFrame(self.comoments.corr(), index=self.numeric, columns=self.numeric)
+
+
+def iter_chunks(path, chunksize: int = 100_000, renames: dict | None = None, **read_csv_kwargs):
+    """Yield ``pd.read_csv`` chunks of ``path``, with columns renamed."""
+    for chunk in pd.read_csv(path, chunksize=chunksize, **read_csv_kwargs):
+        yield chunk.rename(columns=renames) if renames else chunk
+
+
+def profile_chunks(chunks, target: str | None = "quality", **options) -> StreamingProfile:
+    profile = StreamingProfile(target=target, **options)
+    for chunk in chunks:
+        profile.update(chunk)
+    return profile
+
+
+def profile_csv(path, chunksize: int = 100_000, target: str | None = "quality", renames: dict | None = None, epsilon: float | None = None, exact_quantiles: bool = False, numeric=None, **read_csv_kwargs) -> StreamingProfile:
+    """Profile a CSV ``chunksize`` rows at a time.
+
+    >>> profile = profile_csv("winequality-red.csv", sep=";", renames=WINE_RENAMES)
+    >>> profile.corr()  # same table as red_wine_data.corr()
+    """
+    chunks = iter_chunks(path, chunksize, renames, **read_csv_kwargs)
+    return profile_chunks(chunks, target=target, epsilon=epsilon, exact_quantiles=exact_quantiles, numeric=numeric)
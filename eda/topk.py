@@ -0,0 +1,129 @@
+"""Largest/smallest ``k`` values without sorting the whole frame.
+
+Question 6 runs ``rms_titanic_data.sort_values(by="Fare", ascending=False).head()``
+twice: an ``O(n log n)`` sort of every row to read five of them.
+:func:`top_k` uses ``np.partition`` (``O(n)``) and only sorts the ``k``
+winners. Repeated values are kept, so the Q6 answer
+``[512.3292, 512.3292, 512.3292, 263.0, 263.0]`` comes out as-is, and
+``keep="all"`` also returns every row tied with the k-th value.
+:class:`TopK` does the same across chunks with a bounded candidate set, and
+:func:`grouped_top_k` answers e.g. "top fares per Pclass".
+
+>>> top_k(rms_titanic_data["Fare"], 5).tolist()
+[512.3292, 512.3292, 512.3292, 263.0, 263.0]
+>>> top_k_rows(rms_titanic_data, "Fare", 5)      # full rows, like sort_values().head()
+>>> grouped_top_k(rms_titanic_data, "Fare", by="Pclass", k=3)
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+
+def _select(values: np.ndarray, k: int, largest: bool, keep: str) -> np.ndarray:
+    """Positions of the ``k`` largest (or smallest) non-NaN ``values``, best first.
+
+    Ties are broken by position, like a stable ``sort_values``; with
+    ``keep="all"`` every value equal to the k-th one is included as well.
+    """
+    if keep not in ("first", "all"):
+        raise ValueError("keep must be 'first' or 'all'")
+    positions = np.flatnonzero(~np.isnan(values)) if values.dtype.kind == "f" else np.arange(len(values))
+    candidates = values[positions]
+    if k <= 0 or not len(candidates):
+        return positions[:0]
+    if candidates.dtype.kind in "ub":
+        candidates = candidates.astype(np.float64)
+    keyed = -candidates if largest else candidates
+    if k < len(candidates):
+        cut = np.partition(keyed, k - 1)[k - 1]
+        if keep == "all":
+            chosen = np.flatnonzero(keyed <= cut)
+        else:
+            # Everything strictly better than the cut, then the earliest ties to fill up to k
+            better = np.flatnonzero(keyed < cut)
+            ties = np.flatnonzero(keyed == cut)[: k - len(better)]
+            chosen = np.concatenate([better, ties])
+    else:
+        chosen = np.arange(len(candidates))
+    order = np.lexsort((positions[chosen], keyed[chosen]))
+    return positions[chosen[order]]
+
+
+def top_k(values, k: int = 5, largest: bool = True, keep: str = "first") -> np.ndarray:
+    """The ``k`` largest (``largest=False``: smallest) values, best first."""
+    values = values.to_numpy() if isinstance(values, pd.Series) else np.asarray(values)
+    return values[_select(values, k, largest, keep)]
+
+
+def bottom_k(values, k: int = 5, keep: str = "first") -> np.ndarray:
+    return top_k(values, k, largest=False, keep=keep)
+
+
+def top_k_rows(df: pd.DataFrame, column: str, k: int = 5, largest: bool = True, keep: str = "first") -> pd.DataFrame:
+    """Same rows as ``df.sort_values(column, ascending=not largest, kind="stable").head(k)``."""
+    values = df[column].to_numpy(dtype=float, na_value=np.nan)
+    return df.iloc[_select(values, k, largest, keep)]
+
+
+def grouped_top_k(df: pd.DataFrame, column: str, by, k: int = 5, largest: bool = True, keep: str = "first", rows: bool = False):
+    """Top ``k`` of ``column`` within each group of ``by``.
+
+    Returns a Series of values indexed by group (or the full rows with
+    ``rows=True``), groups in sorted order, best values first within each.
+    """
+    values = df[column].to_numpy(dtype=float, na_value=np.nan)
+    picked, keys = [], []
+    for key, members in sorted(df.groupby(by, sort=False).indices.items()):
+        winners = members[_select(values[members], k, largest, keep)]
+        picked.append(winners)
+        keys.extend([key] * len(winners))
+    picked = np.concatenate(picked) if picked else np.zeros(0, dtype=np.int64)
+    if rows:
+        return df.iloc[picked]
+    names = by if isinstance(by, (list, tuple)) else [by]
+    index = pd.MultiIndex.from_tuples(keys, names=names) if len(names) > 1 else pd.Index(keys, name=names[0])
+    return pd.Series(values[picked], index=index, name=column)
+
+
+class TopK:
+    """Streaming top/bottom ``k`` of ``column`` over chunks, with optional full rows.
+
+    The state never exceeds ``k`` candidates (plus the ties of the k-th value
+    when ``keep="all"``), so memory does not grow with the number of chunks.
+    """
+
+    def __init__(self, column: str, k: int = 5, largest: bool = True, keep: str = "first", rows: bool = False):
+        self.column = column
+        self.k = k
+        self.largest = largest
+        self.keep = keep
+        self.rows = rows
+        self.candidates: pd.DataFrame | None = None
+        self.seen = 0
+
+    def _reduce(self, frame: pd.DataFrame) -> pd.DataFrame:
+        return top_k_rows(frame, self.column, self.k, self.largest, self.keep)
+
+    def update(self, chunk: pd.DataFrame) -> "TopK":
+        # Candidates come first, so ties keep the earliest rows seen
+        chunk = chunk if self.rows else chunk[[self.column]]
+        best = self._reduce(chunk)
+        self.seen += len(chunk)
+        self.candidates = best if self.candidates is None else self._reduce(pd.concat([self.candidates, best]))
+        return self
+
+    def merge(self, other: "TopK") -> "TopK":
+        if other.candidates is not None:
+            merged = other.candidates if self.candidates is None else pd.concat([self.candidates, other.candidates])
+            self.candidates = self._reduce(merged)
+        self.seen += other.seen
+        return self
+
+    def values(self) -> np.ndarray:
+        return np.zeros(0) if self.candidates is None else self.candidates[self.column].to_numpy()
+
+    def result(self) -> pd.DataFrame:
+        """The winning rows (or just ``column`` unless ``rows=True``), best first."""
+        return self.candidates if self.candidates is not None else pd.DataFrame(columns=[self.column])
@@ -0,0 +1,381 @@
+"""Where does the time go? Per-section timings for the script, off by default.
+
+The script is one long sequence of cells; when it is slow nothing says
+whether the pair plot, the doubled countplot or the repeated ``describe``
+calls are to blame. A :class:`Tracer` records a span for every section: wall
+and CPU time, change in resident memory (and in traced allocations with
+``trace_allocations=True``) and the number of rows the section says it
+scanned. Spans nest, and the trace can be written as Chrome-trace JSON
+(open it in ``chrome://tracing`` or https://ui.perfetto.dev) or summarised
+as a table. With ``sample_interval`` set, a background thread also samples
+the Python stack of the traced thread and attributes each sample to the
+innermost open section, for :meth:`Tracer.hot_spots` or a folded-stack file
+for flame graph tools.
+
+The script marks its sections with :func:`cell`, which ends the previous
+cell and starts the next. Tracing is enabled with ``EDA_TRACE=1`` (or
+``EDA_TRACE=sample``); the trace is then written at exit to
+``$EDA_TRACE_FILE`` (default ``eda_trace.json``) and the summary printed.
+When tracing is disabled every hook returns after one attribute check.
+
+>>> tracer = Tracer(enabled=True)
+>>> with tracer.section("Correlation", rows=red_wine_data):
+...     red_wine_data.corr()
+>>> tracer.summary()
+>>> tracer.write_chrome_trace("trace.json")
+"""
+
+from __future__ import annotations
+
+import atexit
+import functools
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from dataclasses import dataclass, field
+
+import pandas as pd
+
+TRACE_ENV = "EDA_TRACE"
+TRACE_FILE_ENV = "EDA_TRACE_FILE"
+DEFAULT_TRACE_FILE = "eda_trace.json"
+DEFAULT_SAMPLE_INTERVAL = 0.005
+MB = 1024 * 1024
+
+try:
+    _PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+except (AttributeError, ValueError, OSError):  # pragma: no cover - not POSIX
+    _PAGE_SIZE = None
+
+
+def _rss_bytes() -> int | None:
+    """Current resident set size (Linux ``/proc``), or None where unavailable."""
+    if _PAGE_SIZE is None:
+        return None
+    try:
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[1]) * _PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+def _count_rows(rows) -> int | None:
+    if rows is None:
+        return None
+    if isinstance(rows, int):
+        return rows
+    if hasattr(rows, "shape"):
+        return len(rows)
+    return sum(_count_rows(item) or 0 for item in rows)
+
+
+@dataclass(eq=False)
+class Span:
+    name: str
+    category: str
+    thread: int
+    depth: int
+    start: float
+    cpu_start: float
+    rss_start: int | None
+    alloc_start: int | None
+    rows: int | None = None
+    end: float | None = None
+    cpu: float = 0.0
+    rss_delta: int | None = None
+    alloc_delta: int | None = None
+    args: dict = field(default_factory=dict)
+
+    @property
+    def wall(self) -> float:
+        return (self.end if self.end is not None else time.perf_counter()) - self.start
+
+
+def _sum_or_nan(values: pd.Series):
+    return values.sum(min_count=1)
+
+
+class _NullSection:
+    """What :meth:`Tracer.section` returns while tracing is off."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SECTION = _NullSection()
+
+
+class _Section:
+    __slots__ = ("tracer", "name", "rows", "category", "args", "span")
+
+    def __init__(self, tracer, name, rows, category, args):
+        self.tracer, self.name, self.rows, self.category, self.args = tracer, name, rows, category, args
+
+    def __enter__(self) -> Span:
+        self.span = self.tracer.begin(self.name, rows=self.rows, category=self.category, **self.args)
+        return self.span
+
+    def __exit__(self, *exc):
+        self.tracer.end(self.span)
+        return False
+
+
+class Tracer:
+    """Collects nested spans and, optionally, stack samples."""
+
+    def __init__(self, enabled: bool = False, sample_interval: float | None = None, trace_allocations: bool = False):
+        self.enabled = enabled
+        self.sample_interval = sample_interval
+        self.trace_allocations = trace_allocations
+        self.spans: list[Span] = []
+        self.samples: Counter = Counter()  # (section, stack) -> count
+        self._stacks: dict[int, list[Span]] = {}  # thread id -> open spans
+        self._cells: dict[int, Span] = {}  # thread id -> open cell
+        self._origin = time.perf_counter()
+        self._sampler: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    # -- spans -----------------------------------------------------------
+
+    def begin(self, name: str, rows=None, category: str = "section", **args) -> Span | None:
+        """Open a span on the current thread; close it with :meth:`end`."""
+        if not self.enabled:
+            return None
+        if self.trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        if self.sample_interval and self._sampler is None:
+            self.start_sampling(self.sample_interval)
+        thread = threading.get_ident()
+        stack = self._stacks.setdefault(thread, [])
+        span = Span(
+            name, category, thread, len(stack), time.perf_counter(), time.process_time(), _rss_bytes(),
+            tracemalloc.get_traced_memory()[0] if self.trace_allocations else None,
+            rows=_count_rows(rows), args=args,
+        )
+        stack.append(span)
+        return span
+
+    def end(self, span: Span | None = None) -> None:
+        """Close ``span`` (default: the innermost open one) and any span opened inside it."""
+        if not self.enabled:
+            return
+        stack = self._stacks.get(threading.get_ident(), [])
+        if not stack or (span is not None and span not in stack):
+            return
+        self._close_until(stack, span if span is not None else stack[-1])
+
+    def _close_until(self, stack: list, target: Span | None) -> None:
+        """Pop and record spans from ``stack`` until ``target`` (None: all of them)."""
+        while stack:
+            current = stack.pop()
+            current.end = time.perf_counter()
+            current.cpu = time.process_time() - current.cpu_start
+            rss = _rss_bytes()
+            if rss is not None and current.rss_start is not None:
+                current.rss_delta = rss - current.rss_start
+            if current.alloc_start is not None and tracemalloc.is_tracing():
+                current.alloc_delta = tracemalloc.get_traced_memory()[0] - current.alloc_start
+            self.spans.append(current)
+            if current is target:
+                break
+
+    def section(self, name: str, rows=None, category: str = "section", **args):
+        """Context manager timing a block; ``rows`` is a count or the frame(s) it scans."""
+        if not self.enabled:
+            return _NULL_SECTION
+        return _Section(self, name, rows, category, args)
+
+    def cell(self, name: str, rows=None, **args) -> None:
+        """End the current cell (if any) and start the next one, for linear scripts."""
+        if not self.enabled:
+            return
+        thread = threading.get_ident()
+        previous = self._cells.pop(thread, None)
+        if previous is not None:
+            self.end(previous)
+        self._cells[thread] = self.begin(name, rows=rows, category="cell", **args)
+
+    def add_rows(self, rows) -> None:
+        """Add to the rows scanned by the innermost open span."""
+        if not self.enabled:
+            return
+        stack = self._stacks.get(threading.get_ident())
+        if stack:
+            span = stack[-1]
+            span.rows = (span.rows or 0) + (_count_rows(rows) or 0)
+
+    def wrap(self, name: str | None = None, category: str = "function"):
+        """Decorator recording a span for every call of the function."""
+
+        def decorate(function):
+            label = name or function.__qualname__
+
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                with self.section(label, category=category):
+                    return function(*args, **kwargs)
+
+            return wrapper
+
+        return decorate
+
+    def finish(self) -> None:
+        """Close every open span and stop the sampler."""
+        for stack in list(self._stacks.values()):
+            self._close_until(stack, None)
+        self._cells.clear()
+        self.stop_sampling()
+
+    # -- sampling ----------------------------------------------------------
+
+    def start_sampling(self, interval: float = DEFAULT_SAMPLE_INTERVAL, thread: int | None = None) -> None:
+        """Sample the stack of ``thread`` (default: the calling one) every ``interval`` seconds."""
+        if self._sampler is not None:
+            return
+        target = thread if thread is not None else threading.get_ident()
+        self._stop.clear()
+        self._sampler = threading.Thread(target=self._sample, args=(target, interval), name="eda-trace-sampler", daemon=True)
+        self._sampler.start()
+
+    def stop_sampling(self) -> None:
+        if self._sampler is not None:
+            self._stop.set()
+            self._sampler.join()
+            self._sampler = None
+
+    def _sample(self, target: int, interval: float) -> None:
+        here = os.path.abspath(__file__)
+        while not self._stop.wait(interval):
+            frame = sys._current_frames().get(target)
+            if frame is None:
+                return
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                if os.path.abspath(code.co_filename) != here:
+                    stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+                frame = frame.f_back
+            spans = self._stacks.get(target)
+            section = spans[-1].name if spans else "<untraced>"
+            self.samples[(section, tuple(reversed(stack)))] += 1
+
+    def hot_spots(self, top: int = 20, section: str | None = None) -> pd.DataFrame:
+        """Functions by samples spent in them (``self``) and under them (``total``)."""
+        own, total, n = Counter(), Counter(), 0
+        for (name, stack), count in self.samples.items():
+            if section is not None and name != section:
+                continue
+            n += count
+            if stack:
+                own[stack[-1]] += count
+            for label in set(stack):
+                total[label] += count
+        table = pd.DataFrame({"self": pd.Series(own, dtype="int64"), "total": pd.Series(total, dtype="int64")}).fillna(0).astype("int64")
+        if n:
+            table["self_pct"] = 100 * table["self"] / n
+            table["total_pct"] = 100 * table["total"] / n
+        table.index.name = "function"
+        return table.sort_values(["self", "total"], ascending=False).head(top)
+
+    def write_folded(self, path) -> None:
+        """Samples as ``section;frame;...;frame count`` lines (flamegraph.pl / speedscope)."""
+        with open(path, "w") as fh:
+            for (section, stack), count in self.samples.items():
+                fh.write(";".join((section, *stack)) + f" {count}\n")
+
+    # -- reports -----------------------------------------------------------
+
+    def summary(self) -> pd.DataFrame:
+        """One row per span name: calls, total wall/CPU time, memory change and rows."""
+        columns = ["category", "calls", "wall_s", "cpu_s", "rss_delta_mb", "alloc_delta_mb", "rows", "wall_pct"]
+        if not self.spans:
+            return pd.DataFrame(columns=columns)
+        records = pd.DataFrame([
+            {
+                "name": span.name, "category": span.category, "depth": span.depth, "wall_s": span.wall, "cpu_s": span.cpu,
+                "rss_delta_mb": span.rss_delta / MB if span.rss_delta is not None else None,
+                "alloc_delta_mb": span.alloc_delta / MB if span.alloc_delta is not None else None,
+                "rows": span.rows, "order": span.start,
+            }
+            for span in self.spans
+        ])
+        table = records.groupby("name", sort=False).agg(
+            category=("category", "first"), calls=("wall_s", "size"), wall_s=("wall_s", "sum"), cpu_s=("cpu_s", "sum"),
+            rss_delta_mb=("rss_delta_mb", _sum_or_nan), alloc_delta_mb=("alloc_delta_mb", _sum_or_nan), rows=("rows", _sum_or_nan),
+            order=("order", "min"),
+        )
+        outermost = records.loc[records["depth"] == 0, "wall_s"].sum()
+        table["wall_pct"] = 100 * table["wall_s"] / outermost if outermost else float("nan")
+        return table.sort_values("order").drop(columns="order")[columns]
+
+    def chrome_trace(self) -> dict:
+        """The spans as Chrome trace-event JSON (complete ``"X"`` events, microseconds)."""
+        pid = os.getpid()
+        events = [{"name": "process_name", "ph": "M", "pid": pid, "args": {"name": "eda"}}]
+        for span in sorted(self.spans, key=lambda s: (s.start, s.depth)):
+            args = dict(span.args)
+            args["cpu_ms"] = round(span.cpu * 1000, 3)
+            if span.rss_delta is not None:
+                args["rss_delta_mb"] = round(span.rss_delta / MB, 3)
+            if span.alloc_delta is not None:
+                args["alloc_delta_mb"] = round(span.alloc_delta / MB, 3)
+            if span.rows is not None:
+                args["rows"] = span.rows
+            events.append({
+                "name": span.name, "cat": span.category, "ph": "X", "pid": pid, "tid": span.thread,
+                "ts": round((span.start - self._origin) * 1e6, 1), "dur": round(span.wall * 1e6, 1), "args": args,
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path) -> None:
+        with open(path, "w") as fh:
+            json.dump(self.chrome_trace(), fh, default=str)
+
+    def reset(self) -> None:
+        self.spans.clear()
+        self.samples.clear()
+        self._stacks.clear()
+        self._cells.clear()
+        self._origin = time.perf_counter()
+
+
+def _from_environment() -> Tracer:
+    mode = os.environ.get(TRACE_ENV, "").strip().lower()
+    if mode in ("", "0", "false", "no", "off"):
+        return Tracer()
+    interval = DEFAULT_SAMPLE_INTERVAL if mode == "sample" else None
+    tracer = Tracer(enabled=True, sample_interval=interval)
+    atexit.register(_report, tracer, os.environ.get(TRACE_FILE_ENV, DEFAULT_TRACE_FILE))
+    return tracer
+
+
+def _report(tracer: Tracer, path: str) -> None:
+    tracer.finish()
+    tracer.write_chrome_trace(path)
+    with pd.option_context("display.width", 200, "display.max_columns", 20):
+        print(tracer.summary().to_string(float_format=lambda v: f"{v:.4f}"), file=sys.stderr)
+        if tracer.samples:
+            print(tracer.hot_spots().to_string(float_format=lambda v: f"{v:.1f}"), file=sys.stderr)
+    print(f"Chrome trace written to {path}", file=sys.stderr)
+
+
+tracer = _from_environment()  # the script's tracer; enabled with EDA_TRACE
+
+
+def section(name: str, rows=None, **args):
+    return tracer.section(name, rows=rows, **args)
+
+
+def cell(name: str, rows=None, **args) -> None:
+    tracer.cell(name, rows=rows, **args)
@@ -0,0 +1,184 @@
+"""Feature/target split and column projections that share memory with the frame.
+
+``x = red_wine_data.drop("quality", axis=1)`` copies all eleven feature
+columns, and ``rms_titanic_data[["Name", "Age", "Ticket", "Survived"]]``
+followed by ``select_dtypes`` copies again before ``corr()``. :func:`pack`
+lays the frame's float columns out once as one Fortran-ordered (column
+contiguous) NumPy array, a :class:`NumericBlock`, and rebuilds the frame on
+top of it, so ``frame[column]`` and ``block[column]`` are the same memory.
+From then on the feature matrix, the target, any single column and any
+evenly spaced run of columns are NumPy views, and the block's statistics and
+histogram read those views directly.
+
+Frame and block stay in step for in-place edits (``frame.loc[...] = ...``
+writes into the block). Assigning a new column (``frame["Age"] =
+frame["Age"].fillna(...)``) gives that column its own buffer, after which
+:meth:`NumericBlock.backs` returns False and the block keeps the old values.
+
+>>> split = feature_target_split(red_wine_data, target="quality")
+>>> split.x.shape, split.y.shape               # (1599, 11), (1599,) -- views, no copies
+>>> np.shares_memory(split.x, split.frame["alcohol"].to_numpy())
+True
+>>> split.block.corr()                          # same table as x.corr()
+>>> split.block.project(["citric_acid", "residual_sugar", "chlorides"])  # a view
+>>> frame, block = pack(rms_titanic_data, ["Age", "Survived"], cast=True)
+>>> block.corr()                                # Survived converted once, Age shared
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from .streaming import CoMoments, Moments
+
+
+class NumericBlock:
+    """Columns of one float dtype stored side by side in a single 2-D array."""
+
+    def __init__(self, values: np.ndarray, columns, index: pd.Index | None = None, shared=None):
+        if values.ndim != 2 or values.shape[1] != len(columns):
+            raise ValueError("values must be 2-D with one column per name")
+        self.values = values
+        self.columns = list(columns)
+        self.shared = list(shared) if shared is not None else list(self.columns)  # also read by the frame
+        self.index = index if index is not None else pd.RangeIndex(values.shape[0])
+        self._positions = {name: i for i, name in enumerate(self.columns)}
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.values.shape
+
+    def position(self, name) -> int:
+        try:
+            return self._positions[name]
+        except KeyError:
+            raise KeyError(f"{name!r} is not in the block; columns: {self.columns}") from None
+
+    def __getitem__(self, name) -> np.ndarray:
+        """One column, as a contiguous view."""
+        return self.values[:, self.position(name)]
+
+    def project(self, names, copy: bool = False) -> np.ndarray:
+        """``names`` as a 2-D array, a view when they are evenly spaced in the block.
+
+        Other selections would need a gather; that raises ``ValueError``
+        unless ``copy=True``.
+        """
+        positions = [self.position(name) for name in names]
+        if len(positions) == 1:
+            return self.values[:, positions[0]:positions[0] + 1]
+        steps = set(np.diff(positions))
+        if len(steps) == 1 and (step := steps.pop()) > 0:
+            return self.values[:, positions[0]:positions[-1] + 1:step]
+        if not copy:
+            raise ValueError(f"{list(names)} are not evenly spaced in the block; pass copy=True to gather them")
+        return self.values[:, positions]
+
+    def without(self, *names, copy: bool = False) -> np.ndarray:
+        """Every other column, like ``drop(names, axis=1)`` (a view when the rest is evenly spaced)."""
+        dropped = set(names)
+        return self.project([name for name in self.columns if name not in dropped], copy=copy)
+
+    def backs(self, frame: pd.DataFrame) -> bool:
+        """True if every shared column of ``frame`` still reads this block's memory."""
+        return all(
+            name in frame and np.shares_memory(frame[name].to_numpy(), self.values)
+            for name in self.shared
+        )
+
+    # -- statistics and plots straight from the views ---------------------
+
+    def corr(self) -> pd.DataFrame:
+        """Pearson correlation over pairwise-complete rows, like ``DataFrame.corr()``."""
+        return pd.DataFrame(CoMoments.from_values(self.values).corr(), index=self.columns, columns=self.columns)
+
+    def describe(self, percentiles=(0.25, 0.5, 0.75)) -> pd.DataFrame:
+        moments = Moments(len(self.columns))
+        moments.update(self.values)
+        quantiles = [
+            np.nanquantile(self.values[:, i], percentiles) if moments.count[i] else np.full(len(percentiles), np.nan)
+            for i in range(len(self.columns))
+        ]
+        rows = [moments.count, moments.mean, np.sqrt(moments.variance), moments.min, *np.array(quantiles).T, moments.max]
+        labels = ["count", "mean", "std", "min", *[f"{p * 100:g}%" for p in percentiles], "max"]
+        table = pd.DataFrame(rows, index=labels, columns=self.columns)
+        return table.replace([np.inf, -np.inf], np.nan)
+
+    def hist(self, bins: int = 10, figsize=(15, 10), columns=None):
+        """``df.hist()`` for the block's columns, drawn from the views into a ``Figure``."""
+        from matplotlib.figure import Figure
+
+        columns = list(columns) if columns is not None else self.columns
+        n_cols = int(np.ceil(np.sqrt(len(columns))))
+        n_rows = int(np.ceil(len(columns) / n_cols))
+        figure = Figure(figsize=figsize)
+        for i, name in enumerate(columns):
+            ax = figure.add_subplot(n_rows, n_cols, i + 1)
+            values = self[name]
+            ax.hist(values[~np.isnan(values)], bins=bins)
+            ax.set_title(name)
+            ax.grid(True)
+        figure.subplots_adjust(hspace=0.4, wspace=0.3)
+        return figure
+
+
+def pack(df: pd.DataFrame, columns=None, dtype=np.float64, cast: bool = False) -> tuple[pd.DataFrame, NumericBlock]:
+    """Copy the ``dtype`` columns of ``df`` into one block and rebuild ``df`` on top of it.
+
+    ``columns`` defaults to every column of exactly ``dtype``, so no value
+    or dtype changes. This is the only copy; the returned frame has the same
+    columns, order and dtypes as ``df``.
+
+    With ``cast=True`` other numeric columns (ints, bools; by default all of
+    them) are converted into the block too, e.g. Titanic's ``Survived`` next
+    to ``Age`` for ``corr()``. The frame keeps their original values and
+    dtype, so for those columns frame and block are separate copies.
+    """
+    dtype = np.dtype(dtype)
+    if columns is None:
+        wanted = pd.api.types.is_numeric_dtype if cast else (lambda column_dtype: column_dtype == dtype)
+        columns = [name for name in df.columns if wanted(df[name].dtype)]
+    else:
+        columns = list(columns)
+        wrong = [
+            name for name in columns
+            if df[name].dtype != dtype and not (cast and pd.api.types.is_numeric_dtype(df[name].dtype))
+        ]
+        if wrong:
+            hint = "" if cast else "; pass cast=True to convert numeric columns"
+            raise ValueError(f"Columns {wrong} are not {dtype}{hint}")
+    values = np.empty((len(df), len(columns)), dtype=dtype, order="F")
+    for i, name in enumerate(columns):
+        values[:, i] = df[name].to_numpy(dtype=dtype, na_value=np.nan)
+    shared = [name for name in columns if df[name].dtype == dtype]
+    block = NumericBlock(values, columns, df.index, shared)
+
+    data = {name: (block[name] if name in shared else df[name]) for name in df.columns}
+    frame = pd.DataFrame(data, index=df.index, copy=False)
+    return frame, block
+
+
+@dataclass
+class FeatureTargetSplit:
+    frame: pd.DataFrame  # the data, now backed by `block`
+    block: NumericBlock
+    x: np.ndarray  # feature columns of the block (view)
+    y: np.ndarray  # target column (view)
+    features: list
+    target: str
+
+
+def feature_target_split(df: pd.DataFrame, target: str = "quality", features=None) -> FeatureTargetSplit:
+    """``x``/``y`` like ``df.drop(target, axis=1)`` / ``df[target]``, as views.
+
+    ``features`` defaults to every float column except ``target``; they are
+    packed next to each other, so ``x`` is one contiguous view.
+    """
+    if features is None:
+        features = [name for name in df.columns if name != target and df[name].dtype.kind == "f"]
+    frame, block = pack(df, features, dtype=df[features[0]].dtype if features else np.float64)
+    y = frame[target].to_numpy()
+    return FeatureTargetSplit(frame, block, block.values, y, list(features), target)
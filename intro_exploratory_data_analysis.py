@@ -18,13 +18,23 @@ warnings.filterwarnings('ignore')
 
 # Loading Data - After checking the data, data is separated by ";" instead of the default separator ","
 # Add (sep=";") to the code
-red_wine_data = pd.read_csv("https://raw.githubusercontent.com/dphi-official/Datasets/master/Wine_Dataset/winequality-red.csv", sep=";")
+# The file is downloaded once into a local cache (see eda/loaders.py); later runs read it from disk,
+# and without a network it is taken from the cache or the data/ folder.
+from eda.loaders import RED_WINE_URL, TITANIC_URL, load_csv
+# Section markers: they time each part of the analysis when run with EDA_TRACE=1 and do nothing otherwise
+from eda.trace import cell
+
+cell("Loading")
+
+red_wine_data = load_csv(RED_WINE_URL, sep=";")
 
 """# **Data Analysis Techniques**
 
 **Initial Review of Data**
 """
 
+cell("Initial Review", rows=red_wine_data)
+
 # To get the first 5 records using ".head()"; you can pass the number of record you want into () Eg. .head(7) or .head(10) and so on
 red_wine_data.head()
 
@@ -61,6 +71,8 @@ red_wine_data.describe(include="int")
 
 """**Exploring the Features**"""
 
+cell("Exploring the Features", rows=red_wine_data)
+
 # To explore the features/columns of the datasets.
 red_wine_data.columns
 
@@ -122,6 +134,8 @@ red_wine_data.columns  # Check to confirm if the change has been effected
 
 """**Checking for Missing Values**"""
 
+cell("Missing Values", rows=red_wine_data)
+
 # To detect missing values using "isnull()" or  "isna()" functions. Both of them do the same thing.
 # Here the "isnull()" or  "isna()" functions detects the missing values while
 # ".sum()" helps display the number of missing values in each column
@@ -154,6 +168,8 @@ red_wine_data.info()
 Duplicates might or might not affect the quality of data. Before deciding if they should be removed, it is essential to understand why they might have occurred in the first place.
 """
 
+cell("Duplicates", rows=red_wine_data)
+
 # Method 1:
 duplicate_entries = red_wine_data.duplicated()
 duplicate_entries.sum()
@@ -171,6 +187,8 @@ There are 240 duplicates. The quality ratings for the same/similar wine were giv
 **Importing Data Visualization Libraries**
 """
 
+cell("Graphical Techniques", rows=red_wine_data)
+
 # Importing Data Visualization Libraries
 import matplotlib.pyplot as plt
 import seaborn as sns
@@ -240,6 +258,8 @@ These observations can help you understand the characteristics of the dataset an
 **Correlation Matrix with Heatmap**
 """
 
+cell("Correlation", rows=red_wine_data)
+
 # check how each feature is related to others using corr() function.
 
 red_wine_data.corr()
@@ -398,6 +418,8 @@ Load the dataset. Dataset Link: https://raw.githubusercontent.com/dphi-official/
 Observe the first 5 rows of the data
 """
 
+cell("Titanic: Loading")
+
 # Load Libraries
 import pandas as pd
 import numpy as np
@@ -405,10 +427,12 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 
 # Load the dataset
-rms_titanic_data = pd.read_csv(" https://raw.githubusercontent.com/dphi-official/First_ML_Model/master/titanic.csv")
+rms_titanic_data = load_csv(TITANIC_URL)
 
 """**Initial Review of Data**"""
 
+cell("Titanic: Initial Review", rows=rms_titanic_data)
+
 # Observe the first 5 rows of the data
 rms_titanic_data.head()
 
@@ -428,6 +452,8 @@ Select the correct statement about the titanic dataset
 *   All of the above
 """
 
+cell("Question 1", rows=rms_titanic_data)
+
 # Solution 1
 # Check if column "Fare" has no missing values
 
@@ -455,6 +481,8 @@ Note: In this question, we are asking for an answer as a proportion. Therefore,
 *   0.41
 """
 
+cell("Question 2", rows=rms_titanic_data)
+
 # Solutin 2:
 # Call for the number of occurance of each unique value
 # in the target variable "Survived"
@@ -496,6 +524,8 @@ Note: Write your answer up to 4 decimal places
 *   None of the above
 """
 
+cell("Question 3", rows=rms_titanic_data)
+
 median_fare = rms_titanic_data['Fare'].median()
 print(f"the median Fare of the passengers is: {median_fare:.4f}")
 
@@ -513,6 +543,8 @@ Select the correct option:
 *   All of the above
 """
 
+cell("Question 4", rows=rms_titanic_data)
+
 
 
 women_count = rms_titanic_data[rms_titanic_data['Sex'] == 'female'].shape[0]
@@ -618,6 +650,8 @@ How many of the survived passengers had embarked from 'Southampton' i.e. 'S'?
 *   77
 """
 
+cell("Question 5", rows=rms_titanic_data)
+
 # Method 1: Following all instructions
 # Create of subset for passenger survived
 survived_passengers = rms_titanic_data[rms_titanic_data["Survived"] == 1]
@@ -649,6 +683,8 @@ Five highest fares of the passengers(not unique):
 *   [512.3292, 520.3292, 512.3292, 263.0, 263.0]
 """
 
+cell("Question 6", rows=rms_titanic_data)
+
 # Get the top five Fare for the cruise - !st five highest fare
 Top_five_fare = rms_titanic_data.sort_values(by="Fare", ascending=False).head()
 Top_five_fare_list = Top_five_fare["Fare"].tolist()
@@ -674,6 +710,8 @@ Median age of the passengers is:
 *   30.0
 """
 
+cell("Question 7", rows=rms_titanic_data)
+
 # To compute the Median age of the passengers
 median_age = rms_titanic_data["Age"].median()
 print(f"The median age of the passengers is: {median_age:.1f}")
@@ -690,6 +728,8 @@ Select the correct statement:
 *   There are 714 unique values in the Name column
 """
 
+cell("Question 8", rows=rms_titanic_data)
+
 # Get the total amount of unique values in the Name column
 unique_names_count = rms_titanic_data["Name"].nunique()
 
@@ -709,6 +749,8 @@ Most of the passengers have _____ siblings/spouses.
 *   2
 """
 
+cell("Question 9", rows=rms_titanic_data)
+
 # Get the answer to: Most of the passengers have _____ siblings/spouses.
 rms_titanic_data["SibSp"].value_counts()
 
@@ -725,6 +767,8 @@ Which of the following feature plays an important role in the survival of the pa
 *   Ticket
 """
 
+cell("Question 10", rows=rms_titanic_data)
+
 # To determine which feature among "Name", "Age", and "Ticket" played an important role in the survival of the passengers
 # Selecting the columns, including 'Survived' for correlation analysis
 comparism_features = rms_titanic_data[["Name", "Age", "Ticket", "Survived"]]
@@ -0,0 +1,213 @@
+"""The prefetcher against a local HTTP/1.1 server with added latency."""
+
+import asyncio
+import io
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+import pytest
+
+from eda import async_loader
+from eda.async_loader import ConnectionPool, Prefetcher, _FeedStream, fetch_frame
+from eda.loaders import DatasetCache
+
+LATENCY = 0.4
+WINE = b"alcohol;quality\n9.4;5\n9.8;5\n11.2;6\n"
+TITANIC = b"PassengerId,Survived,Age\n1,0,22\n2,1,38\n3,1,\n"
+FILES = {"/wine.csv": WINE, "/titanic.csv": TITANIC}
+
+
+class LatencyHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.server.connections.add(self.client_address)
+        time.sleep(LATENCY)
+        if self.path == "/stall.csv":
+            # Headers and part of the body, then nothing
+            self.send_response(200)
+            self.send_header("Content-Length", "1000")
+            self.end_headers()
+            self.wfile.write(b"a,b\n1,2\n")
+            self.wfile.flush()
+            self.server.release.wait(10)
+            return
+        body = FILES.get(self.path.replace("/chunked", ""))
+        if body is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        if self.path.startswith("/chunked"):
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for start in range(0, len(body), 10):
+                part = body[start:start + 10]
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(part), part))
+            self.wfile.write(b"0\r\n\r\n")
+        else:
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", '"v1"')
+            self.end_headers()
+            self.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), LatencyHandler)
+    httpd.daemon_threads = True
+    httpd.connections = set()
+    httpd.release = threading.Event()
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}", httpd
+    httpd.release.set()
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _closed_port_url(path: str) -> str:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}{path}"
+
+
+def test_downloads_overlap(server, tmp_path):
+    base, _ = server
+    start = time.perf_counter()
+    loader = Prefetcher(
+        {"wine": (f"{base}/wine.csv", {"sep": ";"}), "titanic": (f"{base}/titanic.csv", {})},
+        cache=DatasetCache(tmp_path), offline=False,
+    )
+    frames = loader.join(timeout=10)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 2 * LATENCY
+    assert frames["wine"]["quality"].tolist() == [5, 5, 6]
+    assert frames["titanic"].shape == (3, 3)
+
+
+def test_connection_is_reused(server):
+    base, httpd = server
+
+    async def run():
+        pool = ConnectionPool(per_host=1)
+        try:
+            for path in ("/wine.csv", "/titanic.csv", "/chunked/titanic.csv"):
+                await fetch_frame(pool, base + path, {"sep": ";"} if "wine" in path else {})
+        finally:
+            await pool.close()
+        return pool.opened
+
+    assert asyncio.run(run()) == 1
+    assert len(httpd.connections) == 1
+
+
+def test_chunked_body(server):
+    base, _ = server
+
+    async def run():
+        pool = ConnectionPool()
+        try:
+            return await fetch_frame(pool, f"{base}/chunked/titanic.csv", {})
+        finally:
+            await pool.close()
+
+    pd.testing.assert_frame_equal(asyncio.run(run()), pd.read_csv(io.BytesIO(TITANIC)))
+
+
+def test_stalled_body_times_out(server):
+    base, _ = server
+
+    async def run():
+        pool = ConnectionPool(timeout=LATENCY * 2)
+        try:
+            return await fetch_frame(pool, f"{base}/stall.csv", {})
+        finally:
+            await pool.close()
+
+    start = time.perf_counter()
+    with pytest.raises(TimeoutError):
+        asyncio.run(run())
+    assert time.perf_counter() - start < 5 * LATENCY
+
+
+def test_server_down_uses_stale_cache(server, tmp_path):
+    url = _closed_port_url("/wine.csv")
+    cache = DatasetCache(tmp_path, max_age=0)
+    with open(tmp_path / "seed.csv", "wb") as fh:
+        fh.write(WINE)
+    with open(tmp_path / "seed.csv", "rb") as fh:
+        cache.store(url, fh)
+
+    loader = Prefetcher({"wine": (url, {"sep": ";"})}, cache=cache, offline=False)
+    assert loader.get("wine", timeout=10)["alcohol"].tolist() == [9.4, 9.8, 11.2]
+
+
+def test_server_down_uses_fixture(tmp_path):
+    fixtures = tmp_path / "data"
+    fixtures.mkdir()
+    (fixtures / "titanic.csv").write_bytes(TITANIC)
+    cache = DatasetCache(tmp_path / "cache", fixture_dir=fixtures)
+
+    loader = Prefetcher({"titanic": (_closed_port_url("/titanic.csv"), {})}, cache=cache, offline=False)
+    assert loader.get("titanic", timeout=10).shape == (3, 3)
+
+
+def test_missing_everywhere_raises(tmp_path):
+    cache = DatasetCache(tmp_path / "cache", fixture_dir=tmp_path / "none")
+    loader = Prefetcher({"x": (_closed_port_url("/x.csv"), {})}, cache=cache, offline=False)
+    with pytest.raises(FileNotFoundError):
+        loader.get("x", timeout=10)
+
+
+def test_offline_without_cache_never_requests(server, tmp_path, monkeypatch):
+    base, httpd = server
+    fixtures = tmp_path / "data"
+    fixtures.mkdir()
+    (fixtures / "titanic.csv").write_bytes(TITANIC)
+    monkeypatch.setattr(async_loader, "default_cache", lambda: DatasetCache(tmp_path / "cache", fixture_dir=fixtures))
+
+    async def run(path):
+        pool = ConnectionPool()
+        try:
+            return await fetch_frame(pool, base + path, {}, cache=None, offline=True)
+        finally:
+            await pool.close()
+
+    assert asyncio.run(run("/titanic.csv")).shape == (3, 3)
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(run("/wine.csv"))
+    assert not httpd.connections
+
+
+def test_slow_parser_holds_back_the_body():
+    body = b"a,b\n" + b"1,2\n" * 200_000
+    blocks = [body[i:i + 1000] for i in range(0, len(body), 1000)]
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        stream = _FeedStream(loop, max_blocks=4)
+        fed = 0
+
+        async def feed_all():
+            nonlocal fed
+            for block in blocks:
+                await stream.feed(block)
+                fed += 1
+            await stream.close_feed()
+
+        feeder = asyncio.ensure_future(feed_all())
+        await asyncio.sleep(0.2)  # no parser yet: the feeder must be waiting
+        assert fed <= 4
+        parsed = loop.run_in_executor(None, lambda: pd.read_csv(stream))
+        await feeder
+        return await parsed
+
+    assert asyncio.run(run()).shape == (200_000, 2)
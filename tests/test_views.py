@@ -0,0 +1,93 @@
+"""The feature/target split and projections must not copy the data."""
+
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from eda.views import feature_target_split, pack
+
+FEATURES = ["fixed_acidity", "volatile_acidity", "citric_acid", "residual_sugar", "chlorides", "alcohol"]
+
+
+@pytest.fixture
+def wine():
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame(rng.random((500, len(FEATURES))).round(3), columns=FEATURES)
+    frame["quality"] = rng.integers(3, 9, 500)
+    frame.loc[::17, "citric_acid"] = np.nan
+    # Through read_csv, as the script loads it (one block per column under pandas 3)
+    return pd.read_csv(io.StringIO(frame.to_csv(index=False)))
+
+
+@pytest.fixture
+def titanic():
+    return pd.DataFrame({
+        "Name": ["Braund", "Cumings", "Heikkinen", "Futrelle", "Allen"],
+        "Age": [22.0, 38.0, np.nan, 35.0, 35.0],
+        "Ticket": ["A/5 21171", "PC 17599", "STON/O2.", "113803", "373450"],
+        "Survived": [0, 1, 1, 1, 0],
+    })
+
+
+def test_split_shares_memory_with_frame(wine):
+    split = feature_target_split(wine, target="quality")
+
+    assert split.x.shape == (len(wine), len(FEATURES))
+    for name in FEATURES:
+        column = split.frame[name].to_numpy()
+        assert np.shares_memory(split.x, column)
+        assert np.shares_memory(split.block[name], column)
+    assert np.shares_memory(split.y, split.frame["quality"].to_numpy())
+    assert split.block.backs(split.frame)
+
+
+def test_projections_are_views(wine):
+    split = feature_target_split(wine, target="quality")
+    block = split.block
+
+    run = block.project(["citric_acid", "residual_sugar", "chlorides"])
+    strided = block.project(["fixed_acidity", "citric_acid", "chlorides"])
+    rest = block.without("fixed_acidity")
+    for view in (run, strided, rest):
+        assert view.base is not None
+        assert np.shares_memory(view, block.values)
+    np.testing.assert_array_equal(run, wine[["citric_acid", "residual_sugar", "chlorides"]].to_numpy())
+
+    with pytest.raises(ValueError):
+        block.project(["alcohol", "fixed_acidity"])
+    assert not np.shares_memory(block.project(["alcohol", "fixed_acidity"], copy=True), block.values)
+
+
+def test_in_place_write_reaches_block(wine):
+    split = feature_target_split(wine, target="quality")
+
+    split.frame.loc[0, "alcohol"] = 99.0
+    assert split.block["alcohol"][0] == 99.0
+    assert split.x[0, FEATURES.index("alcohol")] == 99.0
+    assert split.block.backs(split.frame)
+
+    split.frame["alcohol"] = split.frame["alcohol"] + 1  # a new column detaches
+    assert not split.block.backs(split.frame)
+    assert split.block["alcohol"][0] == 99.0
+
+
+def test_frame_is_unchanged_and_statistics_match(wine):
+    split = feature_target_split(wine, target="quality")
+
+    pd.testing.assert_frame_equal(split.frame, wine)
+    x = wine.drop("quality", axis=1)
+    pd.testing.assert_frame_equal(split.block.corr(), x.corr(), check_exact=False)
+    pd.testing.assert_frame_equal(split.block.describe(), x.describe(), check_exact=False)
+
+
+def test_titanic_projection_with_cast(titanic):
+    selected = titanic[["Name", "Age", "Ticket", "Survived"]]
+    frame, block = pack(selected, ["Age", "Survived"], cast=True)
+
+    assert np.shares_memory(frame["Age"].to_numpy(), block.values)
+    assert frame["Survived"].dtype == titanic["Survived"].dtype
+    pd.testing.assert_frame_equal(block.corr(), selected.select_dtypes(include="number").corr(), check_exact=False)
+    with pytest.raises(ValueError):
+        pack(selected, ["Age", "Survived"])